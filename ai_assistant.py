@@ -3,8 +3,8 @@ AI Assistant Module for Air Sial SMS v3.0
 Integrates with Google Gemini API for safety analysis
 """
 
+import time
 import streamlit as st
-import google.generativeai as genai
 from typing import Optional
 
 
@@ -24,6 +24,37 @@ class DataGeocoder:
         return locations.get(location, (30.0, 70.0))
 
 
+@st.cache_resource(show_spinner=False)
+def get_gemini_model(api_key: str, model_name: str = "gemini-pro"):
+    """Configured Gemini model handle, created once per key/model and shared across sessions"""
+    import google.generativeai as genai  # deferred: only needed once the assistant is used
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+AI_CACHE_TTL = 3600
+AI_CACHE_MAX_ENTRIES = 128
+
+
+def cached_generate(model, model_name: str, prompt: str) -> str:
+    """Memoise prompt -> response text so identical prompts on reruns skip the API call.
+
+    The memo lives in the user's session, not in a process-wide st.cache_data, because
+    prompts carry that user's report data and answers must not be served to other users.
+    """
+    cache = st.session_state.setdefault("_ai_response_cache", {})
+    key = (model_name, prompt)
+    hit = cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < AI_CACHE_TTL:
+        return hit[1]
+    text = model.generate_content(prompt).text
+    cache.pop(key, None)
+    if len(cache) >= AI_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]  # oldest entry first (dicts keep insertion order)
+    cache[key] = (time.monotonic(), text)
+    return text
+
+
 class SafetyAIAssistant:
     """AI Assistant for aviation safety analysis"""
     
@@ -33,8 +64,7 @@ class SafetyAIAssistant:
         self.model_name = "gemini-pro"
         
         try:
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel(self.model_name)
+            self.model = get_gemini_model(api_key, self.model_name)
             self.initialized = True
         except Exception as e:
             print(f"⚠️ AI initialization warning: {e}")
@@ -54,8 +84,7 @@ class SafetyAIAssistant:
             return self._mock_response(message)
         
         try:
-            response = self.model.generate_content(message)
-            return response.text
+            return cached_generate(self.model, self.model_name, message)
         except Exception as e:
             print(f"⚠️ AI API error: {e}")
             return self._mock_response(message)
@@ -2,63 +2,144 @@
 from ai_assistant import get_ai_assistant, DataGeocoder
 import base64
 import hashlib
+import heapq
+import importlib.util
 import io
 import json
+import logging
 import os
 import random
 import re
-import smtplib
+import secrets
 import time
 import uuid
 import ui_integration
+from bisect import bisect_right
 from collections import defaultdict
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta, date
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, date, time as dt_time
 from enum import Enum
-from typing import Optional, Dict, List, Any, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Optional, Dict, List, Any, NamedTuple, Tuple
+from zoneinfo import ZoneInfo
 from streamlit_mic_recorder import mic_recorder
 # Third-party imports
+import numpy as np
 import pandas as pd
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
-import google.generativeai as genai
-from plotly.subplots import make_subplots
 
 # --- ADD THIS ---
+import httpx
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
+
+# Bounded keep-alive pool shared by every Streamlit session; idle sockets are
+# recycled before Supabase's pooler drops them, connect failures retried 3x.
+SUPABASE_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=40)
+SUPABASE_TIMEOUT = 30
+SUPABASE_RETRIES = 3
+logger = logging.getLogger(__name__)
+_TRANSIENT_DB_ERRORS = (httpx.TransportError, ConnectionError)
 
 @st.cache_resource
 def init_supabase():
     url = st.secrets["SUPABASE_URL"]
     key = st.secrets["SUPABASE_KEY"]
-    return create_client(url, key)
+    opts = ClientOptions(postgrest_client_timeout=SUPABASE_TIMEOUT, storage_client_timeout=SUPABASE_TIMEOUT)
+    client = create_client(url, key, options=opts)
+    try:
+        # Swap the default PostgREST session for a pooled one with transport retries
+        session = client.postgrest.session
+        client.postgrest.session = httpx.Client(
+            base_url=session.base_url,
+            headers=session.headers,
+            timeout=SUPABASE_TIMEOUT,
+            transport=httpx.HTTPTransport(retries=SUPABASE_RETRIES, limits=SUPABASE_POOL_LIMITS),
+        )
+        session.close()
+    except Exception:
+        # keep the stock session if this supabase version lays things out differently;
+        # init_supabase is a cached resource, so this logs once per client build
+        logger.warning("Could not install the pooled PostgREST session; using the default one", exc_info=True)
+    return client
 
 supabase = init_supabase()
-# ----------------
 
-# Optional pydeck for geospatial mapping
-try:
-    import pydeck as pdk
-    PYDECK_AVAILABLE = True
-except ImportError:
-    pdk = None
-    PYDECK_AVAILABLE = False
+def reset_connection():
+    """Drop the cached client and build a fresh one (stale pool / dropped sockets)"""
+    global supabase
+    init_supabase.clear()
+    supabase = init_supabase()
+    return supabase
+
+def execute_with_reconnect(fn, retries: int = SUPABASE_RETRIES):
+    """Run fn(client); on transient network errors back off exponentially and retry on a fresh client"""
+    client = supabase
+    for attempt in range(retries):
+        try:
+            return fn(client)
+        except _TRANSIENT_DB_ERRORS:
+            if attempt == retries - 1:
+                raise
+            time.sleep(0.5 * 2 ** attempt)
+            client = reset_connection()
 
-# PDF generation
-try:
-    from reportlab.lib.colors import HexColor
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.pdfgen import canvas
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+@st.cache_resource
+def _db_executor():
+    """Worker pool for attachment uploads, shared across reruns and sessions"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="db-upload")
+
+def insert_queued(table: str, row: dict, wait_for=(), key: str = "submission_id"):
+    """Queue row for table and write the whole queue in one bulk upsert.
+
+    The write runs in the script thread, so a failure raises into the form's except
+    branch before any success feedback is shown. Rows from a failed write stay in
+    st.session_state['pending_<table>'] and go out with the next submission.
+    wait_for takes the row's upload futures (see upload_attachments); they are kept with the
+    queued row and re-checked on every write.
+    Rows are idempotent on key, a per-form UUID from _form_submission_id: resubmitting the
+    same form replaces its queued copy, and resending a batch that did land server-side
+    updates those rows instead of duplicating them.
+    """
+    pending = st.session_state.setdefault(f"pending_{table}", {})
+    pending[row[key]] = (row, tuple(wait_for))
+    # Re-check the uploads of every queued row, not only this one: a row whose
+    # attachments failed is dropped so a stored report never points at a missing object
+    failed = [k for k, (_, uploads) in pending.items() if any(u.exception() is not None for u in uploads)]
+    if failed:
+        refs = ", ".join(str(pending.pop(k)[0].get("report_number", k)) for k in failed)
+        raise RuntimeError(f"Attachment upload failed for {refs}; that report was not saved. Please submit it again.")
+    response = supabase.table(table).upsert([queued for queued, _ in pending.values()], on_conflict=key).execute()
+    get_db_report_counts.clear()  # the new rows show in the dashboard counters at once
+    pending.clear()
+    return response
+
+def upload_attachments(bucket: str, folder: str, files) -> tuple:
+    """Start parallel uploads of form attachments to Supabase Storage; returns (object paths, futures)
+
+    folder should be unique per submission (the reference plus submission_id).
+    """
+    if not files:
+        return [], []
+    storage = supabase.storage.from_(bucket)
+    # Index prefix keeps same-named files apart; upsert lets a resubmit overwrite its own objects
+    paths = [f"{folder}/{i}-{f.name}" for i, f in enumerate(files, 1)]
+    futures = [
+        _db_executor().submit(storage.upload, path, f.getvalue(),
+                              {"content-type": f.type or "application/octet-stream", "upsert": "true"})
+        for path, f in zip(paths, files)
+    ]
+    return paths, futures
+# ----------------
+
+# Optional pydeck for geospatial mapping and reportlab for PDF generation.
+# Only probe availability here; the heavy imports happen where they are used.
+PYDECK_AVAILABLE = importlib.util.find_spec("pydeck") is not None
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
 try:
     import ai_assistant  # <--- THIS IS THE MISSING LINK
 except ImportError as e:
@@ -164,14 +245,14 @@ class ReportType(Enum):
 # COMPREHENSIVE LOOKUP TABLES
 # ══════════════════════════════════════════════════════════════════════════════
 
-DEPARTMENTS = [
+DEPARTMENTS = (
     "Flight Operations",
     "Safety & Security",
     "Airport Services",
     "Engineering",
     "Quality Assurance",
     "Flight Services"
-]
+)
 
 AIRCRAFT_FLEET = {
     "AP-BMA": {"type": "ATR 72-600", "msn": "1234", "config": "70Y", "engines": "PW127M", "mtow": "23000"},
@@ -186,7 +267,7 @@ AIRCRAFT_FLEET = {
     "AP-BMJ": {"type": "A320neo", "msn": "8000", "config": "186Y", "engines": "PW1100G", "mtow": "79000"},
 }
 
-AIRCRAFT_TYPES_STRICT = ["A320", "A330"]
+AIRCRAFT_TYPES_STRICT = ("A320", "A330")
 
 ROLES = {
     "REPORTER": "Reporter",        # Submit only, View own confirmation
@@ -216,6 +297,23 @@ AIRPORTS = {
     "OKBK": {"name": "Kuwait International Airport", "city": "Kuwait City", "country": "Kuwait", "base": False, "icao": "OKBK", "iata": "KWI", "elevation": "206ft"},
 }
 
+# Column indexes over the reference data, built once instead of scanned per rerun
+AIRCRAFT_REGISTRATIONS = tuple(AIRCRAFT_FLEET)
+_AIRCRAFT_TYPE = {reg: ac.get("type", "") for reg, ac in AIRCRAFT_FLEET.items()}
+AIRPORT_CODES = tuple(AIRPORTS)
+_BASE_AIRPORTS = tuple(k for k, v in AIRPORTS.items() if v.get("base"))
+
+# Ready-made selectbox option lists
+FLEET_SELECT_OPTIONS = ("",) + AIRCRAFT_REGISTRATIONS
+_FLEET_SELECT_INDEX = {reg: i for i, reg in enumerate(FLEET_SELECT_OPTIONS)}
+AIRPORT_SELECT_OPTIONS = ("",) + tuple(f"{data['icao']} - {data['name']}" for data in AIRPORTS.values())
+AIRPORT_LOCATION_OPTIONS = AIRPORT_SELECT_OPTIONS + ("En-route", "Over water", "Other")
+_AIRPORT_ICAO_BY_LABEL = {f"{data['icao']} - {data['name']}": data['icao'] for data in AIRPORTS.values()}
+
+def airport_code(label: str) -> str:
+    """ICAO code for an AIRPORT_SELECT_OPTIONS label; free-text options pass through"""
+    return _AIRPORT_ICAO_BY_LABEL.get(label) or (label or '').partition(' - ')[0]
+
 RISK_COLORS = {
     "Extreme": "#8B0000", # Dark Red
     "High": "#CC5500",    # Dark Orange
@@ -223,15 +321,15 @@ RISK_COLORS = {
     "Low": "#006400"      # Dark Green
 }
 
-FLIGHT_PHASES = [
+FLIGHT_PHASES = (
     "Pre-flight / Ground Operations", "Taxi Out", "Takeoff Roll",
     "Initial Climb (0-1000ft AGL)", "Climb (1000-10000ft)",
     "Climb (Above 10000ft)", "Cruise", "Descent (Above 10000ft)",
     "Descent (10000ft-1000ft)", "Approach", "Final Approach",
     "Landing Roll", "Taxi In", "Post-flight / Parking", "Go-Around", "Holding"
-]
+)
 
-INCIDENT_CATEGORIES = [
+INCIDENT_CATEGORIES = (
     "Abnormal Runway Contact", "Aerodrome", "Air Traffic Management",
     "Aircraft Damage", "Cabin Safety Events", "Controlled Flight Into Terrain (CFIT)",
     "Collision / Near Collision", "De/Anti-icing Operations", "Depressurization",
@@ -242,49 +340,49 @@ INCIDENT_CATEGORIES = [
     "Other", "Runway Excursion", "Runway Incursion", "Security Related",
     "System / Component Failure", "Turbulence Encounter", "Undershoot / Overshoot",
     "Unruly Passenger", "Unstable Approach", "Weather", "Wildlife Strike", "Windshear / Microburst"
-]
+)
 
-HAZARD_CATEGORIES = [
+HAZARD_CATEGORIES = (
     "Aircraft Systems", "Airport Infrastructure", "ATC/Navigation", "Cabin Safety",
     "Cargo Handling", "Documentation/Procedures", "Environmental", "Equipment/Tools",
     "Fatigue/Human Factors", "Flight Operations", "Fuel Operations", "Ground Operations",
     "Maintenance", "Passenger Handling", "Ramp Safety", "Security", "Training",
     "Weather Related", "Wildlife/Bird Activity", "Other"
-]
+)
 
-BIRD_SPECIES = [
+BIRD_SPECIES = (
     "Unknown", "House Crow", "Jungle Crow", "Black Kite", "Brahminy Kite",
     "Pariah Kite", "Vulture (Egyptian)", "Vulture (Griffon)", "Pigeon / Rock Dove",
     "Myna", "Starling", "Sparrow", "Swift", "Swallow", "Egret", "Heron",
     "Lapwing", "Plover", "Sandpiper", "Owl", "Eagle", "Falcon", "Hawk",
     "Hoopoe", "Kingfisher", "Parakeet / Parrot", "Bat (Mammal)",
     "Multiple Species", "Unidentified Flock", "Other (Specify)"
-]
+)
 
-BIRD_SIZES = [
+BIRD_SIZES = (
     ("Small", "Sparrow-sized (< 100g)"),
     ("Medium-Small", "Starling-sized (100-500g)"),
     ("Medium", "Pigeon-sized (500-1000g)"),
     ("Medium-Large", "Crow-sized (1-2kg)"),
     ("Large", "Kite/Vulture-sized (2-5kg)"),
     ("Very Large", "Eagle-sized (> 5kg)")
-]
+)
 
-LASER_COLORS = [
+LASER_COLORS = (
     "Green (532nm)", "Red (630-670nm)", "Blue (445-488nm)", "Violet/Purple (405nm)",
     "Yellow/Amber (570-590nm)", "White (Multi-wavelength)", "Infrared (Not visible)",
     "Unknown/Could not determine", "Multiple Colors"
-]
+)
 
-LASER_INTENSITIES = [
+LASER_INTENSITIES = (
     ("1 - Low", "Barely visible, no visual effect"),
     ("2 - Moderate", "Visible but not distracting"),
     ("3 - Significant", "Distracting, caused momentary startle"),
     ("4 - High", "Bright, caused glare/flash blindness"),
     ("5 - Very High", "Extremely bright, caused disorientation/pain")
-]
+)
 
-TCAS_ALERT_TYPES = [
+TCAS_ALERT_TYPES = (
     "Traffic Advisory (TA) Only",
     "Resolution Advisory (RA) - Climb",
     "Resolution Advisory (RA) - Descend",
@@ -300,56 +398,85 @@ TCAS_ALERT_TYPES = [
     "Preventive RA - Don't Descend",
     "Multi-Aircraft Encounter",
     "Clear of Conflict"
-]
+)
+# TCAS risk: any RA is at least Medium, escalating as vertical separation drops below each band edge
+_TCAS_RA_ALERTS = frozenset(alert for alert in TCAS_ALERT_TYPES if "RA" in alert)
+_TCAS_RA_SEPARATION_BANDS = (300, 500)
+_TCAS_RA_RISK = ("Extreme", "High", "Medium")
 
-TCAS_EQUIPMENT_TYPES = ["TCAS I", "TCAS II (Version 6.04a)", "TCAS II (Version 7.0)", "TCAS II (Version 7.1)", "ACAS X (ADS-B based)", "Unknown/Not Determined"]
+TCAS_EQUIPMENT_TYPES = ("TCAS I", "TCAS II (Version 6.04a)", "TCAS II (Version 7.0)", "TCAS II (Version 7.1)", "ACAS X (ADS-B based)", "Unknown/Not Determined")
 
-WEATHER_CONDITIONS = [
+WEATHER_CONDITIONS = (
     "VMC - Clear", "VMC - Few Clouds", "VMC - Scattered", "VMC - Broken",
     "IMC - Overcast", "IMC - Low Visibility", "Rain - Light", "Rain - Moderate",
     "Rain - Heavy", "Thunderstorm Vicinity", "Thunderstorm", "Fog", "Mist",
     "Haze", "Dust/Sand", "Snow", "Icing Conditions", "Turbulence - Light",
     "Turbulence - Moderate", "Turbulence - Severe", "Windshear Reported",
     "Crosswind (Significant)", "Gusty Conditions"
-]
+)
 
-DAMAGE_LEVELS = [
+DAMAGE_LEVELS = (
     ("None", "No damage detected"),
     ("Minor", "Superficial damage, aircraft serviceable"),
     ("Moderate", "Damage requiring repair before next flight"),
     ("Major", "Significant structural damage"),
     ("Severe", "Extensive damage, aircraft AOG"),
     ("Destroyed", "Aircraft beyond economic repair")
-]
+)
 
-INJURY_CLASSIFICATIONS = [
+INJURY_CLASSIFICATIONS = (
     ("None", "No injuries"),
     ("Minor", "First aid treatment only"),
     ("Serious", "Hospitalization required < 48 hours"),
     ("Major", "Hospitalization > 48 hours, fractures, severe lacerations"),
     ("Fatal", "Death within 30 days of accident")
-]
+)
 
-CREW_POSITIONS = [
+CREW_POSITIONS = (
     "Captain (PIC)", "First Officer (SIC)", "Relief First Officer",
     "Check Captain", "TRI/TRE", "Line Training Captain",
     "Cabin Manager / Purser", "Senior Cabin Crew", "Cabin Crew",
     "Loadmaster", "Flight Engineer", "Observer"
-]
+)
+
+APPROACH_TYPES = ("ILS CAT I", "ILS CAT II", "ILS CAT III", "VOR/DME", "VOR", "NDB", "RNAV (GNSS)", "RNP AR", "Visual", "Circling", "LOC Only", "LDA", "SDF", "PAR", "ASR")
 
-APPROACH_TYPES = ["ILS CAT I", "ILS CAT II", "ILS CAT III", "VOR/DME", "VOR", "NDB", "RNAV (GNSS)", "RNP AR", "Visual", "Circling", "LOC Only", "LDA", "SDF", "PAR", "ASR"]
+RUNWAY_CONDITIONS = ("Dry", "Damp", "Wet", "Contaminated - Water", "Contaminated - Slush", "Contaminated - Snow (Dry)", "Contaminated - Snow (Compacted)", "Contaminated - Ice", "Contaminated - Frost", "Flooded")
 
-RUNWAY_CONDITIONS = ["Dry", "Damp", "Wet", "Contaminated - Water", "Contaminated - Slush", "Contaminated - Snow (Dry)", "Contaminated - Snow (Compacted)", "Contaminated - Ice", "Contaminated - Frost", "Flooded"]
+BRAKING_ACTIONS = ("Good", "Good to Medium", "Medium", "Medium to Poor", "Poor", "Nil")
 
-BRAKING_ACTIONS = ["Good", "Good to Medium", "Medium", "Medium to Poor", "Poor", "Nil"]
+TURBULENCE_INTENSITY = ("None", "Light", "Light Occasional", "Light Frequent", "Moderate", "Moderate Occasional", "Moderate Frequent", "Severe", "Severe Occasional", "Extreme")
 
-TURBULENCE_INTENSITY = ["None", "Light", "Light Occasional", "Light Frequent", "Moderate", "Moderate Occasional", "Moderate Frequent", "Severe", "Severe Occasional", "Extreme"]
+AIRCRAFT_PARTS_STRUCK = ("Radome", "Windshield", "Nose/Fuselage", "Engine #1", "Engine #2", "Propeller", "Wing Leading Edge", "Wing Trailing Edge", "Fuselage", "Landing Gear", "Tail/Empennage", "Lights", "Pitot/Static", "Other")
 
-AIRCRAFT_PARTS_STRUCK = ["Radome", "Windshield", "Nose/Fuselage", "Engine #1", "Engine #2", "Propeller", "Wing Leading Edge", "Wing Trailing Edge", "Fuselage", "Landing Gear", "Tail/Empennage", "Lights", "Pitot/Static", "Other"]
+EFFECT_ON_FLIGHT_OPTIONS = ("None - Flight continued normally", "Precautionary landing at destination", "Precautionary landing at alternate", "Return to departure airport", "Emergency landing", "Aborted takeoff", "Aborted approach / Go-around", "Other")
 
-EFFECT_ON_FLIGHT_OPTIONS = ["None - Flight continued normally", "Precautionary landing at destination", "Precautionary landing at alternate", "Return to departure airport", "Emergency landing", "Aborted takeoff", "Aborted approach / Go-around", "Other"]
+CREW_EFFECTS_LASER = ("Glare", "Flash Blindness", "Afterimage", "Eye Pain/Discomfort", "Eye Watering", "Disorientation", "Headache", "Temporary Vision Loss", "Startle/Distraction", "No Effect")
 
-CREW_EFFECTS_LASER = ["Glare", "Flash Blindness", "Afterimage", "Eye Pain/Discomfort", "Eye Watering", "Disorientation", "Headache", "Temporary Vision Loss", "Startle/Distraction", "No Effect"]
+# Key columns and key -> description maps, split once instead of per render
+_BIRD_SIZE_KEYS = tuple(k for k, _ in BIRD_SIZES)
+_BIRD_SIZE_DESC = dict(BIRD_SIZES)
+_DAMAGE_KEYS = tuple(k for k, _ in DAMAGE_LEVELS)
+_DAMAGE_DESC = dict(DAMAGE_LEVELS)
+_INJURY_KEYS = tuple(k for k, _ in INJURY_CLASSIFICATIONS)
+_INJURY_DESC = dict(INJURY_CLASSIFICATIONS)
+_LASER_INT_KEYS = tuple(k for k, _ in LASER_INTENSITIES)
+_LASER_INT_DESC = dict(LASER_INTENSITIES)
+
+# Option -> position maps for selectbox defaults (dict probe instead of list.index scans)
+_FLIGHT_PHASE_INDEX = {p: i for i, p in enumerate(FLIGHT_PHASES)}
+TIMES_OF_DAY = ("Dawn", "Day", "Dusk", "Night")
+_TIME_OF_DAY_INDEX = {t: i for i, t in enumerate(TIMES_OF_DAY)}
+_BIRD_SIZE_INDEX = {k: i for i, k in enumerate(_BIRD_SIZE_KEYS)}
+_DAMAGE_INDEX = {k: i for i, k in enumerate(_DAMAGE_KEYS)}
+_LASER_COLOR_INDEX = {c: i for i, c in enumerate(LASER_COLORS)}
+# BIRD_SPECIES already starts with "Unknown"; dict.fromkeys keeps it from appearing twice
+BIRD_SPECIES_OPTIONS = tuple(dict.fromkeys(("Unknown", *BIRD_SPECIES)))
+_BIRD_SPECIES_INDEX = {b: i for i, b in enumerate(BIRD_SPECIES_OPTIONS)}
+_EFFECT_ON_FLIGHT_INDEX = {e: i for i, e in enumerate(EFFECT_ON_FLIGHT_OPTIONS)}
+_TCAS_ALERT_INDEX = {t: i for i, t in enumerate(TCAS_ALERT_TYPES)}
+FINDING_STATUSES = ("Open", "In Progress", "Closed")
+_FINDING_STATUS_INDEX = {status: i for i, status in enumerate(FINDING_STATUSES)}
 
 EMAIL_CONTACTS = {
     "Safety Manager": "safety.manager@airsial.com",
@@ -391,7 +518,7 @@ RISK_MATRIX = {
     ("4", "A"): RiskLevel.EXTREME, ("4", "B"): RiskLevel.HIGH, ("4", "C"): RiskLevel.HIGH, ("4", "D"): RiskLevel.MEDIUM, ("4", "E"): RiskLevel.LOW,
     ("3", "A"): RiskLevel.HIGH, ("3", "B"): RiskLevel.HIGH, ("3", "C"): RiskLevel.MEDIUM, ("3", "D"): RiskLevel.MEDIUM, ("3", "E"): RiskLevel.LOW,
     ("2", "A"): RiskLevel.HIGH, ("2", "B"): RiskLevel.MEDIUM, ("2", "C"): RiskLevel.MEDIUM, ("2", "D"): RiskLevel.LOW, ("2", "E"): RiskLevel.LOW,
-    ("1", "A"): RiskLevel.MEDIUM, ("1", "B"): RiskLevel.MEDIUM, ("1", "C"): RiskLevel.LOW, ("1", "D"): RiskLevel.LOW, ("1", "E"): RiskLevel.LOW,
+    ("1", "A"): RiskLevel.MEDIUM, ("1", "B"): RiskLevel.LOW, ("1", "C"): RiskLevel.LOW, ("1", "D"): RiskLevel.LOW, ("1", "E"): RiskLevel.LOW,
 }
 
 RISK_ACTIONS = {
@@ -400,11 +527,41 @@ RISK_ACTIONS = {
     RiskLevel.MEDIUM: {"action": "CORRECTIVE ACTION REQUIRED", "description": "Management responsibility.", "color": "#FFC107", "timeline": "Within 15 days", "authority": "Department Manager"},
     RiskLevel.LOW: {"action": "MONITOR AND REVIEW", "description": "Accept risk with monitoring.", "color": "#28A745", "timeline": "Next scheduled review", "authority": "Safety Officer"}
 }
+
+class RiskInfo(NamedTuple):
+    action: str
+    description: str
+    color: str
+    timeline: str
+    authority: str
+
+# One enum-keyed lookup per render instead of a dict-of-dicts plus a key lookup per field
+_RISK_INFO = {level: RiskInfo(**info) for level, info in RISK_ACTIONS.items()}
+
+# RISK_MATRIX compiled to a 5x5 int8 table: row = likelihood - 1, column = severity A-E
+_RISK_LEVEL_BY_CODE = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.EXTREME)
+_RISK_LEVEL_VALUES = tuple(level.value for level in _RISK_LEVEL_BY_CODE)
+_RISK_LOOKUP = np.array(
+    [[_RISK_LEVEL_BY_CODE.index(RISK_MATRIX[(str(l), s)]) for s in "ABCDE"] for l in range(1, 6)],
+    dtype=np.int8,
+)
+_SEVERITY_COL = {**{s: i for i, s in enumerate("ABCDE")}, **{s: i for i, s in enumerate("abcde")}}
+
+# Reference tables are read-only from here on; an accidental write raises instead of
+# silently changing the data every session sees
+AIRCRAFT_FLEET = MappingProxyType(AIRCRAFT_FLEET)
+AIRPORTS = MappingProxyType(AIRPORTS)
+EMAIL_CONTACTS = MappingProxyType(EMAIL_CONTACTS)
+LIKELIHOOD_SCALE = MappingProxyType(LIKELIHOOD_SCALE)
+SEVERITY_SCALE = MappingProxyType(SEVERITY_SCALE)
+RISK_MATRIX = MappingProxyType(RISK_MATRIX)
+RISK_ACTIONS = MappingProxyType(RISK_ACTIONS)
+
 # ══════════════════════════════════════════════════════════════════════════════
 # DATA CLASSES AND HELPER FUNCTIONS
 # ══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(frozen=True)
 class SLAStatus:
     days_remaining: int
     status: str
@@ -412,68 +569,120 @@ class SLAStatus:
     text: str
     percentage: float
 
+REPORT_NUMBER_PREFIXES = {
+    ReportType.AIRCRAFT_INCIDENT: "INC", ReportType.BIRD_STRIKE: "BRD", ReportType.LASER_STRIKE: "LSR",
+    ReportType.TCAS_REPORT: "TCS", ReportType.HAZARD_REPORT: "HZD", ReportType.FSR: "FSR", ReportType.CAPTAIN_DBR: "DBR"
+}
+
 def generate_report_number(report_type: ReportType, department: str = "") -> str:
-    prefix_map = {
-        ReportType.AIRCRAFT_INCIDENT: "INC", ReportType.BIRD_STRIKE: "BRD", ReportType.LASER_STRIKE: "LSR",
-        ReportType.TCAS_REPORT: "TCS", ReportType.HAZARD_REPORT: "HZD", ReportType.FSR: "FSR", ReportType.CAPTAIN_DBR: "DBR"
-    }
-    prefix = prefix_map.get(report_type, "RPT")
-    date_str = datetime.now().strftime("%Y%m%d")
-    unique_id = str(uuid.uuid4())[:6].upper()
-    return f"{prefix}-{date_str}-{unique_id}"
+    prefix = REPORT_NUMBER_PREFIXES.get(report_type, "RPT")
+    return f"{prefix}-{date.today():%Y%m%d}-{secrets.token_hex(3).upper()}"
+
+def _new_ref(prefix: str) -> str:
+    """Short on-screen reference (PREFIX-YYYYMMDD-NNN) shown on the forms."""
+    return f"{prefix}-{datetime.now():%Y%m%d}-{random.randint(100, 999)}"
+
+def _form_ref(prefix: str) -> str:
+    """Reference for the form being filled in; stays put across reruns until the key is popped on submit"""
+    key = f"form_ref_{prefix}"
+    if key not in st.session_state:
+        st.session_state[key] = _new_ref(prefix)
+    return st.session_state[key]
+
+def _form_submission_id(prefix: str) -> str:
+    """Idempotency key (UUID) for the form being filled in; resubmits after a failure reuse it"""
+    key = f"form_submission_{prefix}"
+    if key not in st.session_state:
+        st.session_state[key] = str(uuid.uuid4())
+    return st.session_state[key]
+
+def _release_form_ref(prefix: str):
+    """Forget the form's reference and submission id so the next report gets fresh ones"""
+    st.session_state.pop(f"form_ref_{prefix}", None)
+    st.session_state.pop(f"form_submission_{prefix}", None)
 
-def calculate_risk_level(likelihood: int, severity: str) -> RiskLevel:
-    key = (str(likelihood), severity.upper())
-    return RISK_MATRIX.get(key, RiskLevel.LOW)
+def calculate_risk_level(likelihood: int, severity: str) -> str:
+    """Calculate risk level from ICAO 5x5 matrix"""
+    col = _SEVERITY_COL.get(severity)
+    try: row = int(likelihood) - 1
+    except (TypeError, ValueError): return RiskLevel.MEDIUM.value
+    if col is None or not 0 <= row < 5: return RiskLevel.MEDIUM.value
+    return _RISK_LEVEL_VALUES[_RISK_LOOKUP[row, col]]
 
-def calculate_sla_status(created_date, sla_days: int) -> SLAStatus:
-    if isinstance(created_date, str):
-        try: created_date = datetime.strptime(created_date[:10], "%Y-%m-%d").date()
-        except: created_date = date.today()
-    elif isinstance(created_date, datetime):
-        created_date = created_date.date()
+@lru_cache(maxsize=4096)
+def _sla_from_iso(iso_prefix: str, sla_days: int, today_ordinal: int) -> tuple:
+    """Pure SLA computation; today_ordinal is part of the key so entries roll over at midnight"""
+    try: created_date = date.fromisoformat(iso_prefix)
+    except ValueError: created_date = date.fromordinal(today_ordinal)
     
-    deadline = created_date + timedelta(days=sla_days)
-    today = date.today()
-    days_remaining = (deadline - today).days
+    days_remaining = created_date.toordinal() + sla_days - today_ordinal
     
     if days_remaining < 0:
-        return SLAStatus(days_remaining, "overdue", "#DC3545", f"OVERDUE by {abs(days_remaining)} days", 100)
+        return (days_remaining, "overdue", "#DC3545", f"OVERDUE by {abs(days_remaining)} days", 100)
     elif days_remaining <= Config.SLA_CRITICAL_DAYS:
-        return SLAStatus(days_remaining, "critical", "#DC3545", f"{days_remaining} days - CRITICAL", min(100, ((sla_days - days_remaining) / sla_days) * 100))
+        return (days_remaining, "critical", "#DC3545", f"{days_remaining} days - CRITICAL", min(100, ((sla_days - days_remaining) / sla_days) * 100))
     elif days_remaining <= Config.SLA_WARNING_DAYS:
-        return SLAStatus(days_remaining, "warning", "#FFC107", f"{days_remaining} days remaining", ((sla_days - days_remaining) / sla_days) * 100)
+        return (days_remaining, "warning", "#FFC107", f"{days_remaining} days remaining", ((sla_days - days_remaining) / sla_days) * 100)
     else:
-        return SLAStatus(days_remaining, "ok", "#28A745", f"{days_remaining} days remaining", ((sla_days - days_remaining) / sla_days) * 100)
+        return (days_remaining, "ok", "#28A745", f"{days_remaining} days remaining", ((sla_days - days_remaining) / sla_days) * 100)
+
+def calculate_sla_status(created_date, sla_days: int) -> SLAStatus:
+    if isinstance(created_date, str):
+        iso_prefix = created_date[:10]
+    elif isinstance(created_date, datetime):
+        iso_prefix = created_date.date().isoformat()
+    else:
+        iso_prefix = created_date.isoformat()
+    return SLAStatus(*_sla_from_iso(iso_prefix, sla_days, date.today().toordinal()))
 
 def hash_password(password: str) -> str:
     return hashlib.sha256(password.encode()).hexdigest()
 
+_PK_TZ = ZoneInfo(Config.TIMEZONE)
+_FMT_FULL = "%d-%b-%Y %H:%M"
+_FMT_DATE = "%d-%b-%Y"
+
 def get_pakistan_time() -> datetime:
-    return datetime.utcnow() + timedelta(hours=Config.UTC_OFFSET)
+    return datetime.now(_PK_TZ)
 
 def format_datetime(dt: datetime, include_time: bool = True) -> str:
-    if include_time: return dt.strftime("%d-%b-%Y %H:%M")
-    return dt.strftime("%d-%b-%Y")
+    return dt.strftime(_FMT_FULL if include_time else _FMT_DATE)
 
+@lru_cache(maxsize=512)
 def get_airport_name(icao: str) -> str:
     if icao == "N/A": return "N/A"
-    airport = AIRPORTS.get(icao.upper())
+    airport = AIRPORTS.get(icao if icao.isupper() else icao.upper())
     return f"{airport['city']} ({icao})" if airport else icao
 
 def get_aircraft_info(registration: str) -> dict:
-    return AIRCRAFT_FLEET.get(registration.upper(), {"type": "Unknown", "msn": "N/A", "config": "N/A", "engines": "N/A", "mtow": "N/A"})
+    info = AIRCRAFT_FLEET.get(registration if registration.isupper() else registration.upper())
+    return info if info is not None else {"type": "Unknown", "msn": "N/A", "config": "N/A", "engines": "N/A", "mtow": "N/A"}
 
 # ══════════════════════════════════════════════════════════════════════════════
 # DYNAMIC STATISTICS FROM SESSION STATE - NO MOCK DATA
 # ══════════════════════════════════════════════════════════════════════════════
 
-# --- REPLACEMENT CODE ---
-
-# REPLACE THE FUNCTION AT LINE 465 WITH THIS:
-
-def get_report_counts() -> dict:
-    """Get counts directly from session state (Dynamic - No Cache)"""
+def get_reports_version() -> int:
+    """Monotonic counter bumped whenever a report list in session state changes"""
+    return st.session_state.setdefault('reports_version', 0)
+
+def bump_reports_version():
+    st.session_state['reports_version'] = get_reports_version() + 1
+    get_db_report_counts.clear()  # a new report should show on the dashboard without waiting out the TTL
+
+def _memo_by_reports_version(name: str, compute):
+    """Session-scoped memo: recompute only after reports_version changes.
+    Kept in session state (not st.cache_data) because the report lists are per-session."""
+    version = get_reports_version()
+    memo = st.session_state.setdefault('_report_stats_memo', {})
+    cached = memo.get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    value = compute()
+    memo[name] = (version, value)
+    return value
+
+def _compute_report_counts() -> dict:
     return {
         'bird_strikes': len(st.session_state.get('bird_strikes', [])),
         'laser_strikes': len(st.session_state.get('laser_strikes', [])),
@@ -483,243 +692,282 @@ def get_report_counts() -> dict:
         'fsr_reports': len(st.session_state.get('fsr_reports', [])),
         'captain_dbr': len(st.session_state.get('captain_dbr', [])),
     }
-    for table in tables:
-        try:
-            # 'head=True' ensures we only get the count, not the actual data rows (faster)
-            response = supabase.table(table).select("*", count="exact", head=True).execute()
-            counts[table] = response.count
-        except Exception as e:
-            # If the table doesn't exist yet or connection fails, default to 0
-            counts[table] = 0
-            
-    return counts
-# ------------------------
+
+def get_report_counts() -> dict:
+    """Get counts from session state, memoised until the next report mutation"""
+    return _memo_by_reports_version('report_counts', _compute_report_counts)
+
+REPORT_TABLES = ('bird_strikes', 'laser_strikes', 'tcas_reports', 'hazard_reports', 'aircraft_incidents', 'fsr_reports', 'captain_dbr')
+
+# Dashboard counts are a nice-to-have read: one short attempt, no retries, no reconnects
+REPORT_COUNT_TIMEOUT = 3
+
+@st.cache_resource
+def _init_count_client():
+    """Separate client with a short timeout and the stock (non-retrying) session, for count reads only"""
+    opts = ClientOptions(postgrest_client_timeout=REPORT_COUNT_TIMEOUT)
+    return create_client(st.secrets["SUPABASE_URL"], st.secrets["SUPABASE_KEY"], options=opts)
+
+def _count_table(db, table: str) -> int:
+    try:
+        # 'head=True' ensures we only get the count, not the actual data rows
+        return db.table(table).select("*", count="exact", head=True).execute().count or 0
+    except Exception:
+        # If the table doesn't exist yet or connection fails, default to 0
+        return 0
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_db_report_counts() -> dict:
+    """Report counts straight from Supabase in one RPC (see DATABASE_API_INTEGRATION.md).
+    Falls back to concurrent HEAD counts if the report_counts() function is not deployed,
+    and to zeros at once if the database is unreachable, so the dashboard never waits on it."""
+    zeros = dict.fromkeys(REPORT_TABLES, 0)
+    db = _init_count_client()
+    try:
+        data = db.rpc('report_counts').execute().data
+        if isinstance(data, dict):
+            return {table: int(data.get(table) or 0) for table in REPORT_TABLES}
+    except httpx.TransportError:
+        return zeros  # timed out / unreachable: HEAD counts would only time out too
+    except Exception:
+        pass
+    with ThreadPoolExecutor(max_workers=len(REPORT_TABLES)) as pool:
+        return dict(zip(REPORT_TABLES, pool.map(lambda table: _count_table(db, table), REPORT_TABLES)))
 
 def get_total_reports() -> int:
     return sum(get_report_counts().values())
 
+_OPEN_STATUSES = frozenset({'Draft', 'Submitted', 'Under Review', 'Assigned to Investigator', 'Investigation In Progress', 'Awaiting Reply'})
+_CLOSED_STATUSES = frozenset({'Investigation Complete', 'Closed'})
+_HIGH_RISK = frozenset({'High', 'Extreme'})
+REPORT_LISTS = ('bird_strikes', 'laser_strikes', 'tcas_reports', 'hazard_reports', 'aircraft_incidents')
+
+_REPORT_FRAME_COLUMNS = ('type', 'status', 'risk_level', 'reporter_department', 'created_at')
+_DEFAULT_RISK = {'hazard_reports': 'Low', 'aircraft_incidents': 'Medium'}
+_RISK_ORDER = ["Extreme", "High", "Medium", "Low"]
+
+def _compute_reports_frame() -> pd.DataFrame:
+    """Column-oriented view of every report list, rebuilt only after a report mutation"""
+    rows = [
+        (report_type, r.get('investigation_status', 'Draft'), r.get('risk_level', _DEFAULT_RISK.get(report_type)),
+         r.get('reporter_department', 'Unknown'), r.get('created_at'))
+        for report_type in REPORT_LISTS
+        for r in st.session_state.get(report_type, [])
+    ]
+    df = pd.DataFrame.from_records(rows, columns=_REPORT_FRAME_COLUMNS)
+    return df.astype({'type': 'category', 'status': 'category'})
+
+def get_reports_frame() -> pd.DataFrame:
+    return _memo_by_reports_version('reports_frame', _compute_reports_frame)
+
+def _compute_report_stats() -> dict:
+    """Aggregate the report frame once, feeding every status/risk/department accessor"""
+    df = get_reports_frame()
+    risk_rows = df['type'].isin(_DEFAULT_RISK)
+    distribution = df.loc[risk_rows, 'risk_level'].value_counts().reindex(_RISK_ORDER, fill_value=0)
+    hazards = df['type'] == 'hazard_reports'
+    return {
+        'open': int(df['status'].isin(_OPEN_STATUSES).sum()),
+        'closed': int(df['status'].isin(_CLOSED_STATUSES).sum()),
+        'high_risk': int(distribution[list(_HIGH_RISK)].sum()),
+        'risk_distribution': {level: int(n) for level, n in distribution.items()},
+        'by_department': {dept: int(n) for dept, n in df.loc[hazards, 'reporter_department'].value_counts(dropna=False).items()},
+    }
+
+def _report_stats() -> dict:
+    return _memo_by_reports_version('report_stats', _compute_report_stats)
+
 def get_risk_distribution() -> dict:
-    distribution = {"Extreme": 0, "High": 0, "Medium": 0, "Low": 0}
-    for hazard in st.session_state.get('hazard_reports', []):
-        risk = hazard.get('risk_level', 'Low')
-        if risk in distribution: distribution[risk] += 1
-    for incident in st.session_state.get('aircraft_incidents', []):
-        risk = incident.get('risk_level', 'Medium')
-        if risk in distribution: distribution[risk] += 1
-    return distribution
+    return _report_stats()['risk_distribution']
 
 def get_open_investigations() -> int:
-    open_count = 0
-    open_statuses = ['Draft', 'Submitted', 'Under Review', 'Assigned to Investigator', 'Investigation In Progress', 'Awaiting Reply']
-    for report_type in ['bird_strikes', 'laser_strikes', 'tcas_reports', 'hazard_reports', 'aircraft_incidents']:
-        for report in st.session_state.get(report_type, []):
-            if report.get('investigation_status', 'Draft') in open_statuses:
-                open_count += 1
-    return open_count
+    return _report_stats()['open']
 
 def get_closed_investigations() -> int:
-    closed_count = 0
-    closed_statuses = ['Investigation Complete', 'Closed']
-    for report_type in ['bird_strikes', 'laser_strikes', 'tcas_reports', 'hazard_reports', 'aircraft_incidents']:
-        for report in st.session_state.get(report_type, []):
-            if report.get('investigation_status', '') in closed_statuses:
-                closed_count += 1
-    return closed_count
+    return _report_stats()['closed']
 
 def get_high_risk_count() -> int:
-    high_risk = 0
-    for hazard in st.session_state.get('hazard_reports', []):
-        if hazard.get('risk_level', '') in ['High', 'Extreme']: high_risk += 1
-    for incident in st.session_state.get('aircraft_incidents', []):
-        if incident.get('risk_level', '') in ['High', 'Extreme']: high_risk += 1
-    return high_risk
+    return _report_stats()['high_risk']
 
-def get_sla_alerts() -> dict:
+def _compute_sla_alerts() -> dict:
     alerts = {'overdue': 0, 'critical': 0, 'warning': 0, 'ok': 0}
     for hazard in st.session_state.get('hazard_reports', []):
-        if hazard.get('investigation_status') not in ['Closed', 'Investigation Complete']:
+        if hazard.get('investigation_status') not in _CLOSED_STATUSES:
             sla = calculate_sla_status(hazard.get('created_at', str(date.today())), Config.HAZARD_SLA_DAYS)
             alerts[sla.status] += 1
     return alerts
 
+def get_sla_alerts() -> dict:
+    # Buckets depend on today's date, so the memo entry rolls over at midnight too
+    return _memo_by_reports_version(f"sla_alerts:{date.today()}", _compute_sla_alerts)
+
 def get_reports_by_department() -> dict:
-    dept_counts = {}
-    for hazard in st.session_state.get('hazard_reports', []):
-        dept = hazard.get('reporter_department', 'Unknown')
-        dept_counts[dept] = dept_counts.get(dept, 0) + 1
-    return dept_counts
+    return _report_stats()['by_department']
 
-def get_recent_reports(limit: int = 5) -> list:
-    all_reports = []
-    type_icons = {'bird_strikes': '🐦', 'laser_strikes': '🔴', 'tcas_reports': '📡', 'hazard_reports': '⚠️', 'aircraft_incidents': '🚨', 'fsr_reports': '📋', 'captain_dbr': '👨‍✈️'}
-    for report_type, reports in [
-        ('bird_strikes', st.session_state.get('bird_strikes', [])),
-        ('laser_strikes', st.session_state.get('laser_strikes', [])),
-        ('tcas_reports', st.session_state.get('tcas_reports', [])),
-        ('hazard_reports', st.session_state.get('hazard_reports', [])),
-        ('aircraft_incidents', st.session_state.get('aircraft_incidents', [])),
-        ('fsr_reports', st.session_state.get('fsr_reports', [])),
-        ('captain_dbr', st.session_state.get('captain_dbr', []))
-    ]:
-        for report in reports:
-            all_reports.append({
-                'type': report_type, 'icon': type_icons.get(report_type, '📋'),
-                'number': report.get('report_number', 'N/A'), 'date': report.get('created_at', str(datetime.now())),
+_REPORT_TYPE_ICONS = {'bird_strikes': '🐦', 'laser_strikes': '🔴', 'tcas_reports': '📡', 'hazard_reports': '⚠️', 'aircraft_incidents': '🚨', 'fsr_reports': '📋', 'captain_dbr': '👨‍✈️'}
+
+def _iter_report_summaries():
+    now = str(datetime.now())
+    for report_type in REPORT_TABLES:
+        icon = _REPORT_TYPE_ICONS.get(report_type, '📋')
+        for report in st.session_state.get(report_type, []):
+            yield {
+                'type': report_type, 'icon': icon,
+                'number': report.get('report_number', 'N/A'), 'date': report.get('created_at', now),
                 'status': report.get('investigation_status', 'Draft'), 'title': report.get('hazard_title', report.get('flight_number', 'N/A'))
-            })
-    all_reports.sort(key=lambda x: x['date'], reverse=True)
-    return all_reports[:limit]
+            }
+
+def get_recent_reports(limit: int = 5) -> list:
+    # created_at is ISO-8601, so string order is chronological
+    return heapq.nlargest(limit, _iter_report_summaries(), key=itemgetter('date'))
 
 # ══════════════════════════════════════════════════════════════════════════════
 # OCR SIMULATION ENGINE
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Precomputed choice pools for the OCR simulation; one RNG seeded once per process
+_ocr_rng = random.Random()
+_rb = _ocr_rng.getrandbits  # coin flips: bool(_rb(1))
+_FLIGHT_PHASES_8 = tuple(FLIGHT_PHASES[:8])
+
+def _ocr_flight_fields(days_back: int = 7, hour_lo: int = 6, hour_hi: int = 22) -> dict:
+    """Flight identification fields shared by every flight-based OCR form"""
+    departure, arrival = _ocr_rng.choices(AIRPORT_CODES, k=2)  # one draw for both route ends
+    return {
+        "flight_number": f"PF-{_ocr_rng.randint(100, 999)}",
+        "aircraft_reg": _ocr_rng.choice(AIRCRAFT_REGISTRATIONS),
+        "incident_date": (date.today() - timedelta(days=_ocr_rng.randint(0, days_back))).isoformat(),
+        "incident_time": f"{_ocr_rng.randint(hour_lo, hour_hi):02d}:{_ocr_rng.randint(0, 59):02d}",
+        "departure_airport": departure,
+        "arrival_airport": arrival,
+    }
+
 def simulate_ocr_extraction(file_type: str, form_type: str) -> dict:
-    random.seed(int(time.time()))
-    flight_numbers = [f"PF-{random.randint(100, 999)}" for _ in range(5)]
-    aircraft_regs = list(AIRCRAFT_FLEET.keys())
-    
     if form_type == "bird_strike":
-        return {
-            "flight_number": random.choice(flight_numbers),
-            "aircraft_reg": random.choice(aircraft_regs),
-            "incident_date": (date.today() - timedelta(days=random.randint(0, 7))).isoformat(),
-            "incident_time": f"{random.randint(5, 22):02d}:{random.randint(0, 59):02d}",
-            "departure_airport": random.choice(list(AIRPORTS.keys())),
-            "arrival_airport": random.choice(list(AIRPORTS.keys())),
-            "flight_phase": random.choice(FLIGHT_PHASES[:8]),
-            "altitude_agl": random.randint(0, 3000),
-            "altitude_msl": random.randint(500, 5000),
-            "indicated_speed": random.randint(120, 280),
-            "bird_species": random.choice(BIRD_SPECIES[:15]),
-            "bird_size": random.choice([s[0] for s in BIRD_SIZES]),
-            "number_seen": random.randint(1, 20),
-            "number_struck": random.randint(1, 5),
-            "parts_struck": random.sample(AIRCRAFT_PARTS_STRUCK, random.randint(1, 3)),
-            "damage_level": random.choice([d[0] for d in DAMAGE_LEVELS[:4]]),
-            "effect_on_flight": random.choice(EFFECT_ON_FLIGHT_OPTIONS[:4]),
-            "weather_conditions": random.choice(WEATHER_CONDITIONS[:8]),
-            "pilot_warned": random.choice(["Yes - ATIS", "Yes - ATC", "No Warning"]),
-            "captain_name": f"Capt. {random.choice(['Ahmed', 'Khan', 'Ali', 'Hassan'])} {random.choice(['Shah', 'Iqbal', 'Raza'])}",
-            "captain_license": f"ATPL-PK-{random.randint(1000, 9999)}",
-            "fo_name": f"FO {random.choice(['Usman', 'Bilal', 'Fahad'])} {random.choice(['Khan', 'Ahmed'])}",
-            "narrative": f"Bird strike during {random.choice(['approach', 'departure', 'climb'])} phase.",
-            "atc_notified": random.choice([True, False]),
-            "remains_collected": random.choice(["Yes - Sent for ID", "No - No remains", "Yes - Retained"])
+        return _ocr_flight_fields(days_back=7, hour_lo=5, hour_hi=22) | {
+            "flight_phase": _ocr_rng.choice(_FLIGHT_PHASES_8),
+            "altitude_agl": _ocr_rng.randint(0, 3000),
+            "altitude_msl": _ocr_rng.randint(500, 5000),
+            "indicated_speed": _ocr_rng.randint(120, 280),
+            "bird_species": _ocr_rng.choice(BIRD_SPECIES[:15]),
+            "bird_size": _ocr_rng.choice(_BIRD_SIZE_KEYS),
+            "number_seen": _ocr_rng.randint(1, 20),
+            "number_struck": _ocr_rng.randint(1, 5),
+            "parts_struck": _ocr_rng.sample(AIRCRAFT_PARTS_STRUCK, _ocr_rng.randint(1, 3)),
+            "damage_level": _ocr_rng.choice(_DAMAGE_KEYS[:4]),
+            "effect_on_flight": _ocr_rng.choice(EFFECT_ON_FLIGHT_OPTIONS[:4]),
+            "weather_conditions": _ocr_rng.choice(WEATHER_CONDITIONS[:8]),
+            "pilot_warned": _ocr_rng.choice(("Yes - ATIS", "Yes - ATC", "No Warning")),
+            "captain_name": f"Capt. {_ocr_rng.choice(('Ahmed', 'Khan', 'Ali', 'Hassan'))} {_ocr_rng.choice(('Shah', 'Iqbal', 'Raza'))}",
+            "captain_license": f"ATPL-PK-{_ocr_rng.randint(1000, 9999)}",
+            "fo_name": f"FO {_ocr_rng.choice(('Usman', 'Bilal', 'Fahad'))} {_ocr_rng.choice(('Khan', 'Ahmed'))}",
+            "narrative": f"Bird strike during {_ocr_rng.choice(('approach', 'departure', 'climb'))} phase.",
+            "atc_notified": bool(_rb(1)),
+            "remains_collected": _ocr_rng.choice(("Yes - Sent for ID", "No - No remains", "Yes - Retained"))
         }
     elif form_type == "laser_strike":
-        return {
-            "flight_number": random.choice(flight_numbers),
-            "aircraft_reg": random.choice(aircraft_regs),
-            "incident_date": (date.today() - timedelta(days=random.randint(0, 7))).isoformat(),
-            "incident_time": f"{random.randint(18, 23):02d}:{random.randint(0, 59):02d}",
-            "departure_airport": random.choice(list(AIRPORTS.keys())),
-            "arrival_airport": random.choice(list(AIRPORTS.keys())),
-            "location_description": f"{random.randint(2, 15)}nm {random.choice(['final', 'initial approach'])} RWY {random.choice(['09', '27', '36'])}{random.choice(['L', 'R', ''])}",
-            "altitude_feet": random.randint(1500, 8000),
-            "flight_phase": random.choice(["Approach", "Final Approach", "Initial Climb", "Descent"]),
-            "laser_color": random.choice(LASER_COLORS[:5]),
-            "laser_intensity": random.choice([l[0] for l in LASER_INTENSITIES]),
-            "duration_seconds": random.randint(2, 30),
-            "beam_movement": random.choice(["Tracking aircraft", "Stationary", "Sweeping"]),
-            "crew_effects": random.sample(CREW_EFFECTS_LASER[:6], random.randint(1, 3)),
-            "captain_affected": random.choice([True, False]),
-            "fo_affected": random.choice([True, False]),
-            "flash_blindness": random.choice([True, False]),
-            "afterimage": random.choice([True, False]),
-            "medical_attention": random.choice(["No - Not required", "Yes - Precautionary exam"]),
-            "effect_on_flight": random.choice(["None - Flight continued", "Minor - Brief distraction", "Go-around performed"]),
+        return _ocr_flight_fields(days_back=7, hour_lo=18, hour_hi=23) | {
+            "location_description": f"{_ocr_rng.randint(2, 15)}nm {_ocr_rng.choice(('final', 'initial approach'))} RWY {_ocr_rng.choice(('09', '27', '36'))}{_ocr_rng.choice(('L', 'R', ''))}",
+            "altitude_feet": _ocr_rng.randint(1500, 8000),
+            "flight_phase": _ocr_rng.choice(("Approach", "Final Approach", "Initial Climb", "Descent")),
+            "laser_color": _ocr_rng.choice(LASER_COLORS[:5]),
+            "laser_intensity": _ocr_rng.choice(_LASER_INT_KEYS),
+            "duration_seconds": _ocr_rng.randint(2, 30),
+            "beam_movement": _ocr_rng.choice(("Tracking aircraft", "Stationary", "Sweeping")),
+            "crew_effects": _ocr_rng.sample(CREW_EFFECTS_LASER[:6], _ocr_rng.randint(1, 3)),
+            "captain_affected": bool(_rb(1)),
+            "fo_affected": bool(_rb(1)),
+            "flash_blindness": bool(_rb(1)),
+            "afterimage": bool(_rb(1)),
+            "medical_attention": _ocr_rng.choice(("No - Not required", "Yes - Precautionary exam")),
+            "effect_on_flight": _ocr_rng.choice(("None - Flight continued", "Minor - Brief distraction", "Go-around performed")),
             "atc_notified": True,
-            "police_notified": random.choice([True, False]),
-            "narrative": f"Laser illumination during {random.choice(['approach', 'final approach'])}."
+            "police_notified": bool(_rb(1)),
+            "narrative": f"Laser illumination during {_ocr_rng.choice(('approach', 'final approach'))}."
         }
     elif form_type == "tcas_report":
-        return {
-            "flight_number": random.choice(flight_numbers),
-            "aircraft_reg": random.choice(aircraft_regs),
-            "incident_date": (date.today() - timedelta(days=random.randint(0, 7))).isoformat(),
-            "incident_time": f"{random.randint(6, 22):02d}:{random.randint(0, 59):02d}",
-            "departure_airport": random.choice(list(AIRPORTS.keys())),
-            "arrival_airport": random.choice(list(AIRPORTS.keys())),
-            "position": f"{random.choice(list(AIRPORTS.keys()))} VOR {random.randint(0, 360):03d}/{random.randint(5, 50)}",
-            "altitude_feet": random.randint(10000, 35000),
-            "heading": random.randint(0, 360),
-            "indicated_speed": random.randint(250, 350),
-            "flight_phase": random.choice(["Cruise", "Climb (Above 10000ft)", "Descent (Above 10000ft)"]),
-            "tcas_equipment": random.choice(TCAS_EQUIPMENT_TYPES[:4]),
-            "alert_type": random.choice(TCAS_ALERT_TYPES[:6]),
-            "ra_sense": random.choice(["Climb", "Descend", "Level Off"]),
-            "ra_followed": random.choice(["Yes - Full compliance", "Yes - Partial compliance"]),
-            "traffic_position": random.choice(["12 o'clock", "2 o'clock", "10 o'clock", "6 o'clock"]),
-            "traffic_altitude": random.choice(["Same level", "Above - Level", "Below - Climbing"]),
-            "traffic_range": round(random.uniform(1.0, 8.0), 1),
-            "min_vertical_sep": random.randint(300, 1500),
-            "min_horizontal_sep": round(random.uniform(0.5, 5.0), 1),
-            "vertical_deviation": random.randint(200, 800),
-            "atc_clearance": f"Maintain FL{random.randint(250, 380)}",
+        return _ocr_flight_fields(days_back=7, hour_lo=6, hour_hi=22) | {
+            "position": f"{_ocr_rng.choice(AIRPORT_CODES)} VOR {_ocr_rng.randint(0, 360):03d}/{_ocr_rng.randint(5, 50)}",
+            "altitude_feet": _ocr_rng.randint(10000, 35000),
+            "heading": _ocr_rng.randint(0, 360),
+            "indicated_speed": _ocr_rng.randint(250, 350),
+            "flight_phase": _ocr_rng.choice(("Cruise", "Climb (Above 10000ft)", "Descent (Above 10000ft)")),
+            "tcas_equipment": _ocr_rng.choice(TCAS_EQUIPMENT_TYPES[:4]),
+            "alert_type": _ocr_rng.choice(TCAS_ALERT_TYPES[:6]),
+            "ra_sense": _ocr_rng.choice(("Climb", "Descend", "Level Off")),
+            "ra_followed": _ocr_rng.choice(("Yes - Full compliance", "Yes - Partial compliance")),
+            "traffic_position": _ocr_rng.choice(("12 o'clock", "2 o'clock", "10 o'clock", "6 o'clock")),
+            "traffic_altitude": _ocr_rng.choice(("Same level", "Above - Level", "Below - Climbing")),
+            "traffic_range": round(_ocr_rng.uniform(1.0, 8.0), 1),
+            "min_vertical_sep": _ocr_rng.randint(300, 1500),
+            "min_horizontal_sep": round(_ocr_rng.uniform(0.5, 5.0), 1),
+            "vertical_deviation": _ocr_rng.randint(200, 800),
+            "atc_clearance": f"Maintain FL{_ocr_rng.randint(250, 380)}",
             "atc_notified": True,
-            "captain_name": f"Capt. {random.choice(['Ahmed', 'Khan', 'Ali'])} {random.choice(['Shah', 'Iqbal'])}",
-            "narrative": f"TCAS {random.choice(['RA', 'TA'])} received at FL{random.randint(250, 350)}."
+            "captain_name": f"Capt. {_ocr_rng.choice(('Ahmed', 'Khan', 'Ali'))} {_ocr_rng.choice(('Shah', 'Iqbal'))}",
+            "narrative": f"TCAS {_ocr_rng.choice(('RA', 'TA'))} received at FL{_ocr_rng.randint(250, 350)}."
         }
     elif form_type == "hazard_report":
         return {
-            "hazard_date": (date.today() - timedelta(days=random.randint(0, 3))).isoformat(),
-            "hazard_time": f"{random.randint(6, 20):02d}:{random.randint(0, 59):02d}",
-            "hazard_category": random.choice(HAZARD_CATEGORIES),
-            "location": random.choice(["Ramp/Apron", "Taxiway", "Gate Area", "Maintenance Hangar", "Cargo Area"]),
-            "specific_location": f"{random.choice(['Gate', 'Bay', 'Stand'])} {random.randint(1, 20)}",
-            "airport": random.choice(list(AIRPORTS.keys())[:4]),
-            "hazard_title": random.choice(["FOD observed on apron", "Lighting malfunction", "Ground equipment issue", "Procedure non-compliance", "Safety equipment missing"]),
-            "hazard_description": f"During {random.choice(['routine inspection', 'turnaround operations'])}, {random.choice(['observed', 'identified'])} {random.choice(['potential hazard', 'safety concern'])}.",
-            "likelihood": random.randint(2, 4),
-            "severity": random.choice(["C", "D", "E"]),
+            "hazard_date": (date.today() - timedelta(days=_ocr_rng.randint(0, 3))).isoformat(),
+            "hazard_time": f"{_ocr_rng.randint(6, 20):02d}:{_ocr_rng.randint(0, 59):02d}",
+            "hazard_category": _ocr_rng.choice(HAZARD_CATEGORIES),
+            "location": _ocr_rng.choice(("Ramp/Apron", "Taxiway", "Gate Area", "Maintenance Hangar", "Cargo Area")),
+            "specific_location": f"{_ocr_rng.choice(('Gate', 'Bay', 'Stand'))} {_ocr_rng.randint(1, 20)}",
+            "airport": _ocr_rng.choice(_BASE_AIRPORTS),
+            "hazard_title": _ocr_rng.choice(("FOD observed on apron", "Lighting malfunction", "Ground equipment issue", "Procedure non-compliance", "Safety equipment missing")),
+            "hazard_description": f"During {_ocr_rng.choice(('routine inspection', 'turnaround operations'))}, {_ocr_rng.choice(('observed', 'identified'))} {_ocr_rng.choice(('potential hazard', 'safety concern'))}.",
+            "likelihood": _ocr_rng.randint(2, 4),
+            "severity": _ocr_rng.choice(("C", "D", "E")),
             "existing_controls": "Standard operating procedures in place.",
-            "suggested_actions": f"{random.choice(['Enhanced monitoring', 'Additional training', 'Equipment replacement'])} recommended.",
-            "reporter_name": f"{random.choice(['Mr.', 'Ms.'])} {random.choice(['Ahmed', 'Fatima', 'Ali'])} {random.choice(['Khan', 'Shah'])}",
-            "reporter_employee_id": f"EMP{random.randint(1000, 9999)}",
-            "reporter_department": random.choice(DEPARTMENTS[:10])
+            "suggested_actions": f"{_ocr_rng.choice(('Enhanced monitoring', 'Additional training', 'Equipment replacement'))} recommended.",
+            "reporter_name": f"{_ocr_rng.choice(('Mr.', 'Ms.'))} {_ocr_rng.choice(('Ahmed', 'Fatima', 'Ali'))} {_ocr_rng.choice(('Khan', 'Shah'))}",
+            "reporter_employee_id": f"EMP{_ocr_rng.randint(1000, 9999)}",
+            "reporter_department": _ocr_rng.choice(DEPARTMENTS[:10])
         }
     elif form_type == "incident_report":
-        return {
-            "flight_number": random.choice(flight_numbers),
-            "aircraft_reg": random.choice(aircraft_regs),
-            "incident_date": (date.today() - timedelta(days=random.randint(0, 5))).isoformat(),
-            "incident_time": f"{random.randint(5, 23):02d}:{random.randint(0, 59):02d}",
-            "departure_airport": random.choice(list(AIRPORTS.keys())),
-            "arrival_airport": random.choice(list(AIRPORTS.keys())),
-            "notification_type": random.choice(["Incident", "Serious Incident", "Occurrence (Mandatory Reportable)"]),
-            "primary_category": random.choice(INCIDENT_CATEGORIES[:15]),
-            "flight_phase": random.choice(FLIGHT_PHASES),
-            "altitude_feet": random.randint(0, 35000),
-            "weather_conditions": random.choice(WEATHER_CONDITIONS[:10]),
-            "captain_name": f"Capt. {random.choice(['Ahmed', 'Khan', 'Ali'])} {random.choice(['Shah', 'Iqbal'])}",
-            "captain_license": f"ATPL-PK-{random.randint(1000, 9999)}",
-            "fo_name": f"FO {random.choice(['Usman', 'Bilal'])} {random.choice(['Khan', 'Ahmed'])}",
-            "pax_total": random.randint(40, 180),
+        return _ocr_flight_fields(days_back=5, hour_lo=5, hour_hi=23) | {
+            "notification_type": _ocr_rng.choice(("Incident", "Serious Incident", "Occurrence (Mandatory Reportable)")),
+            "primary_category": _ocr_rng.choice(INCIDENT_CATEGORIES[:15]),
+            "flight_phase": _ocr_rng.choice(FLIGHT_PHASES),
+            "altitude_feet": _ocr_rng.randint(0, 35000),
+            "weather_conditions": _ocr_rng.choice(WEATHER_CONDITIONS[:10]),
+            "captain_name": f"Capt. {_ocr_rng.choice(('Ahmed', 'Khan', 'Ali'))} {_ocr_rng.choice(('Shah', 'Iqbal'))}",
+            "captain_license": f"ATPL-PK-{_ocr_rng.randint(1000, 9999)}",
+            "fo_name": f"FO {_ocr_rng.choice(('Usman', 'Bilal'))} {_ocr_rng.choice(('Khan', 'Ahmed'))}",
+            "pax_total": _ocr_rng.randint(40, 180),
             "injuries_none": True,
-            "aircraft_damage": random.choice([d[0] for d in DAMAGE_LEVELS[:3]]),
-            "emergency_declared": random.choice(["No", "PAN PAN"]),
-            "incident_title": f"{random.choice(['System malfunction', 'Weather encounter', 'Operational event'])} during flight",
-            "incident_description": f"During {random.choice(['cruise', 'approach', 'departure'])}, {random.choice(['experienced', 'encountered'])} {random.choice(['technical issue', 'operational event'])}.",
-            "immediate_actions": f"Crew {random.choice(['monitored situation', 'executed checklist', 'coordinated with ATC'])}.",
-            "caa_notified": random.choice([True, False])
+            "aircraft_damage": _ocr_rng.choice(_DAMAGE_KEYS[:3]),
+            "emergency_declared": _ocr_rng.choice(("No", "PAN PAN")),
+            "incident_title": f"{_ocr_rng.choice(('System malfunction', 'Weather encounter', 'Operational event'))} during flight",
+            "incident_description": f"During {_ocr_rng.choice(('cruise', 'approach', 'departure'))}, {_ocr_rng.choice(('experienced', 'encountered'))} {_ocr_rng.choice(('technical issue', 'operational event'))}.",
+            "immediate_actions": f"Crew {_ocr_rng.choice(('monitored situation', 'executed checklist', 'coordinated with ATC'))}.",
+            "caa_notified": bool(_rb(1))
         }
-    return {"extraction_status": "completed", "confidence": f"{random.randint(85, 98)}%", "extracted_at": datetime.now().isoformat()}
+    return {"extraction_status": "completed", "confidence": f"{_ocr_rng.randint(85, 98)}%", "extracted_at": datetime.now().isoformat()}
 
-def render_ocr_uploader(form_type: str) -> Optional[dict]:
-    st.markdown("""
+OCR_PROGRESS_STEPS = (
+    (10, "📥 Loading document..."), (20, "🔧 Preprocessing image..."), (30, "📐 Detecting text regions..."),
+    (45, "🔤 Running Tesseract OCR engine..."), (60, "📝 Extracting text from regions..."), (75, "🔍 Parsing form fields..."),
+    (85, "✅ Validating extracted data..."), (95, "📊 Calculating confidence scores..."), (100, "✨ Extraction complete!"),
+)
+
+_OCR_BANNER_HTML = """
     <div style="background: linear-gradient(135deg, #EFF6FF 0%, #DBEAFE 100%); border: 2px dashed #3B82F6; border-radius: 12px; padding: 2rem; text-align: center; margin-bottom: 1.5rem;">
         <div style="font-size: 3rem; margin-bottom: 0.5rem;">📷</div>
         <h4 style="color: #1E40AF; margin: 0;">Scan Handwritten Form</h4>
         <p style="color: #64748B; font-size: 0.9rem; margin-top: 0.5rem;">Upload an image or PDF of a filled form to auto-extract data using OCR</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def render_ocr_uploader(form_type: str) -> Optional[dict]:
+    st.markdown(_OCR_BANNER_HTML, unsafe_allow_html=True)
     
     col1, col2 = st.columns([2, 1])
     with col1:
         uploaded_file = st.file_uploader("Upload Form Image/PDF", type=['png', 'jpg', 'jpeg', 'bmp', 'tiff', 'webp', 'pdf'], key=f"ocr_upload_{form_type}")
     with col2:
-        ocr_engine = st.radio("OCR Engine", options=["Tesseract OCR", "Google Vision"], key=f"ocr_engine_{form_type}")
+        ocr_engine = st.radio("OCR Engine", options=("Tesseract OCR", "Google Vision"), key=f"ocr_engine_{form_type}")
     
     if uploaded_file is not None:
         col1, col2 = st.columns([1, 1])
@@ -731,13 +979,24 @@ def render_ocr_uploader(form_type: str) -> Optional[dict]:
         with col2:
             st.markdown("### OCR Processing")
             if st.button("🔍 Analyze with Tesseract OCR", key=f"analyze_{form_type}", type="primary", use_container_width=True):
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                for progress, status in [(10, "📥 Loading document..."), (20, "🔧 Preprocessing image..."), (30, "📐 Detecting text regions..."), (45, "🔤 Running Tesseract OCR engine..."), (60, "📝 Extracting text from regions..."), (75, "🔍 Parsing form fields..."), (85, "✅ Validating extracted data..."), (95, "📊 Calculating confidence scores..."), (100, "✨ Extraction complete!")]:
-                    progress_bar.progress(progress)
-                    status_text.markdown(f"**{status}**")
-                    time.sleep(0.3 + random.uniform(0.1, 0.3))
-                extracted_data = simulate_ocr_extraction(uploaded_file.type, form_type)
+                # Same file + form type -> reuse the earlier extraction instead of running OCR again
+                ocr_cache = st.session_state.setdefault("_ocr_cache", {})
+                content_key = (form_type, hashlib.blake2b(uploaded_file.getvalue(), digest_size=16).hexdigest())
+                if content_key in ocr_cache:
+                    extracted_data = ocr_cache[content_key]
+                elif st.session_state.get("demo_animation", False):
+                    # Presentation mode: keep the step-by-step progress, just without the long pauses
+                    progress_bar = st.progress(0)
+                    status_text = st.empty()
+                    for progress, status in OCR_PROGRESS_STEPS:
+                        progress_bar.progress(progress)
+                        status_text.markdown(f"**{status}**")
+                        time.sleep(0.02)
+                    extracted_data = simulate_ocr_extraction(uploaded_file.type, form_type)
+                else:
+                    with st.spinner("🔤 Running OCR..."):
+                        extracted_data = simulate_ocr_extraction(uploaded_file.type, form_type)
+                ocr_cache[content_key] = extracted_data
                 st.session_state[f'ocr_data_{form_type}'] = extracted_data
                 st.success("✅ OCR extraction completed!")
                 confidence = random.randint(87, 96)
@@ -748,9 +1007,13 @@ def render_ocr_uploader(form_type: str) -> Optional[dict]:
                     </div>
                 </div>""", unsafe_allow_html=True)
                 with st.expander("📋 View Extracted Data", expanded=True):
-                    for key, value in extracted_data.items():
-                        if isinstance(value, list): value = ", ".join(str(v) for v in value)
-                        st.markdown(f"**{key.replace('_', ' ').title()}:** {value}")
+                    # One widget for all fields; values stringified so Arrow gets a single-typed column
+                    fields = pd.DataFrame(
+                        [(key.replace('_', ' ').title(), ", ".join(map(str, value)) if isinstance(value, list) else str(value))
+                         for key, value in extracted_data.items()],
+                        columns=["Field", "Value"],
+                    )
+                    st.dataframe(fields, use_container_width=True, hide_index=True)
                 st.info("💡 Extracted data pre-fills the form below. Please review and correct any errors.")
                 return extracted_data
     return st.session_state.get(f'ocr_data_{form_type}')
@@ -767,8 +1030,8 @@ def render_ocr_uploader(form_type: str) -> Optional[dict]:
 # ══════════════════════════════════════════════════════════════════════════════
 # WEATHER WIDGET (HYBRID: REAL API + MOCK FALLBACK)
 # ══════════════════════════════════════════════════════════════════════════════
-import requests
 import streamlit as st
+import weather
 
 # Coordinates for your main airports (matches the Free API requirement)
 AIRPORT_COORDS = {
@@ -790,13 +1053,13 @@ def fetch_live_weather(icao_code):
         return None
 
     # 1. Try Real API (if key exists)
-    api_key = st.secrets.get("OPENWEATHER_API_KEY") or st.secrets.get("WEATHER_API_KEY")
+    api_key = weather.WEATHER_API_KEY
     
     if api_key:
         try:
             # Using the FREE API endpoint with lat/lon
             url = f"https://api.openweathermap.org/data/2.5/weather?lat={airport['lat']}&lon={airport['lon']}&units=metric&appid={api_key}"
-            response = requests.get(url, timeout=3)
+            response = weather.get_http_session().get(url, timeout=3)
             
             if response.status_code == 200:
                 data = response.json()
@@ -830,26 +1093,21 @@ def render_weather_widget():
     
     st.markdown("### 🌤️ Weather Operations (Live)")
     
-    # Create columns for the widget
-    cols = st.columns(5)
-    
-    # Fetch real data
-    weather_data = weather.get_all_weather()
+    # Fetch real data (cached typed frame, one row per airport)
+    weather_df = weather.get_weather_frame()
     
     # Display logic
-    if not weather_data:
+    if weather_df.empty:
         st.warning("Weather data unavailable. Check internet connection or API Key.")
         return
 
-    for col, data in zip(cols, weather_data):
-        with col:
-            st.markdown(f"""
-            <div style="background: white; border-radius: 12px; padding: 1rem; text-align: center; border: 1px solid #E2E8F0; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
-                <div style="font-size: 2rem; margin-bottom: 5px;">{data['icon']}</div>
-                <div style="font-size: 1.5rem; font-weight: 700; color: #1E40AF; line-height: 1;">{data['temp']}°C</div>
-                <div style="color: #64748B; font-size: 0.85rem; font-weight: 600; margin-top: 5px;">{data['name']}</div>
-                <div style="font-size: 0.75rem; color: #94A3B8;">{data['condition']} • 💨 {data['wind']} km/h</div>
-            </div>""", unsafe_allow_html=True)
+    # All five cards in one flex row, styled by the .wx-* rules in apply_custom_css
+    cards_html = "".join(
+        f'<div class="wx-card"><div class="wx-icon">{data.icon}</div><div class="wx-temp">{data.temp:.0f}°C</div>'
+        f'<div class="wx-name">{data.name}</div><div class="wx-cond">{data.condition} • 💨 {data.wind} km/h</div></div>'
+        for data in weather_df.itertuples(index=False)
+    )
+    st.markdown(f'<div class="wx-row">{cards_html}</div>', unsafe_allow_html=True)
 # ══════════════════════════════════════════════════════════════════════════════
 # CUSTOM CSS STYLING
 # ══════════════════════════════════════════════════════════════════════════════
@@ -865,15 +1123,46 @@ def apply_custom_css():
     .risk-medium { background: #FEF9C3; color: #CA8A04; }
     .risk-low { background: #DCFCE7; color: #16A34A; }
     .form-section { background: #FFFFFF; border: 1px solid #E2E8F0; border-radius: 12px; padding: 1.5rem; margin-bottom: 1.5rem; }
+    .wx-row { display: flex; gap: 1rem; }
+    .wx-card { flex: 1; background: white; border-radius: 12px; padding: 1rem; text-align: center; border: 1px solid #E2E8F0; box-shadow: 0 1px 3px rgba(0,0,0,0.1); }
+    .wx-icon { font-size: 2rem; margin-bottom: 5px; }
+    .wx-temp { font-size: 1.5rem; font-weight: 700; color: #1E40AF; line-height: 1; }
+    .wx-name { color: #64748B; font-size: 0.85rem; font-weight: 600; margin-top: 5px; }
+    .wx-cond { font-size: 0.75rem; color: #94A3B8; }
+    .rm-wrap { overflow-x: auto; }
+    .rm-table { border-collapse: collapse; width: 100%; min-width: 500px; font-size: 0.8rem; }
+    .rm-head, .rm-cell { border: 1px solid #CBD5E1; padding: 8px; }
+    .rm-head { background: #F1F5F9; }
+    .rm-center, .rm-cell { text-align: center; }
+    .rm-bold, .rm-cell { font-weight: bold; }
+    .rm-extreme { background: #FEE2E2; color: #DC2626; border-color: #DC2626; }
+    .rm-high { background: #FFEDD5; color: #EA580C; border-color: #EA580C; }
+    .rm-medium { background: #FEF9C3; color: #CA8A04; border-color: #CA8A04; }
+    .rm-low { background: #DCFCE7; color: #16A34A; border-color: #16A34A; }
+    .rm-cell.rm-extreme, .rm-cell.rm-high, .rm-cell.rm-medium, .rm-cell.rm-low { border-color: #CBD5E1; }
+    .rm-legend { display: flex; gap: 1rem; margin-top: 0.5rem; font-size: 0.75rem; flex-wrap: wrap; }
+    .rm-legend-item { display: flex; align-items: center; gap: 4px; }
+    .rm-swatch { width: 12px; height: 12px; border: 1px solid; border-radius: 2px; }
     </style>
     """, unsafe_allow_html=True)
 
+_SECTION_HEADER_HTML = '<div class="form-section"><div class="form-section-header">{}</div></div>'
+
+def render_section_header(title: str):
+    """Lettered form-section banner shared by every report form"""
+    st.markdown(_SECTION_HEADER_HTML.format(title), unsafe_allow_html=True)
+
+def render_validation_errors(errors: list):
+    """All form validation failures in one error box"""
+    st.error("**Please fix the following:**\n" + "\n".join(f"- ❌ {error}" for error in errors))
+
 # ══════════════════════════════════════════════════════════════════════════════
 # HEADER AND LOGO
 # ══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=1)
 def get_logo_path():
-    """Check multiple locations for logo file."""
+    """Check multiple locations for logo file (once per process; the result never changes)."""
     possible_paths = [
         "logo.png",
         "./logo.png",
@@ -891,26 +1180,32 @@ def get_logo_path():
             return path
     return None
 
+# Static header fragments, built once at import
+_ERP_BANNER_HTML = '<div style="background: #DC2626; color: white; padding: 0.5rem; text-align: center; font-weight: bold; margin-bottom: 0.5rem; border-radius: 8px; animation: erp-flash 1s infinite;">⚠️ EMERGENCY RESPONSE PLAN ACTIVATED ⚠️</div>'
+_LOGO_FALLBACK_HTML = '<span style="font-size: 3rem;">🛡️✈️</span>'
+_HEADER_TITLE_HTML = f'<div style="padding-top: 0.5rem;"><h2 style="color: #1E40AF; margin: 0; font-weight: 700;">{Config.APP_NAME}</h2><p style="color: #64748B; margin: 0; font-size: 0.9rem;">{Config.APP_SUBTITLE} v{Config.APP_VERSION} | {Config.COMPANY_ICAO} | AOC: {Config.AOC_NUMBER}</p></div>'
+_HEADER_RULE_HTML = '<div style="background: linear-gradient(135deg, #1E40AF 0%, #3B82F6 100%); height: 4px; border-radius: 4px; margin: 0.5rem 0 1rem 0;"></div>'
+
 def render_header():
     current_time = get_pakistan_time()
     erp_mode = st.session_state.get('erp_mode', False)
     
     if erp_mode:
-        st.markdown('<div style="background: #DC2626; color: white; padding: 0.5rem; text-align: center; font-weight: bold; margin-bottom: 0.5rem; border-radius: 8px; animation: erp-flash 1s infinite;">⚠️ EMERGENCY RESPONSE PLAN ACTIVATED ⚠️</div>', unsafe_allow_html=True)
+        st.markdown(_ERP_BANNER_HTML, unsafe_allow_html=True)
     
     col_logo, col_title, col_time = st.columns([1, 4, 2])
     with col_logo:
         logo_path = get_logo_path()
         if logo_path:
             try: st.image(logo_path, width=80)
-            except: st.markdown('<span style="font-size: 3rem;">🛡️✈️</span>', unsafe_allow_html=True)
+            except: st.markdown(_LOGO_FALLBACK_HTML, unsafe_allow_html=True)
         else:
-            st.markdown('<span style="font-size: 3rem;">🛡️✈️</span>', unsafe_allow_html=True)
+            st.markdown(_LOGO_FALLBACK_HTML, unsafe_allow_html=True)
     with col_title:
-        st.markdown(f'<div style="padding-top: 0.5rem;"><h2 style="color: #1E40AF; margin: 0; font-weight: 700;">{Config.APP_NAME}</h2><p style="color: #64748B; margin: 0; font-size: 0.9rem;">{Config.APP_SUBTITLE} v{Config.APP_VERSION} | {Config.COMPANY_ICAO} | AOC: {Config.AOC_NUMBER}</p></div>', unsafe_allow_html=True)
+        st.markdown(_HEADER_TITLE_HTML, unsafe_allow_html=True)
     with col_time:
         st.markdown(f'<div style="text-align: right; padding-top: 0.5rem;"><div style="color: #64748B; font-size: 0.8rem;">🇵🇰 Pakistan Standard Time</div><div style="color: #1E40AF; font-size: 1.3rem; font-weight: 700;">{current_time.strftime("%H:%M:%S")}</div><div style="color: #64748B; font-size: 0.8rem;">{current_time.strftime("%A, %d %B %Y")}</div></div>', unsafe_allow_html=True)
-    st.markdown('<div style="background: linear-gradient(135deg, #1E40AF 0%, #3B82F6 100%); height: 4px; border-radius: 4px; margin: 0.5rem 0 1rem 0;"></div>', unsafe_allow_html=True)
+    st.markdown(_HEADER_RULE_HTML, unsafe_allow_html=True)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # RISK MATRIX COMPONENTS
@@ -920,60 +1215,129 @@ def render_risk_badge(risk_level: RiskLevel) -> str:
     class_map = {RiskLevel.EXTREME: "risk-extreme", RiskLevel.HIGH: "risk-high", RiskLevel.MEDIUM: "risk-medium", RiskLevel.LOW: "risk-low"}
     return f'<span class="risk-badge {class_map[risk_level]}">{risk_level.value}</span>'
 
+# Selector labels and captions, formatted once
+_LIKELIHOOD_LABELS = {k: f"{k} - {v['name']}" for k, v in LIKELIHOOD_SCALE.items()}
+_LIKELIHOOD_CAPTIONS = {k: f"📋 {v['description']}" for k, v in LIKELIHOOD_SCALE.items()}
+_SEVERITY_LABELS = {k: f"{k} - {v['name']}" for k, v in SEVERITY_SCALE.items()}
+_SEVERITY_CAPTIONS = {k: f"📋 {v['description']}" for k, v in SEVERITY_SCALE.items()}
+
 def render_risk_matrix_selector():
     st.markdown("#### 📊 Risk Assessment (ICAO Standard)")
     col1, col2 = st.columns(2)
     with col1:
-        likelihood = st.select_slider("**Likelihood**", options=[1, 2, 3, 4, 5], value=3, format_func=lambda x: f"{x} - {LIKELIHOOD_SCALE[x]['name']}")
-        st.caption(f"📋 {LIKELIHOOD_SCALE[likelihood]['description']}")
+        likelihood = st.select_slider("**Likelihood**", options=(1, 2, 3, 4, 5), value=3, format_func=_LIKELIHOOD_LABELS.__getitem__)
+        st.caption(_LIKELIHOOD_CAPTIONS[likelihood])
     with col2:
-        severity = st.selectbox("**Severity**", options=["E", "D", "C", "B", "A"], index=2, format_func=lambda x: f"{x} - {SEVERITY_SCALE[x]['name']}")
-        st.caption(f"📋 {SEVERITY_SCALE[severity]['description']}")
+        severity = st.selectbox("**Severity**", options=("E", "D", "C", "B", "A"), index=2, format_func=_SEVERITY_LABELS.__getitem__)
+        st.caption(_SEVERITY_CAPTIONS[severity])
     
     risk_level = calculate_risk_level(likelihood, severity)
-    risk_info = RISK_ACTIONS[risk_level]
+    risk_info = _RISK_INFO[RiskLevel(risk_level)]
     risk_classification = f"{likelihood}{severity}"
     
-    st.markdown(f"""<div style="background: {risk_info['color']}20; border: 2px solid {risk_info['color']}; border-radius: 10px; padding: 1.5rem; margin-top: 1rem;">
+    st.markdown(f"""<div style="background: {risk_info.color}20; border: 2px solid {risk_info.color}; border-radius: 10px; padding: 1.5rem; margin-top: 1rem;">
         <div style="display: flex; justify-content: space-between; align-items: center;">
-            <div><span style="font-size: 2rem; font-weight: 700; color: {risk_info['color']};">{risk_classification}</span><span style="font-size: 1.5rem; margin-left: 1rem;">{render_risk_badge(risk_level)}</span></div>
-            <div style="text-align: right;"><div style="font-weight: 600; color: {risk_info['color']};">{risk_info['action']}</div><div style="font-size: 0.85rem; opacity: 0.8;">Timeline: {risk_info['timeline']}</div></div>
+            <div><span style="font-size: 2rem; font-weight: 700; color: {risk_info.color};">{risk_classification}</span><span style="font-size: 1.5rem; margin-left: 1rem;">{render_risk_badge(risk_level)}</span></div>
+            <div style="text-align: right;"><div style="font-weight: 600; color: {risk_info.color};">{risk_info.action}</div><div style="font-size: 0.85rem; opacity: 0.8;">Timeline: {risk_info.timeline}</div></div>
         </div>
-        <div style="margin-top: 1rem; font-size: 0.9rem;">{risk_info['description']}</div>
+        <div style="margin-top: 1rem; font-size: 0.9rem;">{risk_info.description}</div>
     </div>""", unsafe_allow_html=True)
     return likelihood, severity, risk_level, risk_classification
 
-def render_visual_risk_matrix():
-    """Darkened, High-Contrast ICAO Risk Matrix"""
-    st.markdown("""
-    <style>
-        .matrix-cell { padding: 15px; color: white; font-weight: bold; text-align: center; border: 1px solid #333; }
-        .risk-ext { background-color: #8B0000; } /* Dark Red */
-        .risk-high { background-color: #CC5500; } /* Dark Orange */
-        .risk-med { background-color: #B8860B; }  /* Dark Gold */
-        .risk-low { background-color: #006400; }  /* Dark Green */
-    </style>
-    <div style="display: flex; justify-content: center;">
-        <table style="width:100%; border-collapse: collapse;">
-            <tr>
-                <td class="matrix-cell risk-med">5A</td><td class="matrix-cell risk-med">5B</td><td class="matrix-cell risk-high">5C</td><td class="matrix-cell risk-ext">5D</td><td class="matrix-cell risk-ext">5E</td>
-            </tr>
-            <tr>
-                <td class="matrix-cell risk-low">4A</td><td class="matrix-cell risk-med">4B</td><td class="matrix-cell risk-high">4C</td><td class="matrix-cell risk-ext">4D</td><td class="matrix-cell risk-ext">4E</td>
-            </tr>
-            <tr>
-                <td class="matrix-cell risk-low">3A</td><td class="matrix-cell risk-low">3B</td><td class="matrix-cell risk-med">3C</td><td class="matrix-cell risk-high">3D</td><td class="matrix-cell risk-ext">3E</td>
-            </tr>
-            <tr>
-                <td class="matrix-cell risk-low">2A</td><td class="matrix-cell risk-low">2B</td><td class="matrix-cell risk-low">2C</td><td class="matrix-cell risk-med">2D</td><td class="matrix-cell risk-high">2E</td>
-            </tr>
-            <tr>
-                <td class="matrix-cell risk-low">1A</td><td class="matrix-cell risk-low">1B</td><td class="matrix-cell risk-low">1C</td><td class="matrix-cell risk-low">1D</td><td class="matrix-cell risk-med">1E</td>
-            </tr>
-        </table>
-    </div>
-    """, unsafe_allow_html=True)
+# Damage level -> risk level for bird strike submissions (anything else is Low)
+_BIRD_DAMAGE_RISK = {
+    "Destroyed": "Extreme", "Substantial": "Extreme",
+    "Major": "High", "Minor - Confirmed": "High",
+    "Minor - Unconfirmed": "Medium",
+}
+
+# Laser strike risk is the worst tier of intensity, medical outcome and emergency status
+_LASER_INTENSITY_OPTIONS = ("Low - Visible but not distracting", "Medium - Distracting",
+                            "High - Temporarily blinding", "Extreme - Severe visual impairment")
+_LASER_RISK_LEVELS = ("Low", "Medium", "High", "Extreme")
+_LASER_INTENSITY_TIER = {intensity: tier for tier, intensity in enumerate(_LASER_INTENSITY_OPTIONS)}
+_LASER_MEDICAL_TIER = {
+    "No": 0, "Yes - First aid only": 0,
+    "Yes - Medical examination": 3, "Yes - Hospital treatment": 3, "Pending evaluation": 3,
+}
+_LASER_EMERGENCY_TIER = {"No": 0, "PAN PAN": 2, "MAYDAY": 2}
+
+def _render_incident_timing(prefix, ocr_data):
+    """Reference number, date and UTC time row shared by the strike and TCAS forms."""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        incident_id = st.text_input(
+            "Incident Reference Number",
+            value=_form_ref(prefix.upper()),
+            disabled=True
+        )
+    with col2:
+        incident_date = st.date_input(
+            "Date of Incident *",
+            value=date.fromisoformat(ocr_data['incident_date']) if ocr_data.get('incident_date') else date.today()
+        )
+    with col3:
+        incident_time = st.time_input(
+            "Time of Incident (UTC) *",
+            value=dt_time.fromisoformat(ocr_data['incident_time']) if ocr_data.get('incident_time') else datetime.now().time()
+        )
+    return incident_id, incident_date, incident_time
+
+
+def _render_flight_info_section(prefix, ocr_data, title="Section B: Flight Information", default_phase=6):
+    """Section B (flight number, aircraft, route, phase) shared by the strike and TCAS forms.
+
+    Only the airport pickers are keyed; OCR-seeded widgets stay unkeyed so a new
+    OCR default replaces the previous one.
+    """
+    render_section_header(title)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        flight_number = st.text_input(
+            "Flight Number *",
+            value=ocr_data.get('flight_number', ''),
+            placeholder="e.g., PF-101"
+        )
+    with col2:
+        aircraft_reg = st.selectbox(
+            "Aircraft Registration *",
+            options=FLEET_SELECT_OPTIONS,
+            index=_FLEET_SELECT_INDEX.get(ocr_data.get('aircraft_reg'), 0)
+        )
+    with col3:
+        # Auto-populate aircraft type based on registration
+        aircraft_type = st.text_input(
+            "Aircraft Type",
+            value=_AIRCRAFT_TYPE.get(aircraft_reg, ""),
+            disabled=True
+        )
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        origin_airport = st.selectbox(
+            "Origin Airport *",
+            options=AIRPORT_SELECT_OPTIONS,
+            index=0,
+            key=f"{prefix}_origin"
+        )
+    with col2:
+        destination_airport = st.selectbox(
+            "Destination Airport *",
+            options=AIRPORT_SELECT_OPTIONS,
+            index=0,
+            key=f"{prefix}_dest"
+        )
+    with col3:
+        flight_phase = st.selectbox(
+            "Phase of Flight *",
+            options=FLIGHT_PHASES,
+            index=_FLIGHT_PHASE_INDEX.get(ocr_data.get('flight_phase'), default_phase)
+        )
+    return flight_number, aircraft_reg, aircraft_type, origin_airport, destination_airport, flight_phase
 
+
+@st.fragment
 def render_bird_strike_form():
     """
     Complete Bird Strike Report Form
@@ -995,38 +1359,37 @@ def render_bird_strike_form():
     if ocr_data:
         st.info("✨ Form pre-filled with OCR extracted data. Please verify and correct any fields.")
     
-    # Form container
-    with st.form("bird_strike_form", clear_on_submit=False):
+    # Confirmation carried over from the submit that reset the form
+    submitted_report = st.session_state.pop('bird_strike_submitted', None)
+    if submitted_report:
+        if st.session_state.get('enable_animations', False):
+            st.balloons()
+        st.success(f"""
+            ✅ **Bird Strike Report Submitted Successfully!**
+        
+            **Reference:** {submitted_report['reference']}  
+            **Risk Level:** {submitted_report['risk_level']}  
+            **Status:** {submitted_report['status']}
+        
+            The report has been added to the system and is now visible in View Reports.
+        """)
+    
+    # Form container; the generation suffix gives a fresh, empty form after a successful
+    # submit only, so a failed validation or DB error keeps everything the pilot typed
+    form_generation = st.session_state.get('bird_strike_form_generation', 0)
+    with st.form(f"bird_strike_form_{form_generation}", clear_on_submit=False):
         
         # ========== SECTION A: INCIDENT IDENTIFICATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section A: Incident Identification</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section A: Incident Identification")
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            incident_id = st.text_input(
-                "Incident Reference Number",
-                value=f"BS-{datetime.now().strftime('%Y%m%d')}-{random.randint(100, 999)}",
-                disabled=True
-            )
-        with col2:
-            incident_date = st.date_input(
-                "Date of Incident *",
-                value=datetime.strptime(ocr_data.get('incident_date', date.today().isoformat()), '%Y-%m-%d').date() if ocr_data.get('incident_date') else date.today()
-            )
-        with col3:
-            incident_time = st.time_input(
-                "Time of Incident (UTC) *",
-                value=datetime.strptime(ocr_data.get('incident_time', '12:00'), '%H:%M').time() if ocr_data.get('incident_time') else datetime.now().time()
-            )
+        incident_id, incident_date, incident_time = _render_incident_timing("bs", ocr_data)
         
         col1, col2 = st.columns(2)
         with col1:
             time_of_day = st.selectbox(
                 "Time of Day *",
-                options=["Dawn", "Day", "Dusk", "Night"],
-                index=["Dawn", "Day", "Dusk", "Night"].index(ocr_data.get('time_of_day', 'Day')) if ocr_data.get('time_of_day') in ["Dawn", "Day", "Dusk", "Night"] else 1
+                options=TIMES_OF_DAY,
+                index=_TIME_OF_DAY_INDEX.get(ocr_data.get('time_of_day'), 1)
             )
         with col2:
             reported_by = st.text_input(
@@ -1035,70 +1398,17 @@ def render_bird_strike_form():
             )
         
         # ========== SECTION B: FLIGHT INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section B: Flight Information</div>
-        </div>""", unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            flight_number = st.text_input(
-                "Flight Number *",
-                value=ocr_data.get('flight_number', ''),
-                placeholder="e.g., PF-101"
-            )
-        with col2:
-            # Create a clean list of options first
-            fleet_options = [""] + list(AIRCRAFT_FLEET.keys())
-            
-            # Find the correct index safely
-            default_index = 0
-            if ocr_data.get('aircraft_reg') in fleet_options:
-                default_index = fleet_options.index(ocr_data['aircraft_reg'])
-
-            aircraft_reg = st.selectbox(
-                "Aircraft Registration *",
-                options=fleet_options,
-                index=default_index
-            )
-            
-        with col3:
-            # Auto-populate aircraft type based on registration
-            aircraft_type = st.text_input(
-                "Aircraft Type",
-                value=AIRCRAFT_FLEET.get(aircraft_reg, {}).get("type", ""),
-                disabled=True
-            )
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            origin_airport = st.selectbox(
-                "Origin Airport *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
-                index=0
-            )
-        with col2:
-            destination_airport = st.selectbox(
-                "Destination Airport *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
-                index=0
-            )
-        with col3:
-            flight_phase = st.selectbox(
-                "Phase of Flight *",
-                options=FLIGHT_PHASES,
-                index=FLIGHT_PHASES.index(ocr_data.get('flight_phase', 'Approach')) if ocr_data.get('flight_phase') in FLIGHT_PHASES else 6
-            )
+        (flight_number, aircraft_reg, aircraft_type,
+         origin_airport, destination_airport, flight_phase) = _render_flight_info_section("bs", ocr_data)
         
         # ========== SECTION C: STRIKE LOCATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section C: Strike Location & Conditions</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section C: Strike Location & Conditions")
         
         col1, col2, col3 = st.columns(3)
         with col1:
             strike_airport = st.selectbox(
                 "Airport/Location of Strike",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
+                options=AIRPORT_SELECT_OPTIONS,
                 index=0
             )
         with col2:
@@ -1152,34 +1462,33 @@ def render_bird_strike_form():
         with col2:
             visibility = st.selectbox(
                 "Visibility",
-                options=["Good (>10km)", "Moderate (5-10km)", "Poor (1-5km)", "Very Poor (<1km)"],
+                options=("Good (>10km)", "Moderate (5-10km)", "Poor (1-5km)", "Very Poor (<1km)"),
                 index=0
             )
         
         # ========== SECTION D: BIRD/WILDLIFE DETAILS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section D: Bird/Wildlife Details</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section D: Bird/Wildlife Details")
         
         col1, col2, col3 = st.columns(3)
         with col1:
             bird_species = st.selectbox(
                 "Bird Species (if known)",
-                options=["Unknown"] + BIRD_SPECIES,
-                index=(["Unknown"] + BIRD_SPECIES).index(ocr_data.get('bird_species', 'Unknown')) if ocr_data.get('bird_species') in (["Unknown"] + BIRD_SPECIES) else 0
+                options=BIRD_SPECIES_OPTIONS,
+                index=_BIRD_SPECIES_INDEX.get(ocr_data.get('bird_species'), 0)
             )
         with col2:
             bird_size = st.selectbox(
                 "Bird Size *",
-                options=[s[0] for s in BIRD_SIZES],
-                index=[s[0] for s in BIRD_SIZES].index(ocr_data.get('bird_size', 'Medium')) if ocr_data.get('bird_size') in [s[0] for s in BIRD_SIZES] else 2
+                options=_BIRD_SIZE_KEYS,
+                index=_BIRD_SIZE_INDEX.get(ocr_data.get('bird_size'), 2)
             )
+        ocr_struck = int(ocr_data.get('number_struck') or 1)
         with col3:
             number_struck = st.number_input(
                 "Number of Birds Struck",
                 min_value=1,
                 max_value=100,
-                value=int(ocr_data.get('number_struck', 1)),
+                value=ocr_struck,
                 step=1
             )
         
@@ -1189,26 +1498,24 @@ def render_bird_strike_form():
                 "Number of Birds Seen",
                 min_value=1,
                 max_value=1000,
-                value=max(int(ocr_data.get('number_seen', 1)), int(ocr_data.get('number_struck', 1))),
+                value=max(int(ocr_data.get('number_seen') or 1), ocr_struck),
                 step=1
             )
         with col2:
             bird_remains = st.selectbox(
                 "Bird Remains Collected?",
-                options=["No", "Yes - Sent for identification", "Yes - Available for collection", "Partial remains only"],
+                options=("No", "Yes - Sent for identification", "Yes - Available for collection", "Partial remains only"),
                 index=0
             )
         
         bird_behavior = st.multiselect(
             "Bird Behavior Before Strike",
-            options=["Flying", "Sitting on runway", "Sitting on taxiway", "Soaring/Circling", "Feeding", "Unknown"],
+            options=("Flying", "Sitting on runway", "Sitting on taxiway", "Soaring/Circling", "Feeding", "Unknown"),
             default=[]
         )
         
         # ========== SECTION E: AIRCRAFT PARTS STRUCK ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section E: Aircraft Parts Struck</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section E: Aircraft Parts Struck")
         
         st.markdown("*Select all parts that were struck*")
         
@@ -1222,32 +1529,30 @@ def render_bird_strike_form():
         with col1:
             engine_ingested = st.selectbox(
                 "Engine Ingestion?",
-                options=["No", "Yes - Engine 1", "Yes - Engine 2", "Yes - Both Engines", "Suspected but not confirmed"],
+                options=("No", "Yes - Engine 1", "Yes - Engine 2", "Yes - Both Engines", "Suspected but not confirmed"),
                 index=0
             )
         with col2:
             windshield_penetrated = st.selectbox(
                 "Windshield Penetrated?",
-                options=["No", "Yes - Cracked only", "Yes - Penetrated", "Yes - Shattered"],
+                options=("No", "Yes - Cracked only", "Yes - Penetrated", "Yes - Shattered"),
                 index=0
             )
         
         # ========== SECTION F: DAMAGE ASSESSMENT ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section F: Damage Assessment</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section F: Damage Assessment")
         
         col1, col2 = st.columns(2)
         with col1:
             damage_level = st.selectbox(
                 "Overall Damage Level *",
-                options=[d[0] for d in DAMAGE_LEVELS],
-                index=[d[0] for d in DAMAGE_LEVELS].index(ocr_data.get('damage_level', 'None')) if ocr_data.get('damage_level') in [d[0] for d in DAMAGE_LEVELS] else 0
+                options=_DAMAGE_KEYS,
+                index=_DAMAGE_INDEX.get(ocr_data.get('damage_level'), 0)
             )
         with col2:
             aircraft_out_of_service = st.selectbox(
                 "Aircraft Out of Service?",
-                options=["No", "Yes - Minor (< 24 hours)", "Yes - Significant (1-7 days)", "Yes - Major (> 7 days)"],
+                options=("No", "Yes - Minor (< 24 hours)", "Yes - Significant (1-7 days)", "Yes - Major (> 7 days)"),
                 index=0
             )
         
@@ -1262,7 +1567,7 @@ def render_bird_strike_form():
         with col1:
             estimated_repair_cost = st.selectbox(
                 "Estimated Repair Cost (USD)",
-                options=["Unknown", "< $10,000", "$10,000 - $50,000", "$50,000 - $100,000", "$100,000 - $500,000", "> $500,000"],
+                options=("Unknown", "< $10,000", "$10,000 - $50,000", "$50,000 - $100,000", "$100,000 - $500,000", "> $500,000"),
                 index=0
             )
         with col2:
@@ -1273,27 +1578,25 @@ def render_bird_strike_form():
         with col3:
             maintenance_action = st.selectbox(
                 "Maintenance Action Required",
-                options=["None", "Inspection only", "Minor repair", "Major repair", "Component replacement", "Multiple repairs"],
+                options=("None", "Inspection only", "Minor repair", "Major repair", "Component replacement", "Multiple repairs"),
                 index=0
             )
         
         # ========== SECTION G: EFFECT ON FLIGHT ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section G: Effect on Flight</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section G: Effect on Flight")
         
         col1, col2 = st.columns(2)
         with col1:
             effect_on_flight = st.selectbox(
                 "Effect on Flight *",
                 options=EFFECT_ON_FLIGHT_OPTIONS,
-                index=EFFECT_ON_FLIGHT_OPTIONS.index(ocr_data.get('effect_on_flight', 'None - Flight continued normally')) if ocr_data.get('effect_on_flight') in EFFECT_ON_FLIGHT_OPTIONS else 0
+                index=_EFFECT_ON_FLIGHT_INDEX.get(ocr_data.get('effect_on_flight'), 0)
             )
             
         with col2:
             precautionary_landing = st.selectbox(
                 "Precautionary Landing?",
-                options=["No", "Yes - At destination", "Yes - Diversion", "Yes - Return to departure"],
+                options=("No", "Yes - At destination", "Yes - Diversion", "Yes - Return to departure"),
                 index=0
             )
         
@@ -1301,7 +1604,7 @@ def render_bird_strike_form():
         with col1:
             emergency_declared = st.selectbox(
                 "Emergency Declared?",
-                options=["No", "PAN PAN", "MAYDAY"],
+                options=("No", "PAN PAN", "MAYDAY"),
                 index=0
             )
         with col2:
@@ -1320,9 +1623,7 @@ def render_bird_strike_form():
         )
         
         # ========== SECTION H: CREW INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section H: Crew Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section H: Crew Information")
         
         col1, col2 = st.columns(2)
         with col1:
@@ -1350,20 +1651,18 @@ def render_bird_strike_form():
         
         crew_injuries = st.selectbox(
             "Crew Injuries?",
-            options=["No injuries", "Minor injuries - no medical attention", "Minor injuries - medical attention required", "Serious injuries"],
+            options=("No injuries", "Minor injuries - no medical attention", "Minor injuries - medical attention required", "Serious injuries"),
             index=0
         )
         
         # ========== SECTION I: NOTIFICATIONS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section I: Notifications</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section I: Notifications")
         
         st.markdown("*Select all entities that have been or need to be notified*")
         
         notifications_made = st.multiselect(
             "Notifications Made",
-            options=[
+            options=(
                 "ATC Tower",
                 "Airport Wildlife Control",
                 "Company Operations Control",
@@ -1373,7 +1672,7 @@ def render_bird_strike_form():
                 "Airport Authority",
                 "Insurance Department",
                 "Station Manager"
-            ],
+            ),
             default=["Safety Department", "Company Operations Control"]
         )
         
@@ -1381,20 +1680,18 @@ def render_bird_strike_form():
         with col1:
             atc_informed = st.selectbox(
                 "ATC Informed of Strike?",
-                options=["Yes - Immediately", "Yes - After landing", "No"],
+                options=("Yes - Immediately", "Yes - After landing", "No"),
                 index=0
             )
         with col2:
             wildlife_control_informed = st.selectbox(
                 "Wildlife Control Informed?",
-                options=["Yes", "No", "Not available at airport"],
+                options=("Yes", "No", "Not available at airport"),
                 index=0
             )
         
         # ========== SECTION J: ADDITIONAL INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section J: Narrative & Additional Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section J: Narrative & Additional Information")
         
         narrative = st.text_area(
             "Detailed Narrative of Event *",
@@ -1405,7 +1702,7 @@ def render_bird_strike_form():
         
         contributing_factors = st.multiselect(
             "Contributing Factors (if any)",
-            options=[
+            options=(
                 "Wildlife activity near airport",
                 "Time of day (dawn/dusk)",
                 "Seasonal migration",
@@ -1415,7 +1712,7 @@ def render_bird_strike_form():
                 "Nearby landfill/waste disposal",
                 "Lighting attracting birds",
                 "Other"
-            ],
+            ),
             default=[]
         )
         
@@ -1426,27 +1723,25 @@ def render_bird_strike_form():
         )
         
         # ========== SECTION K: INVESTIGATION STATUS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section K: For Safety Department Use</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section K: For Safety Department Use")
         
         col1, col2, col3 = st.columns(3)
         with col1:
             investigation_status = st.selectbox(
                 "Investigation Status",
-                options=["Open - Pending Review", "Open - Under Investigation", "Closed - No Further Action", "Closed - Corrective Actions Implemented"],
+                options=("Open - Pending Review", "Open - Under Investigation", "Closed - No Further Action", "Closed - Corrective Actions Implemented"),
                 index=0
             )
         with col2:
             assigned_investigator = st.selectbox(
                 "Assigned To",
-                options=["Unassigned", "Safety Manager", "Safety Officer", "Quality Manager", "External Investigator"],
+                options=("Unassigned", "Safety Manager", "Safety Officer", "Quality Manager", "External Investigator"),
                 index=0
             )
         with col3:
             priority_level = st.selectbox(
                 "Priority Level",
-                options=["Low", "Medium", "High", "Critical"],
+                options=("Low", "Medium", "High", "Critical"),
                 index=1
             )
         
@@ -1471,31 +1766,19 @@ def render_bird_strike_form():
         
         if submitted:
             # Validation
-            errors = []
-            if not flight_number:
-                errors.append("Flight Number is required")
-            if not aircraft_reg:
-                errors.append("Aircraft Registration is required")
-            if not captain_name:
-                errors.append("Captain Name is required")
-            if not narrative:
-                errors.append("Detailed Narrative is required")
-            if not parts_struck:
-                errors.append("At least one part struck must be selected")
+            errors = [message for value, message in (
+                (flight_number, "Flight Number is required"),
+                (aircraft_reg, "Aircraft Registration is required"),
+                (captain_name, "Captain Name is required"),
+                (narrative, "Detailed Narrative is required"),
+                (parts_struck, "At least one part struck must be selected"),
+            ) if not value]
             
             if errors:
-                for error in errors:
-                    st.error(f"❌ {error}")
+                render_validation_errors(errors)
             else:
                 # Calculate risk level based on damage
-                if damage_level in ["Destroyed", "Substantial"]:
-                    risk_level = "Extreme"
-                elif damage_level in ["Major", "Minor - Confirmed"]:
-                    risk_level = "High"
-                elif damage_level == "Minor - Unconfirmed":
-                    risk_level = "Medium"
-                else:
-                    risk_level = "Low"
+                risk_level = _BIRD_DAMAGE_RISK.get(damage_level, "Low")
                 
                 # Create report record
                 report_data = {
@@ -1507,10 +1790,10 @@ def render_bird_strike_form():
                     'flight_number': flight_number,
                     'aircraft_reg': aircraft_reg,
                     'aircraft_type': aircraft_type,
-                    'origin': origin_airport.split(' - ')[0] if origin_airport else '',
-                    'destination': destination_airport.split(' - ')[0] if destination_airport else '',
+                    'origin': airport_code(origin_airport),
+                    'destination': airport_code(destination_airport),
                     'flight_phase': flight_phase,
-                    'strike_location': strike_airport.split(' - ')[0] if strike_airport else '',
+                    'strike_location': airport_code(strike_airport),
                     'altitude_agl': altitude_agl,
                     'altitude_msl': altitude_msl,
                     'indicated_speed': indicated_speed,
@@ -1565,30 +1848,25 @@ def render_bird_strike_form():
                     report_data['report_number'] = incident_id # Store your custom ID in a specific column
                     
                     response = supabase.table('bird_strikes').insert(report_data).execute()
-                    st.balloons()
-                    st.success(f"✅ Bird Strike Report Saved to Database! Ref: {incident_id}")
+                    get_db_report_counts.clear()  # the new report shows in the dashboard counters at once
                 except Exception as e:
                     st.error(f"Database Error: {e}")
-
-                # Clear OCR data
-                st.session_state['ocr_data_bird_strike'] = None
-                
-                # Clear OCR data
-                st.session_state['ocr_data_bird_strike'] = None
-                
-                # Success feedback
-                st.balloons()
-                st.success(f"""
-                    ✅ **Bird Strike Report Submitted Successfully!**
-                    
-                    **Reference:** {incident_id}  
-                    **Risk Level:** {risk_level}  
-                    **Status:** {investigation_status}
+                else:
+                    # Clear OCR data
+                    st.session_state['ocr_data_bird_strike'] = None
                     
-                    The report has been added to the system and is now visible in View Reports.
-                """)
+                    _release_form_ref("BS")  # next report gets a fresh reference
+                    # Reset the form: drop keyed widget state and render a new form generation
+                    for key in ("bs_origin", "bs_dest", "bird_strike_attachments"):
+                        st.session_state.pop(key, None)
+                    st.session_state['bird_strike_form_generation'] = form_generation + 1
+                    st.session_state['bird_strike_submitted'] = {
+                        'reference': incident_id, 'risk_level': risk_level, 'status': investigation_status,
+                    }
+                    st.rerun()
 
 
+@st.fragment
 def render_laser_strike_form():
     """
     Complete Laser Strike/Illumination Report Form
@@ -1613,33 +1891,16 @@ def render_laser_strike_form():
     with st.form("laser_strike_form", clear_on_submit=False):
         
         # ========== SECTION A: INCIDENT IDENTIFICATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section A: Incident Identification</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section A: Incident Identification")
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            incident_id = st.text_input(
-                "Incident Reference Number",
-                value=f"LS-{datetime.now().strftime('%Y%m%d')}-{random.randint(100, 999)}",
-                disabled=True
-            )
-        with col2:
-            incident_date = st.date_input(
-                "Date of Incident *",
-                value=datetime.strptime(ocr_data.get('incident_date', date.today().isoformat()), '%Y-%m-%d').date() if ocr_data.get('incident_date') else date.today()
-            )
-        with col3:
-            incident_time = st.time_input(
-                "Time of Incident (UTC) *",
-                value=datetime.strptime(ocr_data.get('incident_time', '12:00'), '%H:%M').time() if ocr_data.get('incident_time') else datetime.now().time()
-            )
+        incident_id, incident_date, incident_time = _render_incident_timing("ls", ocr_data)
         
         col1, col2 = st.columns(2)
         with col1:
             local_time = st.time_input(
                 "Local Time of Incident",
-                value=datetime.now().time()
+                value=datetime.now().time(),
+                key="ls_local_time"
             )
         with col2:
             reported_by = st.text_input(
@@ -1648,71 +1909,17 @@ def render_laser_strike_form():
             )
         
         # ========== SECTION B: FLIGHT INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section B: Flight Information</div>
-        </div>""", unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            flight_number = st.text_input(
-                "Flight Number *",
-                value=ocr_data.get('flight_number', ''),
-                placeholder="e.g., PF-101"
-            )
-        with col2:
-            # Create a clean list of options first
-            fleet_options = [""] + list(AIRCRAFT_FLEET.keys())
-            
-            # Find the correct index safely
-            default_index = 0
-            if ocr_data.get('aircraft_reg') in fleet_options:
-                default_index = fleet_options.index(ocr_data['aircraft_reg'])
-
-            aircraft_reg = st.selectbox(
-                "Aircraft Registration *",
-                options=fleet_options,
-                index=default_index
-            )
-        with col3:
-            aircraft_type = st.text_input(
-                "Aircraft Type",
-                value=AIRCRAFT_FLEET.get(aircraft_reg, {}).get("type", ""),
-                disabled=True
-            )
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            origin_airport = st.selectbox(
-                "Origin Airport *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
-                index=0,
-                key="ls_origin"
-            )
-        with col2:
-            destination_airport = st.selectbox(
-                "Destination Airport *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
-                index=0,
-                key="ls_dest"
-            )
-        with col3:
-            flight_phase = st.selectbox(
-                "Phase of Flight *",
-                options=FLIGHT_PHASES,
-                index=FLIGHT_PHASES.index(ocr_data.get('flight_phase', 'Approach')) if ocr_data.get('flight_phase') in FLIGHT_PHASES else 6,
-                key="ls_phase"
-            )
+        (flight_number, aircraft_reg, aircraft_type,
+         origin_airport, destination_airport, flight_phase) = _render_flight_info_section("ls", ocr_data)
         
         # ========== SECTION C: LOCATION OF INCIDENT ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section C: Location of Incident</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section C: Location of Incident")
         
         col1, col2, col3 = st.columns(3)
         with col1:
             incident_airport = st.selectbox(
                 "Nearest Airport",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
+                options=AIRPORT_SELECT_OPTIONS,
                 index=0,
                 key="ls_airport"
             )
@@ -1742,12 +1949,14 @@ def render_laser_strike_form():
                 min_value=0,
                 max_value=360,
                 value=0,
-                step=5
+                step=5,
+                key="ls_heading"
             )
         with col2:
             position_description = st.text_input(
                 "Position Description",
-                placeholder="e.g., 5nm final RWY 36L, over residential area"
+                placeholder="e.g., 5nm final RWY 36L, over residential area",
+                key="ls_position_description"
             )
         
         st.markdown("**GPS Coordinates (if known)**")
@@ -1755,43 +1964,26 @@ def render_laser_strike_form():
         with col1:
             latitude = st.text_input(
                 "Latitude",
-                placeholder="e.g., 32.5150° N"
+                placeholder="e.g., 32.5150° N",
+                key="ls_latitude"
             )
         with col2:
             longitude = st.text_input(
                 "Longitude",
-                placeholder="e.g., 74.5361° E"
+                placeholder="e.g., 74.5361° E",
+                key="ls_longitude"
             )
         
         # ========== SECTION D: LASER CHARACTERISTICS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section D: Laser Characteristics</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section D: Laser Characteristics")
         
         col1, col2, col3 = st.columns(3)
         with col1:
             laser_color = st.selectbox(
                 "Laser Color *",
-                options=[c[0] for c in LASER_COLORS],
-                index=[c[0] for c in LASER_COLORS].index(ocr_data.get('laser_color', 'Green')) if ocr_data.get('laser_color') in [c[0] for c in LASER_COLORS] else 0
+                options=LASER_COLORS,
+                index=_LASER_COLOR_INDEX.get(ocr_data.get('laser_color'), 0)
             )
-        with col2:
-            number_of_lasers = st.number_input(
-                "Number of Laser Sources",
-                min_value=1,
-                max_value=10,
-                value=int(ocr_data.get('number_of_lasers', 1)),
-                step=1
-            )
-        with col3:
-            laser_movement = st.selectbox(
-                "Laser Movement Pattern",
-                options=["Steady/Fixed", "Sweeping", "Tracking aircraft", "Random/Erratic", "Multiple patterns"],
-                index=0
-            )
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
             duration_seconds = st.number_input(
                 "Duration of Exposure (seconds) *",
                 min_value=1,
@@ -1800,34 +1992,48 @@ def render_laser_strike_form():
                 step=1
             )
         with col2:
+            number_of_lasers = st.number_input(
+                "Number of Laser Sources",
+                min_value=1,
+                max_value=10,
+                value=int(ocr_data.get('number_of_lasers', 1)),
+                step=1
+            )
             intensity = st.selectbox(
                 "Perceived Intensity *",
-                options=["Low - Visible but not distracting", "Medium - Distracting", "High - Temporarily blinding", "Extreme - Severe visual impairment"],
-                index=1
+                options=_LASER_INTENSITY_OPTIONS,
+                index=1,
+                key="ls_intensity"
             )
         with col3:
+            laser_movement = st.selectbox(
+                "Laser Movement Pattern",
+                options=("Steady/Fixed", "Sweeping", "Tracking aircraft", "Random/Erratic", "Multiple patterns"),
+                index=0,
+                key="ls_laser_movement"
+            )
             source_direction = st.selectbox(
                 "Direction of Laser Source",
-                options=["Ahead", "Left", "Right", "Below", "Behind", "Multiple directions", "Unable to determine"],
-                index=0
+                options=("Ahead", "Left", "Right", "Below", "Behind", "Multiple directions", "Unable to determine"),
+                index=0,
+                key="ls_source_direction"
             )
         
         estimated_distance = st.selectbox(
             "Estimated Distance to Laser Source",
-            options=["< 1 km", "1-3 km", "3-5 km", "5-10 km", "> 10 km", "Unable to estimate"],
-            index=2
+            options=("< 1 km", "1-3 km", "3-5 km", "5-10 km", "> 10 km", "Unable to estimate"),
+            index=2,
+            key="ls_estimated_distance"
         )
         
         # ========== SECTION E: CREW EFFECTS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section E: Crew Effects</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section E: Crew Effects")
         
         st.markdown("*Select all effects experienced by crew members*")
         
         crew_effects = st.multiselect(
             "Crew Effects *",
-            options=[
+            options=(
                 "No effect",
                 "Distraction",
                 "Glare - Reduced visibility",
@@ -1838,7 +2044,7 @@ def render_laser_strike_form():
                 "Disorientation",
                 "Startle/Surprise",
                 "Difficulty reading instruments"
-            ],
+            ),
             default=ocr_data.get('crew_effects', ['Distraction']) if isinstance(ocr_data.get('crew_effects'), list) else ['Distraction']
         )
         
@@ -1846,57 +2052,59 @@ def render_laser_strike_form():
         with col1:
             pilot_flying_affected = st.selectbox(
                 "Pilot Flying (PF) Affected?",
-                options=["No", "Yes - Minor", "Yes - Moderate", "Yes - Severe"],
-                index=0
+                options=("No", "Yes - Minor", "Yes - Moderate", "Yes - Severe"),
+                index=0,
+                key="ls_pilot_flying_affected"
             )
         with col2:
             pilot_monitoring_affected = st.selectbox(
                 "Pilot Monitoring (PM) Affected?",
-                options=["No", "Yes - Minor", "Yes - Moderate", "Yes - Severe"],
-                index=0
+                options=("No", "Yes - Minor", "Yes - Moderate", "Yes - Severe"),
+                index=0,
+                key="ls_pilot_monitoring_affected"
             )
         
         recovery_time = st.selectbox(
             "Time to Recover Normal Vision",
-            options=["Immediate (< 10 seconds)", "Short (10-30 seconds)", "Moderate (30 seconds - 2 minutes)", "Extended (2-5 minutes)", "Prolonged (> 5 minutes)", "Still experiencing effects"],
-            index=0
+            options=("Immediate (< 10 seconds)", "Short (10-30 seconds)", "Moderate (30 seconds - 2 minutes)", "Extended (2-5 minutes)", "Prolonged (> 5 minutes)", "Still experiencing effects"),
+            index=0,
+            key="ls_recovery_time"
         )
         
         # ========== SECTION F: MEDICAL ASSESSMENT ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section F: Medical Assessment</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section F: Medical Assessment")
         
         col1, col2 = st.columns(2)
         with col1:
             medical_attention = st.selectbox(
                 "Medical Attention Required? *",
-                options=["No", "Yes - First aid only", "Yes - Medical examination", "Yes - Hospital treatment", "Pending evaluation"],
-                index=0
+                options=("No", "Yes - First aid only", "Yes - Medical examination", "Yes - Hospital treatment", "Pending evaluation"),
+                index=0,
+                key="ls_medical_attention"
             )
         with col2:
             symptoms_persistent = st.selectbox(
                 "Persistent Symptoms?",
-                options=["No", "Yes - Resolved within 24 hours", "Yes - Ongoing", "Under medical observation"],
-                index=0
+                options=("No", "Yes - Resolved within 24 hours", "Yes - Ongoing", "Under medical observation"),
+                index=0,
+                key="ls_symptoms_persistent"
             )
         
         medical_details = st.text_area(
             "Medical Details (if applicable)",
             placeholder="Describe any medical symptoms, treatment received, or ongoing concerns...",
-            height=80
+            height=80,
+            key="ls_medical_details"
         )
         
         # ========== SECTION G: EFFECT ON FLIGHT ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section G: Effect on Flight Operations</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section G: Effect on Flight Operations")
         
         col1, col2 = st.columns(2)
         with col1:
             effect_on_flight = st.selectbox(
                 "Effect on Flight *",
-                options=[
+                options=(
                     "None - Continued normally",
                     "Minor - Increased vigilance",
                     "Moderate - Temporary loss of visual reference",
@@ -1905,69 +2113,67 @@ def render_laser_strike_form():
                     "Severe - Go-around executed",
                     "Severe - Flight diverted",
                     "Critical - Emergency declared"
-                ],
-                index=0
-            )
-        with col2:
-            approach_disrupted = st.selectbox(
-                "Approach/Landing Disrupted?",
-                options=["No", "Yes - Stabilized approach affected", "Yes - Go-around required", "Yes - Diversion required"],
-                index=0
+                ),
+                index=0,
+                key="ls_effect_on_flight"
             )
-        
-        col1, col2 = st.columns(2)
-        with col1:
             emergency_declared = st.selectbox(
                 "Emergency Declared?",
-                options=["No", "PAN PAN", "MAYDAY"],
+                options=("No", "PAN PAN", "MAYDAY"),
                 index=0,
                 key="ls_emergency"
             )
         with col2:
+            approach_disrupted = st.selectbox(
+                "Approach/Landing Disrupted?",
+                options=("No", "Yes - Stabilized approach affected", "Yes - Go-around required", "Yes - Diversion required"),
+                index=0,
+                key="ls_approach_disrupted"
+            )
             autopilot_used = st.selectbox(
                 "Autopilot Engagement?",
-                options=["Already engaged", "Engaged due to incident", "Not engaged", "Disconnected for landing"],
-                index=0
+                options=("Already engaged", "Engaged due to incident", "Not engaged", "Disconnected for landing"),
+                index=0,
+                key="ls_autopilot_used"
             )
         
-        # ========== SECTION H: NOTIFICATIONS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section H: Notifications</div>
-        </div>""", unsafe_allow_html=True)
-        
-        notifications_made = st.multiselect(
-            "Notifications Made",
-            options=[
-                "ATC Tower",
-                "ATC Approach",
-                "Company Operations Control",
-                "Safety Department",
-                "PCAA (Civil Aviation Authority)",
-                "Airport Security",
-                "Local Police/Law Enforcement",
-                "Station Manager"
-            ],
-            default=["ATC Tower", "Safety Department"]
-        )
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            atc_notified = st.selectbox(
-                "ATC Notified?",
-                options=["Yes - During event", "Yes - After landing", "No"],
-                index=0
-            )
-        with col2:
-            police_notified = st.selectbox(
-                "Police/Authorities Notified?",
-                options=["Yes", "No", "Pending", "Not applicable"],
-                index=1
-            )
+        # ========== SECTION H: NOTIFICATIONS ==========
+        with st.expander("Section H: Notifications", expanded=False):
+        
+            notifications_made = st.multiselect(
+                "Notifications Made",
+                options=(
+                    "ATC Tower",
+                    "ATC Approach",
+                    "Company Operations Control",
+                    "Safety Department",
+                    "PCAA (Civil Aviation Authority)",
+                    "Airport Security",
+                    "Local Police/Law Enforcement",
+                    "Station Manager"
+                ),
+                default=["ATC Tower", "Safety Department"],
+                key="ls_notifications_made"
+            )
+        
+            col1, col2 = st.columns(2)
+            with col1:
+                atc_notified = st.selectbox(
+                    "ATC Notified?",
+                    options=("Yes - During event", "Yes - After landing", "No"),
+                    index=0,
+                    key="ls_atc_notified"
+                )
+            with col2:
+                police_notified = st.selectbox(
+                    "Police/Authorities Notified?",
+                    options=("Yes", "No", "Pending", "Not applicable"),
+                    index=1,
+                    key="ls_police_notified"
+                )
         
         # ========== SECTION I: NARRATIVE ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section I: Narrative & Additional Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section I: Narrative & Additional Information")
         
         narrative = st.text_area(
             "Detailed Narrative of Event *",
@@ -1993,45 +2199,44 @@ def render_laser_strike_form():
         witness_information = st.text_area(
             "Witness Information (if any)",
             placeholder="Details of any witnesses, cabin crew observations, passenger reports...",
-            height=60
+            height=60,
+            key="ls_witness_information"
         )
         
         # ========== SECTION J: INVESTIGATION STATUS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section J: For Safety Department Use</div>
-        </div>""", unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            investigation_status = st.selectbox(
-                "Investigation Status",
-                options=["Open - Pending Review", "Open - Under Investigation", "Referred to Authorities", "Closed - No Further Action", "Closed - Corrective Actions"],
-                index=0,
-                key="ls_status"
-            )
-        with col2:
-            assigned_investigator = st.selectbox(
-                "Assigned To",
-                options=["Unassigned", "Safety Manager", "Safety Officer", "Quality Manager", "Security Department"],
-                index=0,
-                key="ls_assigned"
-            )
-        with col3:
-            priority_level = st.selectbox(
-                "Priority Level",
-                options=["Low", "Medium", "High", "Critical"],
-                index=1 if "High" not in intensity else 2,
-                key="ls_priority"
-            )
+        with st.expander("Section J: For Safety Department Use", expanded=False):
+        
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                investigation_status = st.selectbox(
+                    "Investigation Status",
+                    options=("Open - Pending Review", "Open - Under Investigation", "Referred to Authorities", "Closed - No Further Action", "Closed - Corrective Actions"),
+                    index=0,
+                    key="ls_status"
+                )
+            with col2:
+                assigned_investigator = st.selectbox(
+                    "Assigned To",
+                    options=("Unassigned", "Safety Manager", "Safety Officer", "Quality Manager", "Security Department"),
+                    index=0,
+                    key="ls_assigned"
+                )
+            with col3:
+                priority_level = st.selectbox(
+                    "Priority Level",
+                    options=("Low", "Medium", "High", "Critical"),
+                    index=1 if "High" not in intensity else 2,
+                    key="ls_priority"
+                )
         
         # Photo/Document Upload
-        st.markdown("#### 📎 Attachments")
-        uploaded_files = st.file_uploader(
-            "Upload Photos/Documents",
-            type=['png', 'jpg', 'jpeg', 'pdf', 'doc', 'docx'],
-            accept_multiple_files=True,
-            key="laser_strike_attachments"
-        )
+        with st.expander("📎 Attachments", expanded=False):
+            uploaded_files = st.file_uploader(
+                "Upload Photos/Documents",
+                type=['png', 'jpg', 'jpeg', 'pdf', 'doc', 'docx'],
+                accept_multiple_files=True,
+                key="laser_strike_attachments"
+            )
         
         # Form submission
         st.markdown("---")
@@ -2045,31 +2250,22 @@ def render_laser_strike_form():
         
         if submitted:
             # Validation
-            errors = []
-            if not flight_number:
-                errors.append("Flight Number is required")
-            if not aircraft_reg:
-                errors.append("Aircraft Registration is required")
-            if not captain_name:
-                errors.append("Captain Name is required")
-            if not narrative:
-                errors.append("Detailed Narrative is required")
-            if not crew_effects or "No effect" in crew_effects and len(crew_effects) == 1:
-                pass  # Allow no effect
+            errors = [message for value, message in (
+                (flight_number, "Flight Number is required"),
+                (aircraft_reg, "Aircraft Registration is required"),
+                (captain_name, "Captain Name is required"),
+                (narrative, "Detailed Narrative is required"),
+            ) if not value]
             
             if errors:
-                for error in errors:
-                    st.error(f"❌ {error}")
+                render_validation_errors(errors)
             else:
                 # Calculate risk level
-                if "Extreme" in intensity or medical_attention not in ["No", "Yes - First aid only"]:
-                    risk_level = "Extreme"
-                elif "High" in intensity or emergency_declared != "No":
-                    risk_level = "High"
-                elif "Medium" in intensity:
-                    risk_level = "Medium"
-                else:
-                    risk_level = "Low"
+                risk_level = _LASER_RISK_LEVELS[max(
+                    _LASER_INTENSITY_TIER.get(intensity, 0),
+                    _LASER_MEDICAL_TIER.get(medical_attention, 3),
+                    _LASER_EMERGENCY_TIER.get(emergency_declared, 2),
+                )]
                 
                 # Create report record
                 report_data = {
@@ -2081,10 +2277,10 @@ def render_laser_strike_form():
                     'flight_number': flight_number,
                     'aircraft_reg': aircraft_reg,
                     'aircraft_type': aircraft_type,
-                    'origin': origin_airport.split(' - ')[0] if origin_airport else '',
-                    'destination': destination_airport.split(' - ')[0] if destination_airport else '',
+                    'origin': airport_code(origin_airport),
+                    'destination': airport_code(destination_airport),
                     'flight_phase': flight_phase,
-                    'incident_airport': incident_airport.split(' - ')[0] if incident_airport else '',
+                    'incident_airport': airport_code(incident_airport),
                     'altitude_agl': altitude_agl,
                     'indicated_speed': indicated_speed,
                     'heading': heading,
@@ -2129,28 +2325,32 @@ def render_laser_strike_form():
                 try:
                     # Save to database
                     report_data['report_number'] = incident_id
-                    response = supabase.table('laser_strikes').insert(report_data).execute()
-                    st.balloons()
-                    st.success(f"✅ Laser Strike Report Saved to Database! Ref: {incident_id}")
+                    report_data['submission_id'] = _form_submission_id("LS")
+                    report_data['attachment_paths'], uploads = upload_attachments(
+                        'laser-strikes', f"{incident_id}/{report_data['submission_id']}", uploaded_files)
+                    insert_queued('laser_strikes', report_data, wait_for=uploads)
                 except Exception as e:
                     st.error(f"Database Error: {e}")
-
-                # Clear OCR data
-                st.session_state['ocr_data_laser_strike'] = None
-                
-                # Success feedback
-                st.balloons()
-                st.success(f"""
-                    ✅ **Laser Strike Report Submitted Successfully!**
+                else:
+                    # Clear OCR data
+                    st.session_state['ocr_data_laser_strike'] = None
+                    
+                    _release_form_ref("LS")  # next report gets a fresh reference
+                    # Success feedback
+                    if st.session_state.get('enable_animations', False):
+                        st.balloons()
+                    st.success(f"""
+                        ✅ **Laser Strike Report Submitted Successfully!**
                     
-                    **Reference:** {incident_id}  
-                    **Risk Level:** {risk_level}  
-                    **Status:** {investigation_status}
+                        **Reference:** {incident_id}  
+                        **Risk Level:** {risk_level}  
+                        **Status:** {investigation_status}
                     
-                    The report has been added to the system and is now visible in View Reports.
-                """)
+                        The report has been added to the system and is now visible in View Reports.
+                    """)
 
 
+@st.fragment
 def render_tcas_report_form():
     """
     Complete TCAS/Airborne Conflict Report Form
@@ -2175,29 +2375,9 @@ def render_tcas_report_form():
     with st.form("tcas_report_form", clear_on_submit=False):
         
         # ========== SECTION A: INCIDENT IDENTIFICATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section A: Incident Identification</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section A: Incident Identification")
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            incident_id = st.text_input(
-                "Incident Reference Number",
-                value=f"TCAS-{datetime.now().strftime('%Y%m%d')}-{random.randint(100, 999)}",
-                disabled=True
-            )
-        with col2:
-            incident_date = st.date_input(
-                "Date of Incident *",
-                value=datetime.strptime(ocr_data.get('incident_date', date.today().isoformat()), '%Y-%m-%d').date() if ocr_data.get('incident_date') else date.today(),
-                key="tcas_date"
-            )
-        with col3:
-            incident_time = st.time_input(
-                "Time of Incident (UTC) *",
-                value=datetime.strptime(ocr_data.get('incident_time', '12:00'), '%H:%M').time() if ocr_data.get('incident_time') else datetime.now().time(),
-                key="tcas_time"
-            )
+        incident_id, incident_date, incident_time = _render_incident_timing("tcas", ocr_data)
         
         col1, col2 = st.columns(2)
         with col1:
@@ -2215,81 +2395,28 @@ def render_tcas_report_form():
             )
         
         # ========== SECTION B: OWN AIRCRAFT INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section B: Own Aircraft Information</div>
-        </div>""", unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            flight_number = st.text_input(
-                "Flight Number *",
-                value=ocr_data.get('flight_number', ''),
-                placeholder="e.g., PF-101",
-                key="tcas_flight"
-            )
-        with col2:
-            # Create a clean list of options first
-            fleet_options = [""] + list(AIRCRAFT_FLEET.keys())
-            
-            # Find the correct index safely
-            default_index = 0
-            if ocr_data.get('aircraft_reg') in fleet_options:
-                default_index = fleet_options.index(ocr_data['aircraft_reg'])
-
-            aircraft_reg = st.selectbox(
-                "Aircraft Registration *",
-                options=fleet_options,
-                index=default_index
-            )
-        with col3:
-            aircraft_type = st.text_input(
-                "Aircraft Type",
-                value=AIRCRAFT_FLEET.get(aircraft_reg, {}).get("type", ""),
-                disabled=True,
-                key="tcas_type"
-            )
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            origin_airport = st.selectbox(
-                "Origin Airport *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
-                index=0,
-                key="tcas_origin"
-            )
-        with col2:
-            destination_airport = st.selectbox(
-                "Destination Airport *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
-                index=0,
-                key="tcas_dest"
-            )
-        with col3:
-            flight_phase = st.selectbox(
-                "Phase of Flight *",
-                options=FLIGHT_PHASES,
-                index=FLIGHT_PHASES.index(ocr_data.get('flight_phase', 'Cruise')) if ocr_data.get('flight_phase') in FLIGHT_PHASES else 10,
-                key="tcas_phase"
-            )
+        (flight_number, aircraft_reg, aircraft_type,
+         origin_airport, destination_airport, flight_phase) = _render_flight_info_section(
+            "tcas", ocr_data, title="Section B: Own Aircraft Information", default_phase=10)
         
         col1, col2 = st.columns(2)
         with col1:
             flight_rules = st.selectbox(
                 "Flight Rules",
-                options=["IFR", "VFR", "SVFR"],
-                index=0
+                options=("IFR", "VFR", "SVFR"),
+                index=0,
+                key="tcas_flight_rules"
             )
         with col2:
             transponder_mode = st.selectbox(
                 "Transponder Mode",
-                options=["Mode S", "Mode C", "Mode A", "ADS-B Out"],
-                index=0
+                options=("Mode S", "Mode C", "Mode A", "ADS-B Out"),
+                index=0,
+                key="tcas_transponder_mode"
             )
         
         # ========== SECTION C: POSITION AT TIME OF EVENT ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section C: Position at Time of Event</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section C: Position at Time of Event")
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -2328,7 +2455,8 @@ def render_tcas_report_form():
                 max_value=6000,
                 value=0,
                 step=100,
-                help="Positive = climbing, Negative = descending"
+                help="Positive = climbing, Negative = descending",
+                key="tcas_vertical_rate"
             )
         with col2:
             position_description = st.text_input(
@@ -2353,30 +2481,31 @@ def render_tcas_report_form():
             )
         
         # ========== SECTION D: TCAS ALERT INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section D: TCAS Alert Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section D: TCAS Alert Information")
         
         col1, col2 = st.columns(2)
         with col1:
             tcas_alert_type = st.selectbox(
                 "Type of TCAS Alert *",
                 options=TCAS_ALERT_TYPES,
-                index=TCAS_ALERT_TYPES.index(ocr_data.get('tcas_alert_type', 'RA - Climb')) if ocr_data.get('tcas_alert_type') in TCAS_ALERT_TYPES else 0
+                index=_TCAS_ALERT_INDEX.get(ocr_data.get('tcas_alert_type'), 0)
             )
+            is_ra = tcas_alert_type in _TCAS_RA_ALERTS
         with col2:
             ra_sense = st.selectbox(
                 "RA Sense (if RA)",
-                options=["N/A - TA only", "Climb", "Descend", "Level Off", "Adjust Vertical Speed", "Crossing Climb", "Crossing Descend", "Reversal"],
-                index=0
+                options=("N/A - TA only", "Climb", "Descend", "Level Off", "Adjust Vertical Speed", "Crossing Climb", "Crossing Descend", "Reversal"),
+                index=0,
+                key="tcas_ra_sense"
             )
         
         col1, col2, col3 = st.columns(3)
         with col1:
             ra_complied = st.selectbox(
                 "RA Complied With?",
-                options=["Yes - Fully", "Yes - Partially", "No", "N/A - TA only"],
-                index=0
+                options=("Yes - Fully", "Yes - Partially", "No", "N/A - TA only"),
+                index=0,
+                key="tcas_ra_complied"
             )
         with col2:
             time_to_cpa = st.number_input(
@@ -2385,7 +2514,8 @@ def render_tcas_report_form():
                 max_value=120,
                 value=30,
                 step=5,
-                help="Closest Point of Approach"
+                help="Closest Point of Approach",
+                key="tcas_time_to_cpa"
             )
         with col3:
             ra_duration = st.number_input(
@@ -2393,75 +2523,81 @@ def render_tcas_report_form():
                 min_value=0,
                 max_value=120,
                 value=15,
-                step=5
+                step=5,
+                key="tcas_ra_duration"
             )
         
         tcas_system_status = st.selectbox(
             "TCAS System Status",
-            options=["Normal - Full functionality", "TA Only mode", "Degraded performance", "System fault during event"],
-            index=0
+            options=("Normal - Full functionality", "TA Only mode", "Degraded performance", "System fault during event"),
+            index=0,
+            key="tcas_tcas_system_status"
         )
         
         # ========== SECTION E: TRAFFIC INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section E: Traffic (Intruder) Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section E: Traffic (Intruder) Information")
         
         col1, col2 = st.columns(2)
         with col1:
             traffic_type = st.selectbox(
                 "Traffic Type",
-                options=["Commercial - Airline", "Commercial - Cargo", "General Aviation", "Military", "Helicopter", "Unknown", "Multiple aircraft"],
-                index=0
+                options=("Commercial - Airline", "Commercial - Cargo", "General Aviation", "Military", "Helicopter", "Unknown", "Multiple aircraft"),
+                index=0,
+                key="tcas_traffic_type"
             )
         with col2:
             traffic_callsign = st.text_input(
                 "Traffic Callsign (if known)",
-                placeholder="e.g., ABC123"
+                placeholder="e.g., ABC123",
+                key="tcas_traffic_callsign"
             )
         
         col1, col2, col3 = st.columns(3)
         with col1:
             traffic_altitude = st.text_input(
                 "Traffic Altitude",
-                placeholder="e.g., FL350, 35000ft"
+                placeholder="e.g., FL350, 35000ft",
+                key="tcas_traffic_altitude"
             )
         with col2:
             traffic_heading = st.text_input(
                 "Traffic Heading (if known)",
-                placeholder="e.g., 270°"
+                placeholder="e.g., 270°",
+                key="tcas_traffic_heading"
             )
         with col3:
             traffic_type_ac = st.text_input(
                 "Traffic Aircraft Type (if known)",
-                placeholder="e.g., B737, A320"
+                placeholder="e.g., B737, A320",
+                key="tcas_traffic_type_ac"
             )
         
         col1, col2 = st.columns(2)
         with col1:
             traffic_position = st.selectbox(
                 "Traffic Position (Clock Position)",
-                options=["12 o'clock", "1 o'clock", "2 o'clock", "3 o'clock", "4 o'clock", "5 o'clock", 
-                        "6 o'clock", "7 o'clock", "8 o'clock", "9 o'clock", "10 o'clock", "11 o'clock", "Unknown"],
-                index=0
+                options=("12 o'clock", "1 o'clock", "2 o'clock", "3 o'clock", "4 o'clock", "5 o'clock", 
+                        "6 o'clock", "7 o'clock", "8 o'clock", "9 o'clock", "10 o'clock", "11 o'clock", "Unknown"),
+                index=0,
+                key="tcas_traffic_position"
             )
         with col2:
             traffic_aspect = st.selectbox(
                 "Traffic Aspect",
-                options=["Head-on", "Converging from left", "Converging from right", "Overtaking", "Being overtaken", "Parallel", "Crossing", "Unknown"],
-                index=0
+                options=("Head-on", "Converging from left", "Converging from right", "Overtaking", "Being overtaken", "Parallel", "Crossing", "Unknown"),
+                index=0,
+                key="tcas_traffic_aspect"
             )
         
         traffic_visual = st.selectbox(
             "Traffic Visually Acquired?",
-            options=["Yes - Before alert", "Yes - During alert", "Yes - After alert", "No - Never sighted", "Partial - Lost in clouds"],
-            index=0
+            options=("Yes - Before alert", "Yes - During alert", "Yes - After alert", "No - Never sighted", "Partial - Lost in clouds"),
+            index=0,
+            key="tcas_traffic_visual"
         )
         
         # ========== SECTION F: SEPARATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section F: Minimum Separation</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section F: Minimum Separation")
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -2486,60 +2622,63 @@ def render_tcas_report_form():
                 min_value=0.0,
                 max_value=20.0,
                 value=0.0,
-                step=0.1
+                step=0.1,
+                key="tcas_slant_range"
             )
         
         separation_confidence = st.selectbox(
             "Confidence in Separation Estimate",
-            options=["High - TCAS/radar data", "Medium - Visual estimate", "Low - Uncertain"],
-            index=0
+            options=("High - TCAS/radar data", "Medium - Visual estimate", "Low - Uncertain"),
+            index=0,
+            key="tcas_separation_confidence"
         )
         
         # ========== SECTION G: ATC COORDINATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section G: ATC Coordination</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section G: ATC Coordination")
         
         col1, col2 = st.columns(2)
         with col1:
             atc_unit = st.text_input(
                 "ATC Unit",
-                placeholder="e.g., Lahore Approach, Karachi Control"
+                placeholder="e.g., Lahore Approach, Karachi Control",
+                key="tcas_atc_unit"
             )
         with col2:
             atc_frequency = st.text_input(
                 "ATC Frequency",
-                placeholder="e.g., 119.1 MHz"
+                placeholder="e.g., 119.1 MHz",
+                key="tcas_atc_frequency"
             )
         
         col1, col2 = st.columns(2)
         with col1:
             atc_clearance = st.selectbox(
                 "ATC Clearance at Time of Event",
-                options=["Maintain altitude", "Climbing", "Descending", "Radar vectors", "Own navigation", "Visual approach", "Unknown/Not in contact"],
-                index=0
+                options=("Maintain altitude", "Climbing", "Descending", "Radar vectors", "Own navigation", "Visual approach", "Unknown/Not in contact"),
+                index=0,
+                key="tcas_atc_clearance"
             )
         with col2:
             atc_informed = st.selectbox(
                 "ATC Informed of RA?",
-                options=["Yes - During event", "Yes - After event", "No", "N/A - TA only"],
-                index=0
+                options=("Yes - During event", "Yes - After event", "No", "N/A - TA only"),
+                index=0,
+                key="tcas_atc_informed"
             )
         
         atc_instructions = st.text_area(
             "ATC Instructions Received (if any)",
             placeholder="Detail any traffic advisories or instructions from ATC...",
-            height=60
+            height=60,
+            key="tcas_atc_instructions"
         )
         
         # ========== SECTION H: CREW ACTIONS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section H: Crew Actions</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section H: Crew Actions")
         
         crew_actions = st.multiselect(
             "Crew Actions Taken",
-            options=[
+            options=(
                 "Followed RA guidance",
                 "Visual acquisition attempted",
                 "Reported to ATC",
@@ -2551,8 +2690,9 @@ def render_tcas_report_form():
                 "Flight director followed",
                 "Evasive maneuver beyond RA",
                 "No action required (TA only)"
-            ],
-            default=["Followed RA guidance", "Reported to ATC"]
+            ),
+            default=["Followed RA guidance", "Reported to ATC"],
+            key="tcas_crew_actions"
         )
         
         col1, col2 = st.columns(2)
@@ -2571,14 +2711,13 @@ def render_tcas_report_form():
         
         pilot_flying = st.selectbox(
             "Pilot Flying (PF) at Time of Event",
-            options=["Captain", "First Officer"],
-            index=0
+            options=("Captain", "First Officer"),
+            index=0,
+            key="tcas_pilot_flying"
         )
         
         # ========== SECTION I: NARRATIVE ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section I: Narrative</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section I: Narrative")
         
         narrative = st.text_area(
             "Detailed Narrative of Event *",
@@ -2589,7 +2728,7 @@ def render_tcas_report_form():
         
         contributing_factors = st.multiselect(
             "Possible Contributing Factors",
-            options=[
+            options=(
                 "ATC separation error",
                 "Incorrect altitude assignment",
                 "Miscommunication with ATC",
@@ -2600,93 +2739,94 @@ def render_tcas_report_form():
                 "VFR traffic in IFR airspace",
                 "Military activity",
                 "Unknown"
-            ],
-            default=[]
+            ),
+            default=[],
+            key="tcas_contributing_factors"
         )
         
         # ========== SECTION J: AIRPROX CLASSIFICATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section J: Airprox Classification (For Safety Dept)</div>
-        </div>""", unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            airprox_category = st.selectbox(
-                "Airprox Risk Category",
-                options=[
-                    "Category A - Risk of collision",
-                    "Category B - Safety not assured",
-                    "Category C - No risk of collision",
-                    "Category D - Risk not determined",
-                    "Category E - Not airprox (normal ops)"
-                ],
-                index=1
-            )
-        with col2:
-            airprox_cause = st.selectbox(
-                "Cause Classification",
-                options=[
-                    "ATC - Controller error",
-                    "Pilot - Own aircraft",
-                    "Pilot - Other aircraft",
-                    "Technical - Equipment failure",
-                    "Procedural - SOP deviation",
-                    "Unknown/Under investigation"
-                ],
-                index=5
-            )
+        with st.expander("Section J: Airprox Classification (For Safety Dept)", expanded=False):
+        
+            col1, col2 = st.columns(2)
+            with col1:
+                airprox_category = st.selectbox(
+                    "Airprox Risk Category",
+                    options=(
+                        "Category A - Risk of collision",
+                        "Category B - Safety not assured",
+                        "Category C - No risk of collision",
+                        "Category D - Risk not determined",
+                        "Category E - Not airprox (normal ops)"
+                    ),
+                    index=1,
+                    key="tcas_airprox_category"
+                )
+            with col2:
+                airprox_cause = st.selectbox(
+                    "Cause Classification",
+                    options=(
+                        "ATC - Controller error",
+                        "Pilot - Own aircraft",
+                        "Pilot - Other aircraft",
+                        "Technical - Equipment failure",
+                        "Procedural - SOP deviation",
+                        "Unknown/Under investigation"
+                    ),
+                    index=5,
+                    key="tcas_airprox_cause"
+                )
         
         # ========== SECTION K: INVESTIGATION STATUS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section K: Investigation Status</div>
-        </div>""", unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            investigation_status = st.selectbox(
-                "Investigation Status",
-                options=["Open - Pending Review", "Open - Under Investigation", "Referred to PCAA", "Referred to ATC", "Closed - No Further Action", "Closed - Recommendations Issued"],
-                index=0,
-                key="tcas_status"
-            )
-        with col2:
-            assigned_investigator = st.selectbox(
-                "Assigned To",
-                options=["Unassigned", "Safety Manager", "Safety Officer", "Quality Manager", "Flight Operations Manager"],
-                index=0,
-                key="tcas_assigned"
-            )
-        with col3:
-            priority_level = st.selectbox(
-                "Priority Level",
-                options=["Low", "Medium", "High", "Critical"],
-                index=2 if "RA" in tcas_alert_type else 1,
-                key="tcas_priority"
-            )
+        with st.expander("Section K: Investigation Status", expanded=False):
+        
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                investigation_status = st.selectbox(
+                    "Investigation Status",
+                    options=("Open - Pending Review", "Open - Under Investigation", "Referred to PCAA", "Referred to ATC", "Closed - No Further Action", "Closed - Recommendations Issued"),
+                    index=0,
+                    key="tcas_status"
+                )
+            with col2:
+                assigned_investigator = st.selectbox(
+                    "Assigned To",
+                    options=("Unassigned", "Safety Manager", "Safety Officer", "Quality Manager", "Flight Operations Manager"),
+                    index=0,
+                    key="tcas_assigned"
+                )
+            with col3:
+                priority_level = st.selectbox(
+                    "Priority Level",
+                    options=("Low", "Medium", "High", "Critical"),
+                    index=2 if is_ra else 1,
+                    key="tcas_priority"
+                )
         
-        # Data preservation request
-        col1, col2 = st.columns(2)
-        with col1:
-            fdr_requested = st.selectbox(
-                "FDR/QAR Data Requested?",
-                options=["Yes", "No", "Pending"],
-                index=1
-            )
-        with col2:
-            cvr_preserved = st.selectbox(
-                "CVR Preservation Requested?",
-                options=["Yes", "No", "N/A"],
-                index=1
-            )
+            # Data preservation request
+            col1, col2 = st.columns(2)
+            with col1:
+                fdr_requested = st.selectbox(
+                    "FDR/QAR Data Requested?",
+                    options=("Yes", "No", "Pending"),
+                    index=1,
+                    key="tcas_fdr_requested"
+                )
+            with col2:
+                cvr_preserved = st.selectbox(
+                    "CVR Preservation Requested?",
+                    options=("Yes", "No", "N/A"),
+                    index=1,
+                    key="tcas_cvr_preserved"
+                )
         
         # Photo/Document Upload
-        st.markdown("#### 📎 Attachments")
-        uploaded_files = st.file_uploader(
-            "Upload Photos/Documents (TCAS Display, Charts, etc.)",
-            type=['png', 'jpg', 'jpeg', 'pdf', 'doc', 'docx'],
-            accept_multiple_files=True,
-            key="tcas_attachments"
-        )
+        with st.expander("📎 Attachments", expanded=False):
+            uploaded_files = st.file_uploader(
+                "Upload Photos/Documents (TCAS Display, Charts, etc.)",
+                type=['png', 'jpg', 'jpeg', 'pdf', 'doc', 'docx'],
+                accept_multiple_files=True,
+                key="tcas_attachments"
+            )
         
         # Form submission
         st.markdown("---")
@@ -2700,29 +2840,18 @@ def render_tcas_report_form():
         
         if submitted:
             # Validation
-            errors = []
-            if not flight_number:
-                errors.append("Flight Number is required")
-            if not aircraft_reg:
-                errors.append("Aircraft Registration is required")
-            if not captain_name:
-                errors.append("Captain Name is required")
-            if not narrative:
-                errors.append("Detailed Narrative is required")
+            errors = [message for value, message in (
+                (flight_number, "Flight Number is required"),
+                (aircraft_reg, "Aircraft Registration is required"),
+                (captain_name, "Captain Name is required"),
+                (narrative, "Detailed Narrative is required"),
+            ) if not value]
             
             if errors:
-                for error in errors:
-                    st.error(f"❌ {error}")
+                render_validation_errors(errors)
             else:
                 # Calculate risk level based on separation and alert type
-                if "RA" in tcas_alert_type and vertical_separation < 300:
-                    risk_level = "Extreme"
-                elif "RA" in tcas_alert_type and vertical_separation < 500:
-                    risk_level = "High"
-                elif "RA" in tcas_alert_type:
-                    risk_level = "Medium"
-                else:
-                    risk_level = "Low"
+                risk_level = _TCAS_RA_RISK[bisect_right(_TCAS_RA_SEPARATION_BANDS, vertical_separation)] if is_ra else "Low"
                 
                 # Create report record
                 report_data = {
@@ -2734,8 +2863,8 @@ def render_tcas_report_form():
                     'flight_number': flight_number,
                     'aircraft_reg': aircraft_reg,
                     'aircraft_type': aircraft_type,
-                    'origin': origin_airport.split(' - ')[0] if origin_airport else '',
-                    'destination': destination_airport.split(' - ')[0] if destination_airport else '',
+                    'origin': airport_code(origin_airport),
+                    'destination': airport_code(destination_airport),
                     'flight_phase': flight_phase,
                     'flight_rules': flight_rules,
                     'transponder_mode': transponder_mode,
@@ -2791,26 +2920,29 @@ def render_tcas_report_form():
                 # --- SUPABASE INSERTION BLOCK ---
                 try:
                     report_data['report_number'] = incident_id
-                    response = supabase.table('tcas_reports').insert(report_data).execute()
-                    st.balloons()
-                    st.success(f"✅ TCAS Report Submitted Successfully! Ref: {incident_id}")
+                    report_data['submission_id'] = _form_submission_id("TCAS")
+                    report_data['attachment_paths'], uploads = upload_attachments(
+                        'tcas-reports', f"{incident_id}/{report_data['submission_id']}", uploaded_files)
+                    insert_queued('tcas_reports', report_data, wait_for=uploads)
                 except Exception as e:
                     st.error(f"Database Error: {e}")
-                
-                # Clear OCR data
-                st.session_state['ocr_data_tcas_report'] = None
-                
-                # Success feedback
-                st.balloons()
-                st.success(f"""
-                    ✅ **TCAS Report Submitted Successfully!**
+                else:
+                    # Clear OCR data
+                    st.session_state['ocr_data_tcas_report'] = None
                     
-                    **Reference:** {incident_id}  
-                    **Risk Level:** {risk_level}  
-                    **Status:** {investigation_status}
+                    _release_form_ref("TCAS")  # next report gets a fresh reference
+                    # Success feedback
+                    if st.session_state.get('enable_animations', False):
+                        st.balloons()
+                    st.success(f"""
+                        ✅ **TCAS Report Submitted Successfully!**
                     
-                    The report has been added to the system and is now visible in View Reports.
-                """)
+                        **Reference:** {incident_id}  
+                        **Risk Level:** {risk_level}  
+                        **Status:** {investigation_status}
+                    
+                        The report has been added to the system and is now visible in View Reports.
+                    """)
 
 
 # ============================================================================
@@ -2823,6 +2955,7 @@ def render_tcas_report_form():
 # Complete incident and hazard reporting with ICAO risk matrix
 # ============================================================================
 
+@st.fragment
 def render_incident_form():
     """
     Complete Aircraft Incident/Occurrence Report Form
@@ -2844,31 +2977,32 @@ def render_incident_form():
     if ocr_data:
         st.info("✨ Form pre-filled with OCR extracted data. Please verify and correct any fields.")
     
+    # One clock read for every date/time default in the form
+    now = datetime.now()
+    
     with st.form("incident_form", clear_on_submit=False):
         
         # ========== SECTION A: NOTIFICATION TYPE ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section A: Notification Type</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section A: Notification Type")
         
         col1, col2 = st.columns(2)
         with col1:
             incident_id = st.text_input(
                 "Incident Reference Number",
-                value=f"INC-{datetime.now().strftime('%Y%m%d')}-{random.randint(100, 999)}",
+                value=_form_ref("INC"),
                 disabled=True
             )
         with col2:
             notification_type = st.selectbox(
                 "Notification Type *",
-                options=[
+                options=(
                     "Accident",
                     "Serious Incident",
                     "Incident",
                     "Occurrence - No Safety Impact",
                     "Ground Event",
                     "Security Related"
-                ],
+                ),
                 index=2
             )
         
@@ -2876,19 +3010,19 @@ def render_incident_form():
         with col1:
             incident_date = st.date_input(
                 "Date of Incident *",
-                value=datetime.strptime(ocr_data.get('incident_date', date.today().isoformat()), '%Y-%m-%d').date() if ocr_data.get('incident_date') else date.today(),
+                value=date.fromisoformat(ocr_data['incident_date']) if ocr_data.get('incident_date') else now.date(),
                 key="inc_date"
             )
         with col2:
             incident_time = st.time_input(
                 "Time of Incident (UTC) *",
-                value=datetime.strptime(ocr_data.get('incident_time', '12:00'), '%H:%M').time() if ocr_data.get('incident_time') else datetime.now().time(),
+                value=dt_time.fromisoformat(ocr_data['incident_time']) if ocr_data.get('incident_time') else now.time(),
                 key="inc_time"
             )
         with col3:
             local_time = st.time_input(
                 "Local Time",
-                value=datetime.now().time(),
+                value=now.time(),
                 key="inc_local_time"
             )
         
@@ -2907,47 +3041,36 @@ def render_incident_form():
             )
         
         # ========== SECTION B: AIRCRAFT INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section B: Aircraft Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section B: Aircraft Information")
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            # Create a clean list of options first
-            fleet_options = [""] + list(AIRCRAFT_FLEET.keys())
-            
-            # Find the correct index safely
-            default_index = 0
-            if ocr_data.get('aircraft_reg') in fleet_options:
-                default_index = fleet_options.index(ocr_data['aircraft_reg'])
-
             aircraft_reg = st.selectbox(
                 "Aircraft Registration *",
-                options=fleet_options,
-                index=default_index
+                options=FLEET_SELECT_OPTIONS,
+                index=_FLEET_SELECT_INDEX.get(ocr_data.get('aircraft_reg'), 0)
             )
+            # One fleet record for the three read-only fields below
+            aircraft = AIRCRAFT_FLEET.get(aircraft_reg) or {}
         with col2:
-            # FIX: Direct dictionary lookup
             aircraft_type = st.text_input(
                 "Aircraft Type",
-                value=AIRCRAFT_FLEET.get(aircraft_reg, {}).get("type", ""),
+                value=aircraft.get("type", ""),
                 disabled=True,
                 key="inc_type"
             )
         with col3:
-            # FIX: Direct dictionary lookup
             msn = st.text_input(
                 "MSN (Manufacturer Serial Number)",
-                value=AIRCRAFT_FLEET.get(aircraft_reg, {}).get("msn", ""),
+                value=aircraft.get("msn", ""),
                 disabled=True
             )
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            # FIX: Direct dictionary lookup
             engine_type = st.text_input(
                 "Engine Type",
-                value=AIRCRAFT_FLEET.get(aircraft_reg, {}).get("engines", ""),
+                value=aircraft.get("engines", ""),
                 disabled=True
             )
         with col2:
@@ -2971,20 +3094,18 @@ def render_incident_form():
         with col1:
             aircraft_damage = st.selectbox(
                 "Aircraft Damage *",
-                options=[d[0] for d in DAMAGE_LEVELS],
+                options=_DAMAGE_KEYS,
                 index=0
             )
         with col2:
             fire_occurred = st.selectbox(
                 "Fire Occurred?",
-                options=["No", "Yes - In flight", "Yes - On ground", "Yes - After impact"],
+                options=("No", "Yes - In flight", "Yes - On ground", "Yes - After impact"),
                 index=0
             )
         
         # ========== SECTION C: FLIGHT INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section C: Flight Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section C: Flight Information")
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -2997,13 +3118,13 @@ def render_incident_form():
         with col2:
             flight_type = st.selectbox(
                 "Flight Type",
-                options=["Scheduled Passenger", "Non-Scheduled Passenger", "Cargo", "Ferry/Positioning", "Training", "Test Flight", "Maintenance Check"],
+                options=("Scheduled Passenger", "Non-Scheduled Passenger", "Cargo", "Ferry/Positioning", "Training", "Test Flight", "Maintenance Check"),
                 index=0
             )
         with col3:
             flight_rules = st.selectbox(
                 "Flight Rules",
-                options=["IFR", "VFR", "SVFR"],
+                options=("IFR", "VFR", "SVFR"),
                 index=0,
                 key="inc_rules"
             )
@@ -3012,21 +3133,21 @@ def render_incident_form():
         with col1:
             origin_airport = st.selectbox(
                 "Origin Airport *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
+                options=AIRPORT_SELECT_OPTIONS,
                 index=0,
                 key="inc_origin"
             )
         with col2:
             destination_airport = st.selectbox(
                 "Destination Airport *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
+                options=AIRPORT_SELECT_OPTIONS,
                 index=0,
                 key="inc_dest"
             )
         with col3:
             alternate_airport = st.selectbox(
                 "Alternate Airport",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
+                options=AIRPORT_SELECT_OPTIONS,
                 index=0
             )
         
@@ -3035,26 +3156,24 @@ def render_incident_form():
             flight_phase = st.selectbox(
                 "Phase of Flight *",
                 options=FLIGHT_PHASES,
-                index=FLIGHT_PHASES.index(ocr_data.get('flight_phase', 'Cruise')) if ocr_data.get('flight_phase') in FLIGHT_PHASES else 10,
+                index=_FLIGHT_PHASE_INDEX.get(ocr_data.get('flight_phase'), 10),
                 key="inc_phase"
             )
         with col2:
             operation_type = st.selectbox(
                 "Operation Type",
-                options=["Commercial Air Transport", "General Aviation", "Aerial Work", "State Aircraft"],
+                options=("Commercial Air Transport", "General Aviation", "Aerial Work", "State Aircraft"),
                 index=0
             )
         
         # ========== SECTION D: LOCATION OF INCIDENT ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section D: Location of Incident</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section D: Location of Incident")
         
         col1, col2 = st.columns(2)
         with col1:
             incident_location = st.selectbox(
                 "Incident Location",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()] + ["En-route", "Over water", "Other"],
+                options=AIRPORT_LOCATION_OPTIONS,
                 index=0
             )
         with col2:
@@ -3088,14 +3207,12 @@ def render_incident_form():
         
         terrain_type = st.selectbox(
             "Terrain Type",
-            options=["Airport/Aerodrome", "Urban area", "Rural area", "Mountainous", "Water", "Desert", "Forest", "Other"],
+            options=("Airport/Aerodrome", "Urban area", "Rural area", "Mountainous", "Water", "Desert", "Forest", "Other"),
             index=0
         )
         
         # ========== SECTION E: INCIDENT CATEGORY & DESCRIPTION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section E: Incident Category & Description</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section E: Incident Category & Description")
         
         incident_category = st.selectbox(
             "Primary Incident Category *",
@@ -3118,9 +3235,7 @@ def render_incident_form():
         )
         
         # ========== SECTION F: WEATHER CONDITIONS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section F: Weather Conditions</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section F: Weather Conditions")
         
         col1, col2 = st.columns(2)
         with col1:
@@ -3169,26 +3284,24 @@ def render_incident_form():
         with col1:
             turbulence = st.selectbox(
                 "Turbulence",
-                options=["None", "Light", "Moderate", "Severe", "Extreme"],
+                options=("None", "Light", "Moderate", "Severe", "Extreme"),
                 index=0
             )
         with col2:
             icing = st.selectbox(
                 "Icing Conditions",
-                options=["None", "Light", "Moderate", "Severe"],
+                options=("None", "Light", "Moderate", "Severe"),
                 index=0
             )
         
         weather_factor = st.selectbox(
             "Weather as Contributing Factor?",
-            options=["No", "Yes - Primary factor", "Yes - Contributing factor", "Possible factor", "Unknown"],
+            options=("No", "Yes - Primary factor", "Yes - Contributing factor", "Possible factor", "Unknown"),
             index=0
         )
         
         # ========== SECTION G: CREW INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section G: Crew Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section G: Crew Information")
         
         col1, col2 = st.columns(2)
         with col1:
@@ -3220,7 +3333,7 @@ def render_incident_form():
         with col1:
             pilot_flying = st.selectbox(
                 "Pilot Flying (PF)",
-                options=["Captain", "First Officer"],
+                options=("Captain", "First Officer"),
                 index=0,
                 key="inc_pf"
             )
@@ -3257,9 +3370,7 @@ def render_incident_form():
             )
         
         # ========== SECTION H: PASSENGERS & LOAD ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section H: Passengers & Load Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section H: Passengers & Load Information")
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -3315,14 +3426,12 @@ def render_incident_form():
         
         dangerous_goods = st.selectbox(
             "Dangerous Goods on Board?",
-            options=["No", "Yes - Declared", "Yes - Undeclared/Unknown", "Unknown"],
+            options=("No", "Yes - Declared", "Yes - Undeclared/Unknown", "Unknown"),
             index=0
         )
         
         # ========== SECTION I: INJURIES & DAMAGE ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section I: Injuries & Damage</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section I: Injuries & Damage")
         
         st.markdown("**Injury Summary**")
         col1, col2, col3, col4 = st.columns(4)
@@ -3358,33 +3467,31 @@ def render_incident_form():
         with col1:
             third_party_damage = st.selectbox(
                 "Third Party Damage?",
-                options=["No", "Yes - Property", "Yes - Vehicles", "Yes - Other aircraft", "Yes - Multiple"],
+                options=("No", "Yes - Property", "Yes - Vehicles", "Yes - Other aircraft", "Yes - Multiple"),
                 index=0
             )
         with col2:
             damage_estimate = st.selectbox(
                 "Estimated Damage Cost",
-                options=["Unknown", "< $10,000", "$10,000 - $100,000", "$100,000 - $1,000,000", "> $1,000,000"],
+                options=("Unknown", "< $10,000", "$10,000 - $100,000", "$100,000 - $1,000,000", "> $1,000,000"),
                 index=0
             )
         
         # ========== SECTION J: EMERGENCY RESPONSE ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section J: Emergency Response</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section J: Emergency Response")
         
         col1, col2 = st.columns(2)
         with col1:
             emergency_declared = st.selectbox(
                 "Emergency Declared?",
-                options=["No", "PAN PAN", "MAYDAY"],
+                options=("No", "PAN PAN", "MAYDAY"),
                 index=0,
                 key="inc_emergency"
             )
         with col2:
             emergency_services = st.multiselect(
                 "Emergency Services Responded",
-                options=["None required", "Airport Fire Service", "Ambulance", "Police", "Airport Authority", "External Fire Service"],
+                options=("None required", "Airport Fire Service", "Ambulance", "Police", "Airport Authority", "External Fire Service"),
                 default=["None required"]
             )
         
@@ -3392,7 +3499,7 @@ def render_incident_form():
         with col1:
             evacuation = st.selectbox(
                 "Evacuation Performed?",
-                options=["No", "Yes - Precautionary", "Yes - Emergency (slides)", "Yes - Emergency (no slides)", "Partial evacuation"],
+                options=("No", "Yes - Precautionary", "Yes - Emergency (slides)", "Yes - Emergency (no slides)", "Partial evacuation"),
                 index=0
             )
         with col2:
@@ -3408,13 +3515,11 @@ def render_incident_form():
         )
         
         # ========== SECTION K: NOTIFICATIONS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section K: Notifications</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section K: Notifications")
         
         notifications_required = st.multiselect(
             "Notifications Required/Made",
-            options=[
+            options=(
                 "PCAA (Pakistan Civil Aviation Authority)",
                 "AAIB (Air Accident Investigation Branch)",
                 "Operator Safety Department",
@@ -3427,7 +3532,7 @@ def render_incident_form():
                 "State of Occurrence",
                 "ICAO (if international)",
                 "Media Relations"
-            ],
+            ),
             default=["PCAA (Pakistan Civil Aviation Authority)", "Operator Safety Department"]
         )
         
@@ -3435,7 +3540,7 @@ def render_incident_form():
         with col1:
             pcaa_notified = st.selectbox(
                 "PCAA Notified?",
-                options=["Yes - Within 24 hours", "Yes - Within 72 hours", "Pending", "Not required"],
+                options=("Yes - Within 24 hours", "Yes - Within 72 hours", "Pending", "Not required"),
                 index=2
             )
         with col2:
@@ -3445,9 +3550,7 @@ def render_incident_form():
             )
         
         # ========== SECTION L: INVESTIGATION & NARRATIVE ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section L: Investigation & Narrative</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section L: Investigation & Narrative")
         
         narrative = st.text_area(
             "Detailed Narrative of Incident *",
@@ -3458,7 +3561,7 @@ def render_incident_form():
         
         probable_causes = st.multiselect(
             "Probable Cause Factors (Preliminary)",
-            options=[
+            options=(
                 "Human Factors - Flight Crew",
                 "Human Factors - Cabin Crew",
                 "Human Factors - Maintenance",
@@ -3475,7 +3578,7 @@ def render_incident_form():
                 "Organizational - Training",
                 "Organizational - Supervision",
                 "Unknown - Under Investigation"
-            ],
+            ),
             default=["Unknown - Under Investigation"]
         )
         
@@ -3490,21 +3593,21 @@ def render_incident_form():
         with col1:
             investigation_status = st.selectbox(
                 "Investigation Status",
-                options=["Open - Initial Report", "Open - Under Investigation", "Open - Awaiting Evidence", "Closed - Recommendations Issued", "Closed - No Further Action", "Referred to Authority"],
+                options=("Open - Initial Report", "Open - Under Investigation", "Open - Awaiting Evidence", "Closed - Recommendations Issued", "Closed - No Further Action", "Referred to Authority"),
                 index=0,
                 key="inc_status"
             )
         with col2:
             assigned_investigator = st.selectbox(
                 "Assigned To",
-                options=["Unassigned", "Safety Manager", "Safety Officer", "Quality Manager", "External Investigator", "PCAA Investigation Team"],
+                options=("Unassigned", "Safety Manager", "Safety Officer", "Quality Manager", "External Investigator", "PCAA Investigation Team"),
                 index=0,
                 key="inc_assigned"
             )
         with col3:
             priority_level = st.selectbox(
                 "Priority Level",
-                options=["Low", "Medium", "High", "Critical"],
+                options=("Low", "Medium", "High", "Critical"),
                 index=2 if notification_type in ["Accident", "Serious Incident"] else 1,
                 key="inc_priority"
             )
@@ -3515,20 +3618,20 @@ def render_incident_form():
         with col1:
             fdr_preserved = st.selectbox(
                 "FDR/QAR Data",
-                options=["Preserved", "Requested", "Not applicable", "Pending"],
+                options=("Preserved", "Requested", "Not applicable", "Pending"),
                 index=1
             )
         with col2:
             cvr_preserved = st.selectbox(
                 "CVR Data",
-                options=["Preserved", "Requested", "Not applicable", "Pending"],
+                options=("Preserved", "Requested", "Not applicable", "Pending"),
                 index=1,
                 key="inc_cvr"
             )
         with col3:
             aircraft_secured = st.selectbox(
                 "Aircraft Secured?",
-                options=["Yes", "No", "Not applicable"],
+                options=("Yes", "No", "Not applicable"),
                 index=0
             )
         
@@ -3553,21 +3656,16 @@ def render_incident_form():
         
         if submitted:
             # Validation
-            errors = []
-            if not flight_number:
-                errors.append("Flight Number is required")
-            if not aircraft_reg:
-                errors.append("Aircraft Registration is required")
-            if not captain_name:
-                errors.append("Captain Name is required")
-            if not narrative:
-                errors.append("Detailed Narrative is required")
-            if not incident_description:
-                errors.append("Brief Description is required")
+            errors = [message for value, message in (
+                (flight_number, "Flight Number is required"),
+                (aircraft_reg, "Aircraft Registration is required"),
+                (captain_name, "Captain Name is required"),
+                (narrative, "Detailed Narrative is required"),
+                (incident_description, "Brief Description is required"),
+            ) if not value]
             
             if errors:
-                for error in errors:
-                    st.error(f"❌ {error}")
+                render_validation_errors(errors)
             else:
                 # Calculate risk level
                 total_fatal = crew_fatal + pax_fatal + other_fatal
@@ -3602,9 +3700,9 @@ def render_incident_form():
                     'flight_number': flight_number,
                     'flight_type': flight_type,
                     'flight_rules': flight_rules,
-                    'origin': origin_airport.split(' - ')[0] if origin_airport else '',
-                    'destination': destination_airport.split(' - ')[0] if destination_airport else '',
-                    'alternate': alternate_airport.split(' - ')[0] if alternate_airport else '',
+                    'origin': airport_code(origin_airport),
+                    'destination': airport_code(destination_airport),
+                    'alternate': airport_code(alternate_airport),
                     'flight_phase': flight_phase,
                     'operation_type': operation_type,
                     'incident_location': incident_location,
@@ -3681,37 +3779,28 @@ def render_incident_form():
                 try:
                     report_data['report_number'] = incident_id
                     response = supabase.table('aircraft_incidents').insert(report_data).execute()
-                    st.balloons()
+                    get_db_report_counts.clear()  # the new report shows in the dashboard counters at once
+                except Exception as e:
+                    st.error(f"Database Error: {e}")
+                else:
+                    # Clear OCR data
+                    st.session_state['ocr_data_incident_report'] = None
+                    
+                    _release_form_ref("INC")  # next report gets a fresh reference
+                    # Success feedback
+                    if st.session_state.get('enable_animations', False):
+                        st.balloons()
                     st.success(f"""
                         ✅ **Incident Report Submitted Successfully!**
-                        
+                    
                         **Reference:** {incident_id}  
                         **Classification:** {notification_type}  
                         **Risk Level:** {risk_level}  
                         **Status:** {investigation_status}
-                        
+                    
                         The report has been added to the system and is now visible in View Reports.
                         {"⚠️ **IMPORTANT:** This incident requires immediate notification to PCAA." if notification_type in ["Accident", "Serious Incident"] else ""}
                     """)
-                except Exception as e:
-                    st.error(f"Database Error: {e}")
-                
-                # Clear OCR data
-                st.session_state['ocr_data_incident_report'] = None
-                
-                # Success feedback
-                st.balloons()
-                st.success(f"""
-                    ✅ **Incident Report Submitted Successfully!**
-                    
-                    **Reference:** {incident_id}  
-                    **Classification:** {notification_type}  
-                    **Risk Level:** {risk_level}  
-                    **Status:** {investigation_status}
-                    
-                    The report has been added to the system and is now visible in View Reports.
-                    {"⚠️ **IMPORTANT:** This incident requires immediate notification to PCAA." if notification_type in ["Accident", "Serious Incident"] else ""}
-                """)
 
 
 def render_mor_form():
@@ -3793,8 +3882,8 @@ def render_hazard_form():
         
         m1, m2 = st.columns(2)
         # Matches PDF: "Severity (A-E)", "Probability (1-5)"
-        severity = m1.selectbox("Severity", ["A - Catastrophic", "B - Major", "C - Moderate", "D - Minor", "E - Insignificant"])
-        probability = m2.selectbox("Probability", ["5 - Frequent", "4 - Occasional", "3 - Remote", "2 - Improbable", "1 - Rare"])
+        severity = m1.selectbox("Severity", ("A - Catastrophic", "B - Major", "C - Moderate", "D - Minor", "E - Insignificant"))
+        probability = m2.selectbox("Probability", ("5 - Frequent", "4 - Occasional", "3 - Remote", "2 - Improbable", "1 - Rare"))
         
         # Section C: Workflow (Hidden for Reporter, Visible for Analyst)
         role = st.session_state.get('user_role')
@@ -3828,7 +3917,7 @@ def render_mor_form():
             st.markdown("### Aircraft & Flight Information")
             c1, c2, c3 = st.columns(3)
             # Matches PDF: "Type", "Registration", "Flight No"
-            ac_type = c1.selectbox("Aircraft Type", ["A320", "A330", "Other"])
+            ac_type = c1.selectbox("Aircraft Type", ("A320", "A330", "Other"))
             reg = c2.text_input("Registration (e.g., AP-BOA)")
             flt_no = c3.text_input("Flight No (e.g., PF-123)")
             
@@ -3854,7 +3943,7 @@ def render_mor_form():
             # Matches PDF: "Height AGL", "Speed (IAS)", "Phase of Flight"
             height = b1.number_input("Height (ft AGL)")
             speed = b2.number_input("Speed (IAS Kts)")
-            phase = b3.selectbox("Phase", ["Taxi", "Takeoff", "Climb", "Cruise", "Approach", "Landing"])
+            phase = b3.selectbox("Phase", ("Taxi", "Takeoff", "Climb", "Cruise", "Approach", "Landing"))
             
             st.markdown("#### Impact Details")
             # Matches PDF: "Part Struck" checkboxes
@@ -3921,7 +4010,7 @@ def render_audit_form():
     with tab1:
         with st.form("audit_finding"):
             st.markdown("#### New Audit Finding")
-            level = st.selectbox("Finding Level", ["Level 1", "Level 2", "Observation"])
+            level = st.selectbox("Finding Level", ("Level 1", "Level 2", "Observation"))
             dept = st.selectbox("Audited Department", DEPARTMENTS)
             finding = st.text_area("Finding Description")
             st.file_uploader("Attach Audit Evidence")
@@ -3932,87 +4021,35 @@ def render_audit_form():
         st.info("Ramp Inspection (No Checklist - Levels Only)")
         with st.form("ramp_inspection"):
             flight_no = st.text_input("Flight No")
-            level = st.selectbox("Outcome", ["Level 1-2 (Minor)", "Level 3 (Major)"])
+            level = st.selectbox("Outcome", ("Level 1-2 (Minor)", "Level 3 (Major)"))
             comments = st.text_area("Comments")
             if st.form_submit_button("Submit Ramp Report"):
                 st.success("Ramp Inspection Saved.")
 
 
-def calculate_risk_level(likelihood: int, severity: str) -> str:
-    """Calculate risk level from ICAO 5x5 matrix"""
-    # Risk matrix lookup
-    matrix = {
-        (5, 'A'): 'Extreme', (5, 'B'): 'Extreme', (5, 'C'): 'High', (5, 'D'): 'Medium', (5, 'E'): 'Low',
-        (4, 'A'): 'Extreme', (4, 'B'): 'High', (4, 'C'): 'High', (4, 'D'): 'Medium', (4, 'E'): 'Low',
-        (3, 'A'): 'High', (3, 'B'): 'High', (3, 'C'): 'Medium', (3, 'D'): 'Medium', (3, 'E'): 'Low',
-        (2, 'A'): 'High', (2, 'B'): 'Medium', (2, 'C'): 'Medium', (2, 'D'): 'Low', (2, 'E'): 'Low',
-        (1, 'A'): 'Medium', (1, 'B'): 'Low', (1, 'C'): 'Low', (1, 'D'): 'Low', (1, 'E'): 'Low',
-    }
-    return matrix.get((likelihood, severity), 'Medium')
+_RISK_MATRIX_CELL_CLASS = {"Extreme": "rm-extreme", "High": "rm-high", "Medium": "rm-medium", "Low": "rm-low"}
 
+@lru_cache(maxsize=None)
+def _risk_matrix_html() -> str:
+    """Build the 5x5 matrix markup once from calculate_risk_level; styles live in apply_custom_css"""
+    header = '<tr><th class="rm-head"></th>' + "".join(
+        f'<th class="rm-head rm-center">{sev}<br><small>{SEVERITY_SCALE[sev]["name"]}</small></th>' for sev in "ABCDE"
+    ) + "</tr>"
+    rows = "".join(
+        f'<tr><td class="rm-head rm-bold">{lik} - {LIKELIHOOD_SCALE[lik]["name"]}</td>'
+        + "".join(f'<td class="rm-cell {_RISK_MATRIX_CELL_CLASS[calculate_risk_level(lik, sev)]}">{lik}{sev}</td>' for sev in "ABCDE")
+        + "</tr>"
+        for lik in (5, 4, 3, 2, 1)
+    )
+    legend = "".join(
+        f'<span class="rm-legend-item"><span class="rm-swatch {css}"></span> {level}</span>'
+        for level, css in _RISK_MATRIX_CELL_CLASS.items()
+    )
+    return f'<div class="rm-wrap"><table class="rm-table">{header}{rows}</table></div><div class="rm-legend">{legend}</div>'
 
 def render_visual_risk_matrix():
     """Render a visual 5x5 ICAO risk matrix"""
-    st.markdown("""
-    <div style="overflow-x: auto;">
-        <table style="border-collapse: collapse; width: 100%; min-width: 500px; font-size: 0.8rem;">
-            <tr>
-                <th style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9;"></th>
-                <th style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9; text-align: center;">A<br><small>Catastrophic</small></th>
-                <th style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9; text-align: center;">B<br><small>Hazardous</small></th>
-                <th style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9; text-align: center;">C<br><small>Major</small></th>
-                <th style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9; text-align: center;">D<br><small>Minor</small></th>
-                <th style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9; text-align: center;">E<br><small>Negligible</small></th>
-            </tr>
-            <tr>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9; font-weight: bold;">5 - Frequent</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FEE2E2; text-align: center; color: #DC2626; font-weight: bold;">5A</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FEE2E2; text-align: center; color: #DC2626; font-weight: bold;">5B</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FFEDD5; text-align: center; color: #EA580C; font-weight: bold;">5C</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FEF9C3; text-align: center; color: #CA8A04; font-weight: bold;">5D</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #DCFCE7; text-align: center; color: #16A34A; font-weight: bold;">5E</td>
-            </tr>
-            <tr>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9; font-weight: bold;">4 - Occasional</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FEE2E2; text-align: center; color: #DC2626; font-weight: bold;">4A</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FFEDD5; text-align: center; color: #EA580C; font-weight: bold;">4B</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FFEDD5; text-align: center; color: #EA580C; font-weight: bold;">4C</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FEF9C3; text-align: center; color: #CA8A04; font-weight: bold;">4D</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #DCFCE7; text-align: center; color: #16A34A; font-weight: bold;">4E</td>
-            </tr>
-            <tr>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9; font-weight: bold;">3 - Remote</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FFEDD5; text-align: center; color: #EA580C; font-weight: bold;">3A</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FFEDD5; text-align: center; color: #EA580C; font-weight: bold;">3B</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FEF9C3; text-align: center; color: #CA8A04; font-weight: bold;">3C</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FEF9C3; text-align: center; color: #CA8A04; font-weight: bold;">3D</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #DCFCE7; text-align: center; color: #16A34A; font-weight: bold;">3E</td>
-            </tr>
-            <tr>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9; font-weight: bold;">2 - Improbable</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FFEDD5; text-align: center; color: #EA580C; font-weight: bold;">2A</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FEF9C3; text-align: center; color: #CA8A04; font-weight: bold;">2B</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FEF9C3; text-align: center; color: #CA8A04; font-weight: bold;">2C</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #DCFCE7; text-align: center; color: #16A34A; font-weight: bold;">2D</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #DCFCE7; text-align: center; color: #16A34A; font-weight: bold;">2E</td>
-            </tr>
-            <tr>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #F1F5F9; font-weight: bold;">1 - Extremely Improbable</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #FEF9C3; text-align: center; color: #CA8A04; font-weight: bold;">1A</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #DCFCE7; text-align: center; color: #16A34A; font-weight: bold;">1B</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #DCFCE7; text-align: center; color: #16A34A; font-weight: bold;">1C</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #DCFCE7; text-align: center; color: #16A34A; font-weight: bold;">1D</td>
-                <td style="border: 1px solid #CBD5E1; padding: 8px; background: #DCFCE7; text-align: center; color: #16A34A; font-weight: bold;">1E</td>
-            </tr>
-        </table>
-    </div>
-    <div style="display: flex; gap: 1rem; margin-top: 0.5rem; font-size: 0.75rem; flex-wrap: wrap;">
-        <span style="display: flex; align-items: center; gap: 4px;"><span style="width: 12px; height: 12px; background: #FEE2E2; border: 1px solid #DC2626; border-radius: 2px;"></span> Extreme</span>
-        <span style="display: flex; align-items: center; gap: 4px;"><span style="width: 12px; height: 12px; background: #FFEDD5; border: 1px solid #EA580C; border-radius: 2px;"></span> High</span>
-        <span style="display: flex; align-items: center; gap: 4px;"><span style="width: 12px; height: 12px; background: #FEF9C3; border: 1px solid #CA8A04; border-radius: 2px;"></span> Medium</span>
-        <span style="display: flex; align-items: center; gap: 4px;"><span style="width: 12px; height: 12px; background: #DCFCE7; border: 1px solid #16A34A; border-radius: 2px;"></span> Low</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_risk_matrix_html(), unsafe_allow_html=True)
 
 
 def render_risk_badge(risk_level: str) -> str:
@@ -4048,15 +4085,13 @@ def render_fsr_form():
     with st.form("fsr_form", clear_on_submit=False):
         
         # ========== SECTION A: FLIGHT INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section A: Flight Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section A: Flight Information")
         
         col1, col2 = st.columns(2)
         with col1:
             report_id = st.text_input(
                 "Report Reference Number",
-                value=f"FSR-{datetime.now().strftime('%Y%m%d')}-{random.randint(100, 999)}",
+                value=_form_ref("FSR"),
                 disabled=True
             )
         with col2:
@@ -4077,7 +4112,7 @@ def render_fsr_form():
             aircraft_reg = st.selectbox(
                 "Aircraft Registration *",
                 # FIX: Use keys directly
-                options=[""] + list(AIRCRAFT_FLEET.keys()),
+                options=FLEET_SELECT_OPTIONS,
                 index=0,
                 key="fsr_reg"
             )
@@ -4085,7 +4120,7 @@ def render_fsr_form():
             aircraft_type = st.text_input(
                 "Aircraft Type",
                 # FIX: Direct dictionary lookup
-                value=AIRCRAFT_FLEET.get(aircraft_reg, {}).get("type", ""),
+                value=_AIRCRAFT_TYPE.get(aircraft_reg, ""),
                 disabled=True,
                 key="fsr_type"
             )
@@ -4094,14 +4129,14 @@ def render_fsr_form():
         with col1:
             origin = st.selectbox(
                 "Origin *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
+                options=AIRPORT_SELECT_OPTIONS,
                 index=0,
                 key="fsr_origin"
             )
         with col2:
             destination = st.selectbox(
                 "Destination *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
+                options=AIRPORT_SELECT_OPTIONS,
                 index=0,
                 key="fsr_dest"
             )
@@ -4110,13 +4145,13 @@ def render_fsr_form():
         with col1:
             std = st.time_input(
                 "STD (Scheduled)",
-                value=datetime.strptime("08:00", "%H:%M").time(),
+                value=dt_time(8, 0),
                 key="fsr_std"
             )
         with col2:
             atd = st.time_input(
                 "ATD (Actual)",
-                value=datetime.strptime("08:15", "%H:%M").time(),
+                value=dt_time(8, 15),
                 key="fsr_atd"
             )
         with col3:
@@ -4126,9 +4161,7 @@ def render_fsr_form():
             )
         
         # ========== SECTION B: CREW INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section B: Crew Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section B: Crew Information")
         
         col1, col2 = st.columns(2)
         with col1:
@@ -4165,9 +4198,7 @@ def render_fsr_form():
         )
         
         # ========== SECTION C: PASSENGER LOAD ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section C: Passenger Load</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section C: Passenger Load")
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -4229,9 +4260,7 @@ def render_fsr_form():
             )
         
         # ========== SECTION D: BAGGAGE & CARGO ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section D: Baggage & Cargo</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section D: Baggage & Cargo")
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -4279,9 +4308,7 @@ def render_fsr_form():
             )
         
         # ========== SECTION E: SERVICE QUALITY RATINGS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section E: Service Quality Ratings</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section E: Service Quality Ratings")
         
         st.markdown("*Rate each service area from 1 (Poor) to 5 (Excellent)*")
         
@@ -4328,13 +4355,11 @@ def render_fsr_form():
             )
         
         # ========== SECTION F: ISSUES & IRREGULARITIES ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section F: Issues & Irregularities</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section F: Issues & Irregularities")
         
         issues_reported = st.multiselect(
             "Issues Encountered",
-            options=[
+            options=(
                 "No issues",
                 "Catering - Short loaded",
                 "Catering - Quality issues",
@@ -4354,7 +4379,7 @@ def render_fsr_form():
                 "Ground handling - Issues",
                 "Security - Issues",
                 "Other"
-            ],
+            ),
             default=["No issues"]
         )
         
@@ -4365,9 +4390,7 @@ def render_fsr_form():
         )
         
         # ========== SECTION G: PASSENGER FEEDBACK ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section G: Passenger Feedback</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section G: Passenger Feedback")
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -4402,13 +4425,11 @@ def render_fsr_form():
         )
         
         # ========== SECTION H: MEDICAL INCIDENTS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section H: Medical Incidents</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section H: Medical Incidents")
         
         medical_incident = st.selectbox(
             "Medical Incident Occurred?",
-            options=["No", "Yes - Minor (First aid)", "Yes - Moderate (Medical kit used)", "Yes - Serious (Doctor paged)", "Yes - Emergency (Diversion considered)"],
+            options=("No", "Yes - Minor (First aid)", "Yes - Moderate (Medical kit used)", "Yes - Serious (Doctor paged)", "Yes - Emergency (Diversion considered)"),
             index=0
         )
         
@@ -4422,9 +4443,7 @@ def render_fsr_form():
             medical_details = ""
         
         # ========== SECTION I: DELAYS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section I: Delay Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section I: Delay Information")
         
         col1, col2 = st.columns(2)
         with col1:
@@ -4447,7 +4466,7 @@ def render_fsr_form():
         if departure_delay > 0 or arrival_delay > 0:
             delay_reason = st.selectbox(
                 "Primary Delay Reason",
-                options=[
+                options=(
                     "Aircraft - Technical",
                     "Aircraft - Late arrival",
                     "Operations - Crew",
@@ -4464,7 +4483,7 @@ def render_fsr_form():
                     "Security",
                     "Airport - Infrastructure",
                     "Other"
-                ],
+                ),
                 index=0
             )
             delay_remarks = st.text_input(
@@ -4476,9 +4495,7 @@ def render_fsr_form():
             delay_remarks = ""
         
         # ========== SECTION J: ADDITIONAL REMARKS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section J: Additional Remarks</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section J: Additional Remarks")
         
         additional_remarks = st.text_area(
             "Additional Remarks",
@@ -4504,19 +4521,15 @@ def render_fsr_form():
         
         if submitted:
             # Validation
-            errors = []
-            if not flight_number:
-                errors.append("Flight Number is required")
-            if not aircraft_reg:
-                errors.append("Aircraft Registration is required")
-            if not sccm_name:
-                errors.append("SCCM Name is required")
-            if not reported_by:
-                errors.append("Reporter Name is required")
+            errors = [message for value, message in (
+                (flight_number, "Flight Number is required"),
+                (aircraft_reg, "Aircraft Registration is required"),
+                (sccm_name, "SCCM Name is required"),
+                (reported_by, "Reporter Name is required"),
+            ) if not value]
             
             if errors:
-                for error in errors:
-                    st.error(f"❌ {error}")
+                render_validation_errors(errors)
             else:
                 # Determine risk level based on issues
                 if medical_incident in ["Yes - Serious (Doctor paged)", "Yes - Emergency (Diversion considered)"]:
@@ -4536,8 +4549,8 @@ def render_fsr_form():
                     'flight_number': flight_number,
                     'aircraft_reg': aircraft_reg,
                     'aircraft_type': aircraft_type,
-                    'origin': origin.split(' - ')[0] if origin else '',
-                    'destination': destination.split(' - ')[0] if destination else '',
+                    'origin': airport_code(origin),
+                    'destination': airport_code(destination),
                     'std': std.strftime('%H:%M'),
                     'atd': atd.strftime('%H:%M'),
                     'block_time': block_time,
@@ -4592,23 +4605,23 @@ def render_fsr_form():
                     # Ensure keys match your Supabase DB columns exactly
                     # Note: Changed 'incident_id' to 'report_id' to match the FSR form variable
                     response = supabase.table('fsr_reports').insert(report_data).execute()
-                    st.balloons()
-                    st.success(f"✅ Flight Services Report Saved to Database! Ref: {report_id}")
+                    get_db_report_counts.clear()  # the new report shows in the dashboard counters at once
                 except Exception as e:
                     st.error(f"Database Error: {e}")
-# --------------------
-                
-                # Success feedback
-                st.balloons()
-                st.success(f"""
-                    ✅ **Flight Services Report Submitted Successfully!**
+                else:
+                    _release_form_ref("FSR")  # next report gets a fresh reference
+                    # Success feedback
+                    if st.session_state.get('enable_animations', False):
+                        st.balloons()
+                    st.success(f"""
+                        ✅ **Flight Services Report Submitted Successfully!**
                     
-                    **Reference:** {report_id}  
-                    **Flight:** {flight_number}  
-                    **Overall Rating:** {overall_rating}/5
+                        **Reference:** {report_id}  
+                        **Flight:** {flight_number}  
+                        **Overall Rating:** {overall_rating}/5
                     
-                    The report has been added to the system.
-                """)
+                        The report has been added to the system.
+                    """)
 
 
 def render_captain_dbr_form():
@@ -4622,15 +4635,13 @@ def render_captain_dbr_form():
     with st.form("captain_dbr_form", clear_on_submit=False):
         
         # ========== SECTION A: FLIGHT INFORMATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section A: Flight Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section A: Flight Information")
         
         col1, col2 = st.columns(2)
         with col1:
             report_id = st.text_input(
                 "Report Reference Number",
-                value=f"DBR-{datetime.now().strftime('%Y%m%d')}-{random.randint(100, 999)}",
+                value=_form_ref("DBR"),
                 disabled=True
             )
         with col2:
@@ -4651,7 +4662,7 @@ def render_captain_dbr_form():
             aircraft_reg = st.selectbox(
                 "Aircraft Registration *",
                 # FIX: Use keys directly
-                options=[""] + list(AIRCRAFT_FLEET.keys()),
+                options=FLEET_SELECT_OPTIONS,
                 index=0,
                 key="dbr_reg"
             )
@@ -4659,7 +4670,7 @@ def render_captain_dbr_form():
             aircraft_type = st.text_input(
                 "Aircraft Type",
                 # FIX: Direct dictionary lookup
-                value=AIRCRAFT_FLEET.get(aircraft_reg, {}).get("type", ""),
+                value=_AIRCRAFT_TYPE.get(aircraft_reg, ""),
                 disabled=True,
                 key="dbr_type"
             )
@@ -4668,44 +4679,42 @@ def render_captain_dbr_form():
         with col1:
             origin = st.selectbox(
                 "Origin *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
+                options=AIRPORT_SELECT_OPTIONS,
                 index=0,
                 key="dbr_origin"
             )
         with col2:
             destination = st.selectbox(
                 "Destination *",
-                options=[""] + [f"{data['icao']} - {data['name']}" for data in AIRPORTS.values()],
+                options=AIRPORT_SELECT_OPTIONS,
                 index=0,
                 key="dbr_dest"
             )
         
         # ========== SECTION B: TIMES ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section B: Flight Times</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section B: Flight Times")
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
             off_blocks = st.time_input(
                 "Off Blocks (UTC)",
-                value=datetime.strptime("08:00", "%H:%M").time(),
+                value=dt_time(8, 0),
                 key="dbr_off"
             )
         with col2:
             takeoff_time = st.time_input(
                 "Takeoff (UTC)",
-                value=datetime.strptime("08:15", "%H:%M").time()
+                value=dt_time(8, 15)
             )
         with col3:
             landing_time = st.time_input(
                 "Landing (UTC)",
-                value=datetime.strptime("09:45", "%H:%M").time()
+                value=dt_time(9, 45)
             )
         with col4:
             on_blocks = st.time_input(
                 "On Blocks (UTC)",
-                value=datetime.strptime("10:00", "%H:%M").time(),
+                value=dt_time(10, 0),
                 key="dbr_on"
             )
         
@@ -4736,9 +4745,7 @@ def render_captain_dbr_form():
             )
         
         # ========== SECTION C: FUEL ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section C: Fuel Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section C: Fuel Information")
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -4787,9 +4794,7 @@ def render_captain_dbr_form():
         )
         
         # ========== SECTION D: WEIGHTS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section D: Weight Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section D: Weight Information")
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -4840,9 +4845,7 @@ def render_captain_dbr_form():
             )
         
         # ========== SECTION E: WEATHER ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section E: Weather Conditions</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section E: Weather Conditions")
         
         col1, col2 = st.columns(2)
         with col1:
@@ -4886,9 +4889,7 @@ def render_captain_dbr_form():
         )
         
         # ========== SECTION F: APPROACH & LANDING ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section F: Approach & Landing</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section F: Approach & Landing")
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -4899,13 +4900,13 @@ def render_captain_dbr_form():
         with col2:
             approach_type = st.selectbox(
                 "Approach Type",
-                options=["ILS CAT I", "ILS CAT II", "ILS CAT III", "VOR", "VOR/DME", "NDB", "RNAV (GPS)", "RNAV (RNP)", "Visual", "Circling", "Other"],
+                options=("ILS CAT I", "ILS CAT II", "ILS CAT III", "VOR", "VOR/DME", "NDB", "RNAV (GPS)", "RNAV (RNP)", "Visual", "Circling", "Other"),
                 index=0
             )
         with col3:
             autoland = st.selectbox(
                 "Autoland Used?",
-                options=["No", "Yes", "N/A"],
+                options=("No", "Yes", "N/A"),
                 index=0
             )
         
@@ -4913,13 +4914,13 @@ def render_captain_dbr_form():
         with col1:
             approach_stable = st.selectbox(
                 "Approach Stabilized?",
-                options=["Yes - Fully stabilized", "Yes - Minor corrections", "No - Go-around", "N/A"],
+                options=("Yes - Fully stabilized", "Yes - Minor corrections", "No - Go-around", "N/A"),
                 index=0
             )
         with col2:
             landing_quality = st.selectbox(
                 "Landing Quality",
-                options=["Smooth", "Normal", "Firm", "Hard", "Go-around executed"],
+                options=("Smooth", "Normal", "Firm", "Hard", "Go-around executed"),
                 index=1
             )
         
@@ -4930,21 +4931,19 @@ def render_captain_dbr_form():
         )
         
         # ========== SECTION G: TECHNICAL STATUS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section G: Technical Status</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section G: Technical Status")
         
         col1, col2 = st.columns(2)
         with col1:
             mel_items = st.selectbox(
                 "MEL Items Active?",
-                options=["No", "Yes - 1 item", "Yes - 2 items", "Yes - 3+ items"],
+                options=("No", "Yes - 1 item", "Yes - 2 items", "Yes - 3+ items"),
                 index=0
             )
         with col2:
             tech_issues = st.selectbox(
                 "Technical Issues During Flight?",
-                options=["No issues", "Minor - No operational impact", "Moderate - Operational limitation", "Significant - Procedure deviation", "Serious - Emergency procedure"],
+                options=("No issues", "Minor - No operational impact", "Moderate - Operational limitation", "Significant - Procedure deviation", "Serious - Emergency procedure"),
                 index=0
             )
         
@@ -4956,7 +4955,7 @@ def render_captain_dbr_form():
             )
             aml_entry = st.selectbox(
                 "AML Entry Made?",
-                options=["Yes", "No - Not required", "Pending"],
+                options=("Yes", "No - Not required", "Pending"),
                 index=0
             )
         else:
@@ -4965,7 +4964,7 @@ def render_captain_dbr_form():
         
         systems_checked = st.multiselect(
             "Systems with Anomalies (if any)",
-            options=[
+            options=(
                 "None",
                 "Flight Controls",
                 "Autopilot/Flight Director",
@@ -4985,26 +4984,24 @@ def render_captain_dbr_form():
                 "Weather Radar",
                 "FMS/MCDU",
                 "Other"
-            ],
+            ),
             default=["None"]
         )
         
         # ========== SECTION H: NAVIGATION ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section H: Navigation & ATC</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section H: Navigation & ATC")
         
         col1, col2 = st.columns(2)
         with col1:
             route_deviation = st.selectbox(
                 "Route Deviation?",
-                options=["No - As planned", "Yes - Weather avoidance", "Yes - ATC instruction", "Yes - Traffic", "Yes - Other"],
+                options=("No - As planned", "Yes - Weather avoidance", "Yes - ATC instruction", "Yes - Traffic", "Yes - Other"),
                 index=0
             )
         with col2:
             altitude_deviation = st.selectbox(
                 "Altitude Deviation?",
-                options=["No - As planned", "Yes - ATC assigned", "Yes - Weather", "Yes - Performance", "Yes - Other"],
+                options=("No - As planned", "Yes - ATC assigned", "Yes - Weather", "Yes - Performance", "Yes - Other"),
                 index=0
             )
         
@@ -5015,9 +5012,7 @@ def render_captain_dbr_form():
         )
         
         # ========== SECTION I: CREW FACTORS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section I: Crew Information</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section I: Crew Information")
         
         col1, col2 = st.columns(2)
         with col1:
@@ -5044,27 +5039,25 @@ def render_captain_dbr_form():
         with col1:
             pilot_flying = st.selectbox(
                 "Pilot Flying",
-                options=["Captain", "First Officer"],
+                options=("Captain", "First Officer"),
                 index=0,
                 key="dbr_pf"
             )
         with col2:
             fdp_status = st.selectbox(
                 "FDP Status",
-                options=["Within limits", "Extended - Pre-planned", "Extended - Operational", "Near limits", "Exceeded - Commander's discretion"],
+                options=("Within limits", "Extended - Pre-planned", "Extended - Operational", "Near limits", "Exceeded - Commander's discretion"),
                 index=0
             )
         
         crew_fatigue = st.selectbox(
             "Crew Fatigue Level",
-            options=["Normal - Well rested", "Mild - Acceptable", "Moderate - Noticeable", "High - Performance concern", "Severe - Reported to management"],
+            options=("Normal - Well rested", "Mild - Acceptable", "Moderate - Noticeable", "High - Performance concern", "Severe - Reported to management"),
             index=0
         )
         
         # ========== SECTION J: SAFETY OBSERVATIONS ==========
-        st.markdown("""<div class="form-section">
-            <div class="form-section-header">Section J: Safety Observations & Recommendations</div>
-        </div>""", unsafe_allow_html=True)
+        render_section_header("Section J: Safety Observations & Recommendations")
         
         safety_observations = st.text_area(
             "Safety Observations",
@@ -5074,7 +5067,7 @@ def render_captain_dbr_form():
         
         hazards_identified = st.multiselect(
             "Hazards/Threats Identified",
-            options=[
+            options=(
                 "None identified",
                 "Weather - Adverse conditions",
                 "Terrain - Challenging approach",
@@ -5088,7 +5081,7 @@ def render_captain_dbr_form():
                 "Passenger - Disruption",
                 "Wildlife - Activity",
                 "Other"
-            ],
+            ),
             default=["None identified"]
         )
         
@@ -5101,13 +5094,13 @@ def render_captain_dbr_form():
         # Overall assessment
         overall_flight = st.selectbox(
             "Overall Flight Assessment",
-            options=[
+            options=(
                 "Normal - Routine flight",
                 "Minor variations - Within normal operations",
                 "Notable events - Documented for review",
                 "Significant issues - Requires follow-up",
                 "Safety concern - Immediate review required"
-            ],
+            ),
             index=0
         )
         
@@ -5123,17 +5116,14 @@ def render_captain_dbr_form():
         
         if submitted:
             # Validation
-            errors = []
-            if not flight_number:
-                errors.append("Flight Number is required")
-            if not aircraft_reg:
-                errors.append("Aircraft Registration is required")
-            if not captain_name:
-                errors.append("Captain Name is required")
+            errors = [message for value, message in (
+                (flight_number, "Flight Number is required"),
+                (aircraft_reg, "Aircraft Registration is required"),
+                (captain_name, "Captain Name is required"),
+            ) if not value]
             
             if errors:
-                for error in errors:
-                    st.error(f"❌ {error}")
+                render_validation_errors(errors)
             else:
                 # Determine risk level
                 if tech_issues in ["Significant - Procedure deviation", "Serious - Emergency procedure"]:
@@ -5153,8 +5143,8 @@ def render_captain_dbr_form():
                     'flight_number': flight_number,
                     'aircraft_reg': aircraft_reg,
                     'aircraft_type': aircraft_type,
-                    'origin': origin.split(' - ')[0] if origin else '',
-                    'destination': destination.split(' - ')[0] if destination else '',
+                    'origin': airport_code(origin),
+                    'destination': airport_code(destination),
                     'times': {
                         'off_blocks': off_blocks.strftime('%H:%M'),
                         'takeoff': takeoff_time.strftime('%H:%M'),
@@ -5234,23 +5224,23 @@ def render_captain_dbr_form():
                 try:
                     # Ensure keys match your Supabase DB columns exactly
                     response = supabase.table('captain_dbr').insert(report_data).execute()
-                    st.balloons()
-                    # CORRECTION: Changed 'incident_id' to 'report_id'
-                    st.success(f"✅ Captain's Debrief Report Saved to Database! Ref: {report_id}")
+                    get_db_report_counts.clear()  # the new report shows in the dashboard counters at once
                 except Exception as e:
                     st.error(f"Database Error: {e}")
-                
-                # Success feedback
-                st.balloons()
-                st.success(f"""
-                    ✅ **Captain's Debrief Report Submitted Successfully!**
+                else:
+                    _release_form_ref("DBR")  # next report gets a fresh reference
+                    # Success feedback
+                    if st.session_state.get('enable_animations', False):
+                        st.balloons()
+                    st.success(f"""
+                        ✅ **Captain's Debrief Report Submitted Successfully!**
                     
-                    **Reference:** {report_id}  
-                    **Flight:** {flight_number}  
-                    **Assessment:** {overall_flight.split(' - ')[0]}
+                        **Reference:** {report_id}  
+                        **Flight:** {flight_number}  
+                        **Assessment:** {overall_flight.split(' - ')[0]}
                     
-                    The report has been added to the system.
-                """)
+                        The report has been added to the system.
+                    """)
 
 
 # ============================================================================
@@ -5270,6 +5260,23 @@ def render_captain_dbr_form():
 # - PDF download functionality
 # =============================================================================
 
+# Safety Overview cards: one 4-column grid emitted as a single markdown block
+_KPI_CARD = (
+    '<div style="background-color: {bg}; padding: 20px; border-top: 5px solid {accent}; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">'
+    '<h4 style="color: #333; margin:0;">{title}</h4>'
+    '<p style="font-size: 0.8rem; color: #666; margin-bottom: 10px;">{subtitle}</p>'
+    '<h1 style="color: {value_color}; font-size: 2.5rem; margin:0;">{value}</h1>'
+    '</div>'
+)
+_SAFETY_OVERVIEW_HTML = (
+    '<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">'
+    + _KPI_CARD.format(bg="#F8F9FA", accent="#006400", title="Voluntary", subtitle="Hazards & Observations", value_color="#006400", value="{vol_count}")
+    + _KPI_CARD.format(bg="#F8F9FA", accent="#8B0000", title="MOR", subtitle="Mandatory Occurrence", value_color="#8B0000", value="{mor_count}")
+    + _KPI_CARD.format(bg="#F8F9FA", accent="#1e3c72", title="Quality", subtitle="Audits & Inspections", value_color="#1e3c72", value="{audit_count}")
+    + _KPI_CARD.format(bg="#E8F0FE", accent="#666", title="AI Insights", subtitle="Predictive Analytics", value_color="#555", value="--")
+    + '</div>'
+)
+
 def render_dashboard():
     """
     Modified Dashboard: 4 Key Blocks + Existing Weather Widget
@@ -5287,48 +5294,12 @@ def render_dashboard():
     st.markdown("### 📡 Safety Overview")
     
     # Filter logic based on Role (Gatekeeper sees all, Analyst sees Dept, Reporter sees Public stats)
-    # (Mocking counts for display - connect these to your st.session_state lists)
-    vol_count = len(st.session_state.get('hazard_reports', []))
+    # Voluntary comes from the database (one cached RPC); MOR and audits have no table yet
+    vol_count = get_db_report_counts()['hazard_reports']
     mor_count = len(st.session_state.get('mor_reports', [])) 
     audit_count = len(st.session_state.get('audit_reports', []))
     
-    c1, c2, c3, c4 = st.columns(4)
-
-    with c1:
-        st.markdown(f"""
-        <div style="background-color: #F8F9FA; padding: 20px; border-top: 5px solid #006400; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">
-            <h4 style="color: #333; margin:0;">Voluntary</h4>
-            <p style="font-size: 0.8rem; color: #666; margin-bottom: 10px;">Hazards & Observations</p>
-            <h1 style="color: #006400; font-size: 2.5rem; margin:0;">{vol_count}</h1>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with c2:
-        st.markdown(f"""
-        <div style="background-color: #F8F9FA; padding: 20px; border-top: 5px solid #8B0000; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">
-            <h4 style="color: #333; margin:0;">MOR</h4>
-            <p style="font-size: 0.8rem; color: #666; margin-bottom: 10px;">Mandatory Occurrence</p>
-            <h1 style="color: #8B0000; font-size: 2.5rem; margin:0;">{mor_count}</h1>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with c3:
-        st.markdown(f"""
-        <div style="background-color: #F8F9FA; padding: 20px; border-top: 5px solid #1e3c72; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">
-            <h4 style="color: #333; margin:0;">Quality</h4>
-            <p style="font-size: 0.8rem; color: #666; margin-bottom: 10px;">Audits & Inspections</p>
-            <h1 style="color: #1e3c72; font-size: 2.5rem; margin:0;">{audit_count}</h1>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with c4:
-        st.markdown(f"""
-        <div style="background-color: #E8F0FE; padding: 20px; border-top: 5px solid #666; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">
-            <h4 style="color: #333; margin:0;">AI Insights</h4>
-            <p style="font-size: 0.8rem; color: #666; margin-bottom: 10px;">Predictive Analytics</p>
-            <h1 style="color: #555; font-size: 2.5rem; margin:0;">--</h1>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_SAFETY_OVERVIEW_HTML.format(vol_count=vol_count, mor_count=mor_count, audit_count=audit_count), unsafe_allow_html=True)
 
 def generate_trend_data():
     """Generate monthly trend data from actual reports."""
@@ -5346,11 +5317,10 @@ def generate_trend_data():
         if date_str:
             try:
                 if isinstance(date_str, str):
-                    date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+                    date_obj = date.fromisoformat(date_str)
                 else:
                     date_obj = date_str
-                month_key = date_obj.strftime('%b %Y')
-                monthly_counts[month_key] += 1
+                monthly_counts[(date_obj.year, date_obj.month)] += 1
             except:
                 pass
     
@@ -5365,10 +5335,9 @@ def generate_trend_data():
             })
         return months
     
-    # Sort by date and return
-    sorted_months = sorted(monthly_counts.items(), 
-                          key=lambda x: datetime.strptime(x[0], '%b %Y'))
-    return [{'Month': m, 'Reports': c} for m, c in sorted_months[-6:]]
+    # (year, month) keys sort chronologically as-is; format only the six we return
+    sorted_months = sorted(monthly_counts.items())
+    return [{'Month': f"{date(y, m, 1):%b %Y}", 'Reports': c} for (y, m), c in sorted_months[-6:]]
 
 
 def render_view_reports():
@@ -5393,21 +5362,21 @@ def render_view_reports():
         with filter_col1:
             report_type_filter = st.selectbox(
                 "Report Type",
-                ["All Types", "Bird Strike", "Laser Strike", "TCAS Report", 
-                 "Aircraft Incident", "Hazard Report", "FSR Report", "Captain's Debrief"]
+                ("All Types", "Bird Strike", "Laser Strike", "TCAS Report", 
+                 "Aircraft Incident", "Hazard Report", "FSR Report", "Captain's Debrief")
             )
         
         with filter_col2:
             risk_filter = st.selectbox(
                 "Risk Level",
-                ["All Levels", "Extreme", "High", "Medium", "Low"]
+                ("All Levels", "Extreme", "High", "Medium", "Low")
             )
         
         with filter_col3:
             status_filter = st.selectbox(
                 "Status",
-                ["All Status", "New", "Under Review", "Investigation", 
-                 "Pending Action", "Resolved", "Closed"]
+                ("All Status", "New", "Under Review", "Investigation", 
+                 "Pending Action", "Resolved", "Closed")
             )
         
         with filter_col4:
@@ -5564,7 +5533,7 @@ def filter_by_date(date_str, start_date, end_date):
         return True
     try:
         if isinstance(date_str, str):
-            report_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            report_date = date.fromisoformat(date_str)
         else:
             report_date = date_str
         return start_date <= report_date <= end_date
@@ -5734,7 +5703,7 @@ def render_report_detail():
         st.divider()
         
         # 2. Reply / Log Actions
-        action_type = st.radio("Action:", ["📧 Send Reply", "📥 Log Incoming Reply"], horizontal=True, key=f"comm_action_{report.get('id')}")
+        action_type = st.radio("Action:", ("📧 Send Reply", "📥 Log Incoming Reply"), horizontal=True, key=f"comm_action_{report.get('id')}")
         
         if action_type == "📧 Send Reply":
             with st.form(f"reply_form_{report.get('id')}"):
@@ -5968,8 +5937,8 @@ def render_report_actions(report):
         
         new_status = st.selectbox(
             "Update Status To:",
-            ["New", "Under Review", "Investigation", "Pending Action", 
-             "Corrective Action", "Monitoring", "Resolved", "Closed"]
+            ("New", "Under Review", "Investigation", "Pending Action", 
+             "Corrective Action", "Monitoring", "Resolved", "Closed")
         )
         
         status_notes = st.text_area("Status Notes:", height=100)
@@ -5985,13 +5954,13 @@ def render_report_actions(report):
         
         assignee = st.selectbox(
             "Assign To:",
-            ["Safety Manager", "Senior Investigator", "Quality Assurance", 
-             "Operations Manager", "Flight Ops Director"]
+            ("Safety Manager", "Senior Investigator", "Quality Assurance", 
+             "Operations Manager", "Flight Ops Director")
         )
         
         priority = st.selectbox(
             "Priority:",
-            ["Critical", "High", "Medium", "Low"]
+            ("Critical", "High", "Medium", "Low")
         )
         
         due_date = st.date_input("Due Date:", datetime.now() + timedelta(days=7))
@@ -6075,6 +6044,7 @@ def update_report_status(report, new_status, notes):
                 r['investigation_status'] = new_status
                 r['status_notes'] = notes
                 r['status_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M')
+                bump_reports_version()
                 break
 
 
@@ -6082,6 +6052,9 @@ def generate_report_pdf(report):
     """Generate a PDF for the report."""
     
     try:
+        from reportlab.lib.colors import HexColor
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
         
         buffer = io.BytesIO()
         c = canvas.Canvas(buffer, pagesize=letter)
@@ -6797,7 +6770,7 @@ def render_compose_email():
     # Recipient selection
     recipient_type = st.radio(
         "Recipient Type",
-        ["Individual", "Distribution List", "Custom"],
+        ("Individual", "Distribution List", "Custom"),
         horizontal=True
     )
     
@@ -6806,8 +6779,8 @@ def render_compose_email():
     elif recipient_type == "Distribution List":
         dist_list = st.selectbox(
             "Select Distribution List",
-            ["Safety Team", "Flight Operations", "Maintenance", "Ground Operations",
-             "Management", "All Department Heads", "Safety Review Board"]
+            ("Safety Team", "Flight Operations", "Maintenance", "Ground Operations",
+             "Management", "All Department Heads", "Safety Review Board")
         )
         to_address = f"{dist_list.lower().replace(' ', '_')}@airsial.com"
         st.info(f"Email will be sent to: {to_address}")
@@ -7259,6 +7232,11 @@ def generate_full_report_pdf(report_type="summary"):
     """Generate comprehensive PDF report."""
     
     try:
+        from reportlab.lib.colors import HexColor
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
         
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4)
@@ -7361,15 +7339,15 @@ def render_geospatial_map():
         with filter_col1:
             incident_types = st.multiselect(
                 "Incident Types",
-                ["Bird Strikes", "Laser Strikes", "TCAS Events", "Ground Incidents", 
-                 "Technical Events", "Hazards"],
+                ("Bird Strikes", "Laser Strikes", "TCAS Events", "Ground Incidents", 
+                 "Technical Events", "Hazards"),
                 default=["Bird Strikes", "Laser Strikes"]
             )
         
         with filter_col2:
             risk_levels = st.multiselect(
                 "Risk Levels",
-                ["Extreme", "High", "Medium", "Low"],
+                ("Extreme", "High", "Medium", "Low"),
                 default=["Extreme", "High", "Medium"]
             )
         
@@ -7400,8 +7378,9 @@ def render_geospatial_map():
         df['color'] = df['risk_level'].map(lambda x: color_map.get(x, [108, 117, 125, 200]))
         
         # PyDeck map
-        if PYDECK_AVAILABLE and pdk is not None:
+        if PYDECK_AVAILABLE:
             try:
+                import pydeck as pdk
                 layer = pdk.Layer(
                     'ScatterplotLayer',
                     data=df,
@@ -7736,7 +7715,7 @@ def render_new_ramp_inspection():
         with col1:
             inspection_id = st.text_input(
                 "Inspection ID",
-                value=f"RAMP-{datetime.now().strftime('%Y%m%d')}-{random.randint(100,999)}"
+                value=_form_ref("RAMP")
             )
             inspection_date = st.date_input("Inspection Date", datetime.now())
             airport = st.selectbox("Airport", AIRPORTS if 'AIRPORTS' in dir() else 
@@ -7747,7 +7726,7 @@ def render_new_ramp_inspection():
             flight_number = st.text_input("Flight Number (if applicable)")
             inspection_type = st.selectbox(
                 "Inspection Type",
-                ["Pre-Flight", "Transit", "Post-Flight", "Random", "Follow-up"]
+                ("Pre-Flight", "Transit", "Post-Flight", "Random", "Follow-up")
             )
         
         st.markdown("---")
@@ -7805,7 +7784,7 @@ def render_new_ramp_inspection():
                 with item_col2:
                     status = st.selectbox(
                         "",
-                        ["✅ OK", "⚠️ Minor", "❌ Major", "N/A"],
+                        ("✅ OK", "⚠️ Minor", "❌ Major", "N/A"),
                         key=f"check_{section}_{item}"[:50]
                     )
                     if status in ["⚠️ Minor", "❌ Major"]:
@@ -7835,7 +7814,7 @@ def render_new_ramp_inspection():
         
         overall_rating = st.select_slider(
             "Overall Compliance",
-            options=["Non-Compliant", "Needs Improvement", "Satisfactory", "Good", "Excellent"]
+            options=("Non-Compliant", "Needs Improvement", "Satisfactory", "Good", "Excellent")
         )
         
         immediate_action = st.checkbox("Immediate action required")
@@ -7865,8 +7844,10 @@ def render_new_ramp_inspection():
             
             st.session_state['ramp_inspections'].append(inspection_data)
             
+            _release_form_ref("RAMP")
             st.success("✅ Ramp inspection submitted successfully!")
-            st.balloons()
+            if st.session_state.get('enable_animations', False):
+                st.balloons()
 
 
 def render_ramp_inspection_list():
@@ -8009,8 +7990,8 @@ def render_audit_findings():
             with act_col1:
                 new_status = st.selectbox(
                     "Update Status",
-                    ["Open", "In Progress", "Closed"],
-                    index=["Open", "In Progress", "Closed"].index(finding['status']),
+                    FINDING_STATUSES,
+                    index=_FINDING_STATUS_INDEX.get(finding['status'], 0),
                     key=f"status_{finding['id']}"
                 )
             with act_col2:
@@ -8043,8 +8024,8 @@ def render_moc_workflow():
             change_title = st.text_input("Change Title")
             change_type = st.selectbox(
                 "Change Type",
-                ["Operational Procedure", "Equipment/System", "Organization", 
-                 "Regulatory Compliance", "Training Program", "Route/Destination"]
+                ("Operational Procedure", "Equipment/System", "Organization", 
+                 "Regulatory Compliance", "Training Program", "Route/Destination")
             )
             
             description = st.text_area("Change Description", height=150)
@@ -8057,8 +8038,8 @@ def render_moc_workflow():
             with risk_col1:
                 likelihood = st.slider("Risk Likelihood", 1, 5, 3)
             with risk_col2:
-                severity = st.selectbox("Risk Severity", ["A - Catastrophic", "B - Hazardous", 
-                                                         "C - Major", "D - Minor", "E - Negligible"])
+                severity = st.selectbox("Risk Severity", ("A - Catastrophic", "B - Hazardous", 
+                                                         "C - Major", "D - Minor", "E - Negligible"))
             
             mitigations = st.text_area("Proposed Risk Mitigations", height=100)
             
@@ -8066,15 +8047,15 @@ def render_moc_workflow():
             st.markdown("#### Approval Chain")
             dept_approval = st.multiselect(
                 "Departments Required",
-                ["Safety", "Flight Operations", "Maintenance", "Quality", 
-                 "Compliance", "Training", "Security"]
+                ("Safety", "Flight Operations", "Maintenance", "Quality", 
+                 "Compliance", "Training", "Security")
             )
             
             submitted = st.form_submit_button("Submit Change Request", use_container_width=True)
             
             if submitted and change_title:
                 moc_data = {
-                    'id': f"MOC-{datetime.now().strftime('%Y%m%d')}-{random.randint(100,999)}",
+                    'id': _new_ref("MOC"),
                     'title': change_title,
                     'type': change_type,
                     'description': description,
@@ -8221,14 +8202,14 @@ def render_data_management():
         
         export_type = st.multiselect(
             "Select Data to Export",
-            ["Bird Strike Reports", "Laser Strike Reports", "TCAS Reports",
+            ("Bird Strike Reports", "Laser Strike Reports", "TCAS Reports",
              "Aircraft Incidents", "Hazard Reports", "FSR Reports", "Captain Debriefs",
-             "Ramp Inspections", "Audit Findings"]
+             "Ramp Inspections", "Audit Findings")
         )
         
         export_format = st.selectbox(
             "Export Format",
-            ["CSV", "Excel (XLSX)", "JSON", "PDF Report"]
+            ("CSV", "Excel (XLSX)", "JSON", "PDF Report")
         )
         
         date_range = st.date_input(
@@ -8476,7 +8457,7 @@ def render_settings():
         col1, col2 = st.columns(2)
         with col1:
             st.text_input("Company Name", value=settings.get('company_name', 'Air Sial'))
-            st.selectbox("Timezone", ["Asia/Karachi (PKT)", "UTC"], index=0)
+            st.selectbox("Timezone", ("Asia/Karachi (PKT)", "UTC"), index=0)
         with col2:
             st.text_input("ICAO Code", value=settings.get('company_code', 'PF'))
             st.checkbox("Enable Email Notifications", value=True)
@@ -8519,13 +8500,14 @@ def load_data_from_supabase():
     for table in tables:
         try:
             # Fetch data
-            response = supabase.table(table).select("*").execute()
+            response = execute_with_reconnect(lambda db: db.table(table).select("*").execute())
             # Store in Session State
             st.session_state[table] = response.data
         except Exception as e:
             # Ensure key exists even if fetch fails
             if table not in st.session_state:
                 st.session_state[table] = []
+    bump_reports_version()
 
 def initialize_session_state():
     """
@@ -8617,7 +8599,7 @@ def render_login_page():
             new_pass = st.text_input("Password", type="password")
             new_dept = st.selectbox("Department", DEPARTMENTS)
             # Users can request a role, but Admin must approve it
-            req_role = st.selectbox("Requested Role", ["Reporter", "Analyst", "Safety Head"])
+            req_role = st.selectbox("Requested Role", ("Reporter", "Analyst", "Safety Head"))
             
             reg_submit = st.form_submit_button("Request Access")
             
@@ -8719,6 +8701,19 @@ def render_sidebar():
             # ADDED HERE:
             if st.button("🤖 AI Assistant"): st.session_state['current_page'] = 'AI Assistant'
 
+        # 6. Diagnostics (admins only)
+        if st.session_state.get('user_role') == 'Admin':
+            with st.expander("🔧 Diagnostics"):
+                st.caption(f"reports_version: {get_reports_version()}")
+                st.caption(f"memoised stats: {', '.join(st.session_state.get('_report_stats_memo', {})) or 'none'}")
+
+        # 7. Display preferences
+        st.markdown("---")
+        st.toggle("🎉 Submit animations", key="enable_animations",
+                  help="Show balloons after a report is submitted. Off by default; the animation is slow on low-end devices.")
+        st.toggle("🎬 OCR demo progress", key="demo_animation",
+                  help="Step through the OCR stages with a progress bar, for presentations. Off by default.")
+
 if st.session_state.get('user_role') == 'Admin':
         st.markdown("---")
         st.markdown("### 🛡️ Administration")
@@ -1,7 +1,9 @@
 # weather.py
-import requests
+import numpy as np
+import pandas as pd
 import streamlit as st
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 # 1. Define Airports
 AIRPORT_COORDS = {
@@ -12,16 +14,29 @@ AIRPORT_COORDS = {
     "OMDB": {"lat": 25.2532, "lon": 55.3657, "name": "Dubai"},
 }
 
-def get_weather_for_airport(icao_code):
-    """
-    Fetches real-time weather. Returns None if API fails.
-    """
+@st.cache_resource
+def get_http_session():
+    """One pooled HTTPS session so repeat OpenWeatherMap calls reuse the TLS connection"""
+    import requests  # deferred: only needed when a weather API key is configured
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=5))
+    return session
+
+def _read_weather_api_key():
+    try:
+        return st.secrets.get("OPENWEATHER_API_KEY") or st.secrets.get("WEATHER_API_KEY") or None
+    except Exception:
+        return None  # no secrets.toml at all
+
+# Secrets are fixed for the life of the process, so resolve the key once
+WEATHER_API_KEY = _read_weather_api_key()
+
+def _fetch_weather(icao_code, api_key, session):
+    """One OpenWeatherMap call; plain arguments only so it is safe to run on a worker thread"""
     airport = AIRPORT_COORDS.get(icao_code)
     if not airport: return None
 
-    # Get API Key from Secrets
-    api_key = st.secrets.get("OPENWEATHER_API_KEY") or st.secrets.get("WEATHER_API_KEY")
-    
     if not api_key:
         print(f"⚠️ Weather: No API Key found for {icao_code}")
         return None
@@ -29,7 +44,7 @@ def get_weather_for_airport(icao_code):
     url = f"https://api.openweathermap.org/data/2.5/weather?lat={airport['lat']}&lon={airport['lon']}&units=metric&appid={api_key}"
     
     try:
-        response = requests.get(url, timeout=2) # Short timeout to prevent lag
+        response = session.get(url, timeout=2) # Short timeout to prevent lag
         if response.status_code == 200:
             data = response.json()
             icon_code = data['weather'][0]['icon'][:2]
@@ -50,6 +65,14 @@ def get_weather_for_airport(icao_code):
     
     return None
 
+def get_weather_for_airport(icao_code):
+    """
+    Fetches real-time weather. Returns None if API fails.
+    """
+    if not WEATHER_API_KEY:
+        return None
+    return _fetch_weather(icao_code, WEATHER_API_KEY, get_http_session())
+
 def get_mock_data(icao_code):
     """Fallback data so the UI never breaks"""
     airport = AIRPORT_COORDS.get(icao_code)
@@ -65,16 +88,27 @@ def get_mock_data(icao_code):
 def get_all_weather():
     """Returns weather data (Real or Fallback)"""
     priority_hubs = ["OPSK", "OPKC", "OPLA", "OPIS", "OMDB"]
-    results = []
+    if not WEATHER_API_KEY:
+        # No key configured (demo deployments): skip the network path entirely
+        return [get_mock_data(icao) for icao in priority_hubs]
+    api_key, session = WEATHER_API_KEY, get_http_session()
     
-    for icao in priority_hubs:
-        # 1. Try Real API
-        data = get_weather_for_airport(icao)
+    # 1. Try Real API - all hubs at once, so a cold cache costs one round trip, not five
+    with ThreadPoolExecutor(max_workers=len(priority_hubs)) as pool:
+        live = pool.map(lambda icao: _fetch_weather(icao, api_key, session), priority_hubs)
         
         # 2. Use Mock Data if Real Failed
-        if not data:
-            data = get_mock_data(icao)
-            
-        results.append(data)
-            
-    return results
+        return [data or get_mock_data(icao) for icao, data in zip(priority_hubs, live)]
+
+@st.cache_data(ttl=600)
+def get_weather_frame():
+    """Returns the hub weather as one typed DataFrame (one row per airport)"""
+    rows = get_all_weather()
+    return pd.DataFrame({
+        "name": [r["name"] for r in rows],
+        "temp": np.array([r["temp"] for r in rows], dtype=np.float32),
+        "wind": np.array([r["wind"] for r in rows], dtype=np.uint8),
+        "condition": pd.Categorical([r["condition"] for r in rows]),
+        "icon": [r["icon"] for r in rows],
+        "source": pd.Categorical([r["source"] for r in rows]),
+    })